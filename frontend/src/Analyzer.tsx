@@ -150,6 +150,14 @@ interface AgentResult {
   findings: string[]
 }
 
+interface SessionStatus {
+  status: string
+  progress: number
+  current_agent: string | null
+  results: AnalysisResults | null
+  error: string | null
+}
+
 function Analyzer() {
   const API_URL = import.meta.env.VITE_API_URL || ''
   const [nodes, setNodes, onNodesChange] = useNodesState(createInitialNodes())
@@ -367,53 +375,94 @@ function Analyzer() {
     return results
   }
 
-  // Poll for status
+  // Follow status over Server-Sent Events, polling if the stream fails
   useEffect(() => {
     if (!sessionId || stage !== 'processing') return
     let lastAgent = ''
+    let events: EventSource | null = null
+    let interval: ReturnType<typeof setInterval> | undefined
+
+    const stop = () => {
+      events?.close()
+      events = null
+      clearInterval(interval)
+      interval = undefined
+    }
+
+    // The server no longer has the session (deleted or expired)
+    const expire = () => {
+      stop()
+      const msg = 'Session expired or was deleted. Please upload the files again.'
+      setError(msg)
+      addLog('error', msg, 'error')
+    }
 
-    const interval = setInterval(async () => {
-      try {
-        const res = await fetch(`${API_URL}/api/status/${sessionId}`)
-        const data = await res.json()
-        setProgress(data.progress || 0)
-
-        if (data.current_agent) {
-          const agentId = mapAgentName(data.current_agent)
-          if (agentId !== lastAgent) {
-            if (lastAgent) {
-              updateNodeStatus(lastAgent, 'success')
-              updateEdgeActive(lastAgent, false)
-              addLog(lastAgent, '✓ Complete', 'success')
-            }
-            updateNodeStatus(agentId, 'running')
-            updateEdgeActive(agentId, true)
-            addLog(agentId, 'Processing...', 'info')
-            lastAgent = agentId
+    const handleStatus = (data: SessionStatus) => {
+      setProgress(data.progress || 0)
+
+      if (data.current_agent) {
+        const agentId = mapAgentName(data.current_agent)
+        if (agentId !== lastAgent) {
+          if (lastAgent) {
+            updateNodeStatus(lastAgent, 'success')
+            updateEdgeActive(lastAgent, false)
+            addLog(lastAgent, '✓ Complete', 'success')
           }
+          updateNodeStatus(agentId, 'running')
+          updateEdgeActive(agentId, true)
+          addLog(agentId, 'Processing...', 'info')
+          lastAgent = agentId
         }
+      }
 
-        if (data.status === 'completed') {
-          clearInterval(interval)
-          createInitialNodes().forEach(n => updateNodeStatus(n.id, 'success'))
-          createInitialEdges().forEach(e => updateEdgeActive(e.target, false))
-          addLog('system', '✓ Analysis complete', 'success')
-          setResults(data.results)
-          setAgentResults(buildAgentResults(data.results))
-          setTimeout(() => setStage('results'), 800)
-        }
+      if (data.status === 'completed') {
+        stop()
+        createInitialNodes().forEach(n => updateNodeStatus(n.id, 'success'))
+        createInitialEdges().forEach(e => updateEdgeActive(e.target, false))
+        addLog('system', '✓ Analysis complete', 'success')
+        setResults(data.results)
+        setAgentResults(buildAgentResults(data.results as AnalysisResults))
+        setTimeout(() => setStage('results'), 800)
+      }
 
-        if (data.status === 'error') {
-          clearInterval(interval)
-          setError(data.error)
-          addLog('error', data.error, 'error')
+      if (data.status === 'error') {
+        stop()
+        setError(data.error)
+        addLog('error', data.error ?? 'Analysis failed', 'error')
+      }
+    }
+
+    const poll = () => {
+      interval = setInterval(async () => {
+        try {
+          const res = await fetch(`${API_URL}/api/status/${sessionId}`)
+          // Stopped while the request was in flight
+          if (interval === undefined) return
+          if (res.status === 404) {
+            expire()
+            return
+          }
+          if (!res.ok) return
+          handleStatus(await res.json())
+        } catch (err) {
+          console.error(err)
         }
-      } catch (err) {
-        console.error(err)
+      }, 800)
+    }
+
+    if (typeof EventSource === 'undefined') {
+      poll()
+    } else {
+      events = new EventSource(`${API_URL}/api/events/${sessionId}`)
+      events.onmessage = e => handleStatus(JSON.parse(e.data))
+      events.addEventListener('expired', expire)
+      events.onerror = () => {
+        stop()
+        poll()
       }
-    }, 800)
+    }
 
-    return () => clearInterval(interval)
+    return stop
   }, [sessionId, stage, addLog, updateNodeStatus, updateEdgeActive])
 
   const handleUpload = async () => {
@@ -5,6 +5,14 @@ A system to help researchers detect weaknesses, inconsistencies, and risks
 in research papers before submission, using Google ADK agents.
 """
 
-from . import agent
+import importlib
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name):
+    # Build the agent pipeline on first access only, so importing the
+    # parsing tools does not pull in google.adk and construct every agent.
+    if name == "agent":
+        return importlib.import_module(".agent", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,43 +2,33 @@
 Root Agent - Research Verification Pipeline
 
 This module defines the root agent that orchestrates all sub-agents
-using ADK's SequentialAgent workflow.
+using ADK's SequentialAgent and ParallelAgent workflows.
 
-The pipeline runs the following agents in sequence:
-1. PaperParserAgent - Parse paper and extract claims
-2. ReproducibilityAgent - Check reproducibility info (parallel with parser)
-3. ExperimentEvidenceAgent - Map results to evidence
-4. StatisticalAuditorAgent - Audit statistical validity
-5. RelatedWorkBaselineAgent - Check citations and baselines
-6. ReviewerSimulationAgent - Generate reviewer comments
-7. VerdictAgent - Produce final verdict
+The pipeline runs the following stages:
+1. InitialAnalysis (parallel):
+   - PaperParserAgent - Parse paper and extract claims
+   - ReproducibilityAgent - Check reproducibility info
+2. Stage2 (parallel):
+   - EvidenceAndStatistics (sequential):
+     - ExperimentEvidenceAgent - Map results to evidence
+     - StatisticalAuditorAgent - Audit statistical validity
+   - RelatedWorkBaselineAgent - Check citations and baselines
+3. ReviewerSimulationAgent - Generate reviewer comments
+4. VerdictAgent - Produce final verdict
 """
 
 from google.adk.agents import Agent, SequentialAgent, ParallelAgent
 
-from .agents.paper_parser import paper_parser_agent
-from .agents.experiment_evidence import experiment_evidence_agent
-from .agents.statistical_auditor import statistical_auditor_agent
-from .agents.related_work import related_work_agent
-from .agents.reviewer_simulation import reviewer_simulation_agent
-from .agents.reproducibility import reproducibility_agent
-from .agents.verdict import verdict_agent
+from .agents.paper_parser import get_paper_parser_agent
+from .agents.experiment_evidence import get_experiment_evidence_agent
+from .agents.statistical_auditor import get_statistical_auditor_agent
+from .agents.related_work import get_related_work_agent
+from .agents.reviewer_simulation import get_reviewer_simulation_agent
+from .agents.reproducibility import get_reproducibility_agent
+from .agents.verdict import get_verdict_agent
 
 
-# Create the orchestration workflow
-# Using SequentialAgent to ensure proper data flow between agents
-
-# The full pipeline runs agents in sequence:
-# 1. Parse paper first (foundation for all other analysis)
-# 2. Then run experiment evidence and reproducibility (can be parallelized in future)
-# 3. Statistical audit (needs experiment evidence)
-# 4. Related work analysis (needs paper analysis)
-# 5. Reviewer simulation (needs all previous)
-# 6. Final verdict (aggregates everything)
-
-root_agent = SequentialAgent(
-    name="ResearchVerificationPipeline",
-    description="""A multi-agent system for research paper verification and analysis.
+PIPELINE_DESCRIPTION = """A multi-agent system for research paper verification and analysis.
     
 This pipeline helps researchers detect weaknesses, inconsistencies, and risks
 in their research papers before submission. It runs 7 specialized agents:
@@ -53,46 +43,70 @@ in their research papers before submission. It runs 7 specialized agents:
 
 To use: Provide paths to your paper (PDF/LaTeX/txt), experiment logs, 
 scripts, and BibTeX file. The system will analyze and provide actionable feedback.
-""",
-    sub_agents=[
-        paper_parser_agent,
-        reproducibility_agent,
-        experiment_evidence_agent,
-        statistical_auditor_agent,
-        related_work_agent,
-        reviewer_simulation_agent,
-        verdict_agent,
-    ]
-)
+"""
 
 
-# Alternative: More granular pipeline with parallel initial analysis
 def create_parallel_pipeline():
     """
-    Create an alternative pipeline with parallel initial analysis.
+    Create the verification pipeline with parallel analysis stages.
     
-    This version runs paper parsing and reproducibility check in parallel
-    for faster execution.
+    Reproducibility only reads the raw scripts/logs, so it runs alongside
+    the paper parser. The agents that only depend on the parsed paper
+    (experiment evidence, related work) then run concurrently, and the
+    statistical audit follows experiment evidence inside its branch instead
+    of waiting for related work as well. Each child writes its own
+    output_key into the shared session state, so later stages see both
+    `paper_analysis` and `reproducibility_analysis`.
+    
+    Note: ADK agents can only have a single parent, so this should be
+    called once per set of agent instances (see ``root_agent`` below).
     """
-    # Stage 1: Parallel initial analysis
+    # Stage 1: Paper parsing and reproducibility have no shared inputs
     initial_analysis = ParallelAgent(
         name="InitialAnalysis",
         description="Parallel analysis of paper content and reproducibility",
-        sub_agents=[paper_parser_agent, reproducibility_agent]
+        sub_agents=[get_paper_parser_agent(), get_reproducibility_agent()]
     )
     
-    # Full pipeline with parallel first stage
+    # Stage 2: Independent analyses that only need `paper_analysis`. The
+    # statistical audit needs `experiment_evidence`, not related work, so it
+    # runs right after experiment evidence in the same branch
+    evidence_and_statistics = SequentialAgent(
+        name="EvidenceAndStatistics",
+        description="Experiment evidence mapping followed by the statistical audit",
+        sub_agents=[
+            get_experiment_evidence_agent(),
+            get_statistical_auditor_agent(),
+        ]
+    )
+    stage2 = ParallelAgent(
+        name="Stage2",
+        description="Parallel experiment evidence, statistical audit and related work analysis",
+        sub_agents=[
+            evidence_and_statistics,
+            get_related_work_agent(),
+        ]
+    )
+    
+    # Full pipeline with parallel analysis stages
     parallel_root = SequentialAgent(
-        name="ResearchVerificationPipelineParallel",
-        description="Research verification with parallel initial analysis",
+        name="ResearchVerificationPipeline",
+        description=PIPELINE_DESCRIPTION,
         sub_agents=[
             initial_analysis,
-            experiment_evidence_agent,
-            statistical_auditor_agent,
-            related_work_agent,
-            reviewer_simulation_agent,
-            verdict_agent,
+            stage2,
+            get_reviewer_simulation_agent(),
+            get_verdict_agent(),
         ]
     )
     
     return parallel_root
+
+
+# Create the orchestration workflow
+# 1. Parse paper and check reproducibility in parallel
+# 2. Experiment evidence -> statistical audit, in parallel with related work
+#    (all need paper analysis; the audit also needs experiment evidence)
+# 3. Reviewer simulation (needs all previous)
+# 4. Final verdict (aggregates everything)
+root_agent = create_parallel_pipeline()
@@ -1,19 +1,32 @@
 """Individual agent implementations for the research verification system."""
 
-from .paper_parser import paper_parser_agent
-from .experiment_evidence import experiment_evidence_agent
-from .statistical_auditor import statistical_auditor_agent
-from .related_work import related_work_agent
-from .reviewer_simulation import reviewer_simulation_agent
-from .reproducibility import reproducibility_agent
-from .verdict import verdict_agent
+import importlib
 
-__all__ = [
-    "paper_parser_agent",
-    "experiment_evidence_agent",
-    "statistical_auditor_agent",
-    "related_work_agent",
-    "reviewer_simulation_agent",
-    "reproducibility_agent",
-    "verdict_agent",
-]
+# Agent name -> defining submodule; agents are only constructed when first
+# accessed (PEP 562), so importing one agent module does not build them all.
+_AGENT_MODULES = {
+    "paper_parser_agent": ".paper_parser",
+    "experiment_evidence_agent": ".experiment_evidence",
+    "statistical_auditor_agent": ".statistical_auditor",
+    "related_work_agent": ".related_work",
+    "reviewer_simulation_agent": ".reviewer_simulation",
+    "reproducibility_agent": ".reproducibility",
+    "verdict_agent": ".verdict",
+}
+# Cached factories: get_<name>() builds the agent once and then reuses it
+_AGENT_MODULES.update({
+    f"get_{name}": module for name, module in list(_AGENT_MODULES.items())
+})
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name):
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
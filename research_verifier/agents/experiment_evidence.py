@@ -7,15 +7,142 @@ Responsibility:
 - Identify untraceable results
 """
 
+import functools
 import os
+import re
 import json
+from collections import defaultdict
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
 from ..tools.log_analyzer import (
     analyze_training_logs,
     extract_metrics_from_log,
 )
+from ..utils.helpers import map_in_threads
+
+
+# Per-file analysis is I/O bound, so a small thread pool overlaps reads
+_MAX_WORKERS = 8
+
+# Keyword presence checks only need the head of a script; caps memory use
+_MAX_SCRIPT_BYTES = 2_000_000
+
+# Script keyword categories, matched in one pass over the raw bytes (the
+# keywords are ASCII, so no decoding is needed). The lookahead makes every
+# position a candidate so overlapping keywords (e.g. "testrain") still count.
+_SCRIPT_KEYWORDS_RE = re.compile(
+    rb'(?=(?P<training>(?i:train|epoch|optimizer))'
+    rb'|(?P<evaluation>(?i:eval|test|valid))'
+    rb'|(?P<logging>print\(|logging\.|writer\.|wandb\.))'
+)
+_TRAINING_BIT = 1
+_EVALUATION_BIT = 2
+_LOGGING_BIT = 4
+_SCRIPT_KEYWORD_BITS = {
+    "training": _TRAINING_BIT,
+    "evaluation": _EVALUATION_BIT,
+    "logging": _LOGGING_BIT,
+}
+_ALL_SCRIPT_BITS = _TRAINING_BIT | _EVALUATION_BIT | _LOGGING_BIT
+
+
+def _scan_script_keywords(content: bytes) -> int:
+    """Return a bitmask of the keyword categories present in a script."""
+    mask = 0
+    for match in _SCRIPT_KEYWORDS_RE.finditer(content):
+        mask |= _SCRIPT_KEYWORD_BITS[match.lastgroup]
+        if mask == _ALL_SCRIPT_BITS:
+            break
+    return mask
+
+
+def _analyze_one_log(log_path: str) -> Dict:
+    """Analyze a single log file. Runs in a worker thread."""
+    # Missing files are filtered out by _map_files; analyze_training_logs
+    # still reports any that disappear in between
+    log_analysis = analyze_training_logs(log_path)
+    
+    if log_analysis["status"] != "success":
+        return {"issue": f"Failed to analyze {log_path}: {log_analysis.get('error_message')}"}
+    
+    return {
+        "entry": {
+            "path": log_path,
+            "metrics": log_analysis.get("metrics", {}),
+            "issues": log_analysis.get("issues", [])
+        },
+        "metrics": extract_metrics_from_log(log_path),
+    }
+
+
+def _analyze_one_script(script_path: str) -> Dict:
+    """Analyze a single script file. Runs in a worker thread."""
+    try:
+        with open(script_path, 'rb') as f:
+            content = f.read(_MAX_SCRIPT_BYTES)
+    except FileNotFoundError:
+        return {"issue": f"Script not found: {script_path}"}
+    except OSError as e:
+        return {"issue": f"Failed to analyze script {script_path}: {str(e)}"}
+    
+    mask = _scan_script_keywords(content)
+    return {
+        "entry": {
+            "path": script_path,
+            "has_training_loop": bool(mask & _TRAINING_BIT),
+            "has_evaluation": bool(mask & _EVALUATION_BIT),
+            "has_logging": bool(mask & _LOGGING_BIT),
+        }
+    }
+
+
+def _existing_paths(paths: List[str]) -> set:
+    """
+    Return the subset of ``paths`` that exist, listing each parent directory once.
+    
+    A name listed exactly as given exists. Any other path (a different case
+    on a case-insensitive filesystem, a trailing slash, a symlink that may
+    dangle) is checked with os.path.exists, as it was before the listing.
+    """
+    by_dir = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path)].append(path)
+    
+    existing = set()
+    for directory, group in by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                names = {entry.name for entry in entries if not entry.is_symlink()}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError:
+            # Can't list the directory; let the worker report per file
+            existing.update(group)
+            continue
+        existing.update(
+            p for p in group
+            if os.path.basename(p) in names or os.path.exists(p)
+        )
+    
+    return existing
+
+
+def _map_files(worker, paths: List[str], missing_issue: str) -> List[Dict]:
+    """
+    Run ``worker`` over the existing ``paths`` on a thread pool.
+    
+    Results come back in input order; a missing path yields
+    ``{"issue": missing_issue.format(path)}`` without reaching the worker.
+    """
+    existing = _existing_paths(paths)
+    found = [p for p in paths if p in existing]
+    
+    results = iter(map_in_threads(worker, found, _MAX_WORKERS))
+    
+    return [
+        next(results) if p in existing else {"issue": missing_issue.format(p)}
+        for p in paths
+    ]
 
 
 def analyze_experiment_logs(log_paths_csv: str = "") -> Dict:
@@ -42,26 +169,18 @@ def analyze_experiment_logs(log_paths_csv: str = "") -> Dict:
         result["issues"].append("No log paths provided")
         return result
     
-    # Analyze log files
-    for log_path in log_paths:
-        if os.path.exists(log_path):
-            log_analysis = analyze_training_logs(log_path)
-            
-            if log_analysis["status"] == "success":
-                result["logs_analyzed"].append({
-                    "path": log_path,
-                    "metrics": log_analysis.get("metrics", {}),
-                    "issues": log_analysis.get("issues", [])
-                })
-                
-                # Extract key metrics
-                metrics = extract_metrics_from_log(log_path)
-                for key, value in metrics.items():
-                    result["extracted_metrics"][f"{os.path.basename(log_path)}:{key}"] = value
-            else:
-                result["issues"].append(f"Failed to analyze {log_path}: {log_analysis.get('error_message')}")
-        else:
-            result["issues"].append(f"Log file not found: {log_path}")
+    # Analyze log files concurrently, then aggregate in input order
+    log_results = _map_files(_analyze_one_log, log_paths, "Log file not found: {}")
+    for log_path, log_result in zip(log_paths, log_results):
+        if "issue" in log_result:
+            result["issues"].append(log_result["issue"])
+            continue
+        
+        result["logs_analyzed"].append(log_result["entry"])
+        
+        # Extract key metrics
+        for key, value in log_result["metrics"].items():
+            result["extracted_metrics"][f"{os.path.basename(log_path)}:{key}"] = value
     
     return result
 
@@ -89,32 +208,16 @@ def analyze_experiment_scripts(script_paths_csv: str = "") -> Dict:
         result["issues"].append("No script paths provided")
         return result
     
-    for script_path in script_paths:
-        if os.path.exists(script_path):
-            try:
-                with open(script_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                
-                result["scripts_analyzed"].append({
-                    "path": script_path,
-                    "has_training_loop": any(kw in content.lower() for kw in ['train', 'epoch', 'optimizer']),
-                    "has_evaluation": any(kw in content.lower() for kw in ['eval', 'test', 'valid']),
-                    "has_logging": any(kw in content for kw in ['print(', 'logging.', 'writer.', 'wandb.']),
-                })
-            except Exception as e:
-                result["issues"].append(f"Failed to analyze script {script_path}: {str(e)}")
+    for script_result in _map_files(_analyze_one_script, script_paths, "Script not found: {}"):
+        if "issue" in script_result:
+            result["issues"].append(script_result["issue"])
         else:
-            result["issues"].append(f"Script not found: {script_path}")
+            result["scripts_analyzed"].append(script_result["entry"])
     
     return result
 
 
-# Define the ExperimentEvidenceAgent
-experiment_evidence_agent = Agent(
-    name="ExperimentEvidenceAgent",
-    model="gemini-2.0-flash",
-    description="Maps paper results to experimental evidence and identifies untraceable claims.",
-    instruction="""You are an Experiment Evidence Agent. Your task is to verify that reported results in a research paper can be traced back to actual experimental evidence.
+_EXPERIMENT_EVIDENCE_INSTRUCTION = """You are an Experiment Evidence Agent. Your task is to verify that reported results in a research paper can be traced back to actual experimental evidence.
 
 You will receive:
 1. **Paper Analysis** (from PaperParserAgent via state key `paper_analysis`): Contains claims, reported results, datasets, and metrics
@@ -165,7 +268,26 @@ Look for paper analysis from PaperParserAgent in the conversation history.
 }
 ```
 
-Use the analyze_experiment_logs tool with comma-separated file paths to analyze logs. Be thorough in checking each claimed result.""",
-    tools=[analyze_experiment_logs, analyze_experiment_scripts],
-    output_key="experiment_evidence"
-)
+Use the analyze_experiment_logs tool with comma-separated file paths to analyze logs. Be thorough in checking each claimed result."""
+
+
+@functools.cache
+def get_experiment_evidence_agent():
+    """Build the ExperimentEvidenceAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="ExperimentEvidenceAgent",
+        model="gemini-2.0-flash",
+        description="Maps paper results to experimental evidence and identifies untraceable claims.",
+        instruction=_EXPERIMENT_EVIDENCE_INSTRUCTION,
+        tools=[analyze_experiment_logs, analyze_experiment_scripts],
+        output_key="experiment_evidence"
+    )
+
+
+def __getattr__(name):
+    # ``experiment_evidence_agent`` stays importable, but is only built when first accessed
+    if name == "experiment_evidence_agent":
+        return get_experiment_evidence_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
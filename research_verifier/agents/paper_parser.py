@@ -8,15 +8,55 @@ Responsibility:
 - Extract reported results and their locations
 """
 
+import functools
 import os
+import re
 import json
+from itertools import islice
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
-from ..tools.pdf_parser import parse_pdf, extract_text_from_pdf
 from ..tools.latex_parser import parse_latex
+from .related_work import scan_related_work
+from ..cache import disk_memoize, memory_memoize
 
+# Bump when parsing/analysis output changes to invalidate cached results
+ANALYZER_VERSION = "v9"
 
+# Plain-text papers are read up to this many bytes. Downstream only sends
+# the first 50 000 characters to the LLM, so this leaves headroom for analysis.
+_MAX_PAPER_BYTES = 200_000
+
+# Section keywords (substring match, case-insensitive) and the flags they set
+_SECTION_RE = re.compile(r'abstract|experiment|evaluation|results?', re.IGNORECASE)
+_HAS_ABSTRACT = 1
+_HAS_EXPERIMENTS = 2
+_HAS_RESULTS = 4
+_SECTION_BITS = {
+    "abstract": _HAS_ABSTRACT,
+    "experiment": _HAS_EXPERIMENTS,
+    "evaluation": _HAS_EXPERIMENTS,
+    "results": _HAS_EXPERIMENTS | _HAS_RESULTS,
+    "result": _HAS_RESULTS,
+}
+_ALL_SECTIONS = _HAS_ABSTRACT | _HAS_EXPERIMENTS | _HAS_RESULTS
+
+_TABLE_RE = re.compile(r'table\s+(\d+)', re.IGNORECASE)
+_FIGURE_RE = re.compile(r'figure\s+(\d+)', re.IGNORECASE)
+
+# Common dataset names
+_DATASET_REGEXES = (
+    re.compile(r'\b(imagenet|cifar|mnist|coco|squad|glue|wmt|penn.?treebank|imdb|yelp|amazon.?reviews)\b', re.IGNORECASE),
+    re.compile(r'\b(\w+(?:net|bench|dataset|corpus|100|1000|10k|1m))\b', re.IGNORECASE),
+)
+
+# Common metrics
+_METRIC_REGEXES = (
+    re.compile(r'\b(accuracy|precision|recall|f1.?score|auc|roc|bleu|rouge|perplexity|mse|rmse|mae|loss)\b', re.IGNORECASE),
+    re.compile(r'\b(top.?\d+|map|mrr|ndcg|hit.?rate)\b', re.IGNORECASE),
+)
+
+
+@disk_memoize(version=ANALYZER_VERSION)
 def parse_paper_file(file_path: str) -> Dict:
     """
     Parse a paper file (PDF or LaTeX) and extract text content.
@@ -42,14 +82,20 @@ def parse_paper_file(file_path: str) -> Dict:
     ext = os.path.splitext(file_path)[1].lower()
     
     if ext == '.pdf':
+        # Deferred: only needed when a PDF is actually passed
+        from ..tools.pdf_parser import parse_pdf
         return parse_pdf(file_path)
     elif ext in ['.tex', '.latex']:
         return parse_latex(file_path)
     elif ext in ['.txt', '.md']:
         # Plain text file
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            with open(file_path, 'rb') as f:
+                raw = f.read(_MAX_PAPER_BYTES)
+            content = raw.decode('utf-8', errors='ignore')
+            if '\r' in content:
+                # Match text-mode universal newline handling
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
             return {
                 "status": "success",
                 "full_text": content,
@@ -68,6 +114,14 @@ def parse_paper_file(file_path: str) -> Dict:
         }
 
 
+def _first_unique(patterns, text: str, limit: int) -> List[str]:
+    """Return up to ``limit`` distinct lowercased matches of ``patterns``."""
+    matches = (m.lower() for pattern in patterns for m in pattern.findall(text))
+    return list(islice(dict.fromkeys(matches), limit))
+
+
+@memory_memoize()
+@disk_memoize(version=ANALYZER_VERSION)
 def analyze_paper_content(paper_text: str) -> Dict:
     """
     Analyze paper text to extract claims, results, datasets, and metrics.
@@ -81,8 +135,6 @@ def analyze_paper_content(paper_text: str) -> Dict:
     Returns:
         Dictionary with preliminary extraction results
     """
-    import re
-    
     result = {
         "text_length": len(paper_text),
         "has_abstract": False,
@@ -94,56 +146,57 @@ def analyze_paper_content(paper_text: str) -> Dict:
         "metric_mentions": [],
     }
     
-    text_lower = paper_text.lower()
+    # Check for common sections in a single pass
+    found = 0
+    for match in _SECTION_RE.finditer(paper_text):
+        found |= _SECTION_BITS[match.group(0).lower()]
+        if found == _ALL_SECTIONS:
+            break
     
-    # Check for common sections
-    result["has_abstract"] = "abstract" in text_lower
-    result["has_experiments"] = any(kw in text_lower for kw in ["experiment", "evaluation", "results"])
-    result["has_results"] = "result" in text_lower
+    result["has_abstract"] = bool(found & _HAS_ABSTRACT)
+    result["has_experiments"] = bool(found & _HAS_EXPERIMENTS)
+    result["has_results"] = bool(found & _HAS_RESULTS)
     
     # Find table and figure references
-    result["table_references"] = list(set(re.findall(r'table\s+(\d+)', text_lower)))
-    result["figure_references"] = list(set(re.findall(r'figure\s+(\d+)', text_lower)))
-    
-    # Common dataset names
-    dataset_patterns = [
-        r'\b(imagenet|cifar|mnist|coco|squad|glue|wmt|penn.?treebank|imdb|yelp|amazon.?reviews)\b',
-        r'\b(\w+(?:net|bench|dataset|corpus|100|1000|10k|1m))\b'
-    ]
-    
-    for pattern in dataset_patterns:
-        matches = re.findall(pattern, text_lower)
-        result["dataset_mentions"].extend(matches)
-    
-    result["dataset_mentions"] = list(set(result["dataset_mentions"]))[:20]
+    result["table_references"] = list(set(_TABLE_RE.findall(paper_text)))
+    result["figure_references"] = list(set(_FIGURE_RE.findall(paper_text)))
     
-    # Common metrics
-    metric_patterns = [
-        r'\b(accuracy|precision|recall|f1.?score|auc|roc|bleu|rouge|perplexity|mse|rmse|mae|loss)\b',
-        r'\b(top.?\d+|map|mrr|ndcg|hit.?rate)\b'
-    ]
+    # Dataset and metric mentions (lowercased so case variants collapse),
+    # deduplicated in first-seen order
+    result["dataset_mentions"] = _first_unique(_DATASET_REGEXES, paper_text, 20)
+    result["metric_mentions"] = _first_unique(_METRIC_REGEXES, paper_text, 20)
     
-    for pattern in metric_patterns:
-        matches = re.findall(pattern, text_lower)
-        result["metric_mentions"].extend(matches)
-    
-    result["metric_mentions"] = list(set(result["metric_mentions"]))[:20]
+    # Shared lexical pre-pass, reused downstream instead of rescanning
+    result["_lexical_cache"] = scan_related_work(paper_text)
     
     return result
 
 
 # Tool function for the agent
-def parse_and_analyze_paper(file_path: str = None, paper_text: str = None) -> Dict:
+@disk_memoize(version=ANALYZER_VERSION)
+def parse_and_analyze_paper(
+    file_path: str = None,
+    paper_text: str = None,
+    mode: str = "full"
+) -> Dict:
     """
     Parse a research paper and perform preliminary analysis.
     
     Args:
         file_path: Path to the paper file (PDF, LaTeX, or text)
         paper_text: Direct paper text (if already extracted)
+        mode: "full" (default) runs the content analysis; "fast" only
+            returns the text, title and abstract, with analysis set to None
         
     Returns:
         Dictionary with parsed content and analysis
     """
+    if mode not in ("full", "fast"):
+        return {
+            "status": "error",
+            "error_message": f"Unknown mode: {mode} (expected 'full' or 'fast')"
+        }
+    
     if paper_text:
         # Use provided text directly
         content = paper_text
@@ -160,8 +213,8 @@ def parse_and_analyze_paper(file_path: str = None, paper_text: str = None) -> Di
             "error_message": "Either file_path or paper_text must be provided"
         }
     
-    # Perform preliminary analysis
-    analysis = analyze_paper_content(content)
+    # Perform preliminary analysis unless the caller only needs the text
+    analysis = analyze_paper_content(content) if mode == "full" else None
     
     return {
         "status": "success",
@@ -172,12 +225,21 @@ def parse_and_analyze_paper(file_path: str = None, paper_text: str = None) -> Di
     }
 
 
-# Define the PaperParserAgent
-paper_parser_agent = Agent(
-    name="PaperParserAgent",
-    model="gemini-2.0-flash",
-    description="Parses research papers and extracts claims, results, datasets, and metrics.",
-    instruction="""You are a Research Paper Parser Agent. Your task is to analyze research papers and extract structured information.
+def read_paper_text(file_path: str = None, paper_text: str = None) -> Dict:
+    """
+    Read a research paper's text, title and abstract without analyzing it.
+    
+    Args:
+        file_path: Path to the paper file (PDF, LaTeX, or text)
+        paper_text: Direct paper text (if already extracted)
+        
+    Returns:
+        Dictionary with parsed content (analysis is None)
+    """
+    return parse_and_analyze_paper(file_path, paper_text, mode="fast")
+
+
+_PAPER_PARSER_INSTRUCTION = """You are a Research Paper Parser Agent. Your task is to analyze research papers and extract structured information.
 
 When given paper content (either as text or file path), you must:
 
@@ -210,12 +272,34 @@ When given paper content (either as text or file path), you must:
   "metrics": ["metric1", "metric2"],
   "baselines": ["baseline1", "baseline2"],
   "paper_title": "Title if found",
-  "abstract": "Abstract if found"
+  "abstract": "Abstract if found",
+  "_lexical_cache": {"has_related_work_section": true, "rw_span": [1200, 4800], "related_work_length": 540, "citations": 32}
 }
 ```
 
+Copy `analysis._lexical_cache` from the tool result into `_lexical_cache` unchanged; later agents reuse it instead of rescanning the paper.
+
 Use the parse_and_analyze_paper tool to read paper files. Always provide structured JSON output.
-Be thorough but focus on the most important elements. If information is missing, note it explicitly.""",
-    tools=[parse_and_analyze_paper],
-    output_key="paper_analysis"
-)
+Be thorough but focus on the most important elements. If information is missing, note it explicitly."""
+
+
+@functools.cache
+def get_paper_parser_agent():
+    """Build the PaperParserAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="PaperParserAgent",
+        model="gemini-2.0-flash",
+        description="Parses research papers and extracts claims, results, datasets, and metrics.",
+        instruction=_PAPER_PARSER_INSTRUCTION,
+        tools=[parse_and_analyze_paper],
+        output_key="paper_analysis"
+    )
+
+
+def __getattr__(name):
+    # ``paper_parser_agent`` stays importable, but is only built when first accessed
+    if name == "paper_parser_agent":
+        return get_paper_parser_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
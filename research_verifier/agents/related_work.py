@@ -7,12 +7,39 @@ Responsibility:
 - Identify weak or incomplete comparisons
 """
 
+import functools
 import os
+import re
 import json
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
 from ..tools.bib_parser import parse_bibtex, get_citation_info, find_standard_baselines
+from ..cache import memory_memoize
+
+# orjson is an optional speedup; its decode errors subclass json.JSONDecodeError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Single-pass scanner for analyze_related_work_coverage:
+# - rw: headers that open the related work block
+# - rw_other: headers that only count as a related work section
+# - cite: numeric or "Name et al." citation markers (case-sensitive)
+_RW_MASTER_RE = re.compile(
+    r'(?P<rw>(?i:related\s+work|background))'
+    r'|(?P<rw_other>(?i:prior\s+work|literature\s+review))'
+    r'|(?P<cite>\[(?:\d+(?:,\s*\d+)*|\w+\s+et\s+al\.)\])'
+)
+
+# Closes the related work block: a methods-style heading word or a numbered
+# section heading. Only searched within _RW_WINDOW chars of the block start.
+_END_SECTION_RE = re.compile(
+    r'\b(?:method|approach|model|experiment)|\n\s*\d+\.\s',
+    re.IGNORECASE
+)
+_RW_WINDOW = 20000
 
 
 def analyze_citations(bibtex_path: str = None) -> Dict:
@@ -40,6 +67,33 @@ def analyze_citations(bibtex_path: str = None) -> Dict:
     return get_citation_info(bibtex_path)
 
 
+def _baseline_haystack(paper_data: Dict) -> str:
+    """
+    Build the casefolded text that baseline names are searched in.
+    
+    Only the fields where compared methods are named are used, instead of
+    stringifying the whole analysis dict.
+    """
+    parts = []
+    for key in ("baselines", "claims"):
+        value = paper_data.get(key) or []
+        if isinstance(value, list):
+            parts.extend(str(x) for x in value)
+        else:
+            parts.append(str(value))
+    
+    for key in ("abstract", "paper_title"):
+        if paper_data.get(key):
+            parts.append(str(paper_data[key]))
+    
+    # Result contexts often name the baseline ("vs. ResNet-50")
+    for reported in paper_data.get("reported_results") or []:
+        if isinstance(reported, dict) and reported.get("context"):
+            parts.append(str(reported["context"]))
+    
+    return " ".join(parts).casefold()
+
+
 def check_baseline_coverage(
     paper_analysis: str,
     bibtex_path: str = None,
@@ -65,8 +119,8 @@ def check_baseline_coverage(
     
     # Parse paper analysis
     try:
-        if isinstance(paper_analysis, str):
-            paper_data = json.loads(paper_analysis)
+        if isinstance(paper_analysis, (str, bytes)):
+            paper_data = _json_loads(paper_analysis)
         else:
             paper_data = paper_analysis
     except json.JSONDecodeError:
@@ -85,9 +139,9 @@ def check_baseline_coverage(
             missing = find_standard_baselines(entries, domain)
             
             # Filter out baselines that are mentioned in the paper
-            paper_text_lower = str(paper_data).lower()
+            haystack = _baseline_haystack(paper_data)
             for baseline in missing:
-                if baseline.lower() not in paper_text_lower:
+                if baseline.casefold() not in haystack:
                     result["missing_baselines"].append(baseline)
     
     # Generate recommendations
@@ -104,56 +158,85 @@ def check_baseline_coverage(
     return result
 
 
-def analyze_related_work_coverage(paper_text: str) -> Dict:
+@memory_memoize()
+def scan_related_work(paper_text: str) -> Dict:
+    """
+    Lexical pre-pass over the paper for related work analysis.
+    
+    PaperParserAgent embeds this record in its analysis as ``_lexical_cache``
+    so later tools can reuse it instead of rescanning the full text.
+    
+    Args:
+        paper_text: Full text of the paper
+        
+    Returns:
+        Dictionary with the section flag, span, word count and citation count
+    """
+    record = {
+        "has_related_work_section": False,
+        "rw_span": None,
+        "related_work_length": 0,
+        "citations": 0,
+    }
+    
+    # One pass: find the section start and count citations
+    rw_start = None
+    citation_count = 0
+    
+    for match in _RW_MASTER_RE.finditer(paper_text):
+        kind = match.lastgroup
+        if kind == "cite":
+            citation_count += 1
+        else:
+            record["has_related_work_section"] = True
+            if kind == "rw" and rw_start is None:
+                rw_start = match.end()
+    
+    # Estimate related work section length, bounded to a fixed window
+    if rw_start is not None:
+        window_end = min(rw_start + _RW_WINDOW, len(paper_text))
+        end_match = _END_SECTION_RE.search(paper_text, rw_start, window_end)
+        rw_end = end_match.start() if end_match else window_end
+        record["rw_span"] = [rw_start, rw_end]
+        record["related_work_length"] = len(paper_text[rw_start:rw_end].split())
+    
+    record["citations"] = citation_count
+    return record
+
+
+def analyze_related_work_coverage(
+    paper_text: str = None,
+    precomputed: Optional[Dict] = None
+) -> Dict:
     """
     Analyze the related work section for completeness.
     
     Args:
         paper_text: Full text of the paper
+        precomputed: The ``_lexical_cache`` record from the paper analysis;
+            when given, paper_text is not rescanned
         
     Returns:
         Dictionary with related work analysis
     """
-    import re
+    # An empty record carries no scan, so it counts as not provided
+    if not precomputed and not paper_text:
+        return {
+            "status": "error",
+            "error_message": "Either paper_text or precomputed must be provided"
+        }
+    
+    scan = precomputed or scan_related_work(paper_text)
     
     result = {
         "status": "success",
-        "has_related_work_section": False,
-        "related_work_length": 0,
-        "citation_density": 0,
+        "has_related_work_section": bool(scan.get("has_related_work_section")),
+        "related_work_length": scan.get("related_work_length", 0),
+        "citation_density": scan.get("citations", 0),
         "gaps": [],
         "recommendations": []
     }
     
-    text_lower = paper_text.lower()
-    
-    # Check for related work section
-    rw_patterns = [
-        r'related\s+work',
-        r'background',
-        r'prior\s+work',
-        r'literature\s+review'
-    ]
-    
-    for pattern in rw_patterns:
-        if re.search(pattern, text_lower):
-            result["has_related_work_section"] = True
-            break
-    
-    # Estimate related work section length
-    rw_match = re.search(
-        r'(?:related\s+work|background)(.*?)(?:method|approach|model|experiment|\d+\.)',
-        text_lower,
-        re.DOTALL
-    )
-    
-    if rw_match:
-        result["related_work_length"] = len(rw_match.group(1).split())
-    
-    # Count citation references
-    citations = re.findall(r'\[(?:\d+(?:,\s*\d+)*|\w+\s+et\s+al\.)\]', paper_text)
-    result["citation_density"] = len(citations)
-    
     # Check for gaps
     if not result["has_related_work_section"]:
         result["gaps"].append("No dedicated related work section found")
@@ -167,12 +250,7 @@ def analyze_related_work_coverage(paper_text: str) -> Dict:
     return result
 
 
-# Define the RelatedWorkBaselineAgent
-related_work_agent = Agent(
-    name="RelatedWorkBaselineAgent",
-    model="gemini-2.0-flash",
-    description="Analyzes citations and baseline comparisons for completeness.",
-    instruction="""You are a Related Work & Baseline Analysis Agent. Your task is to evaluate the paper's related work coverage and baseline comparisons.
+_RELATED_WORK_INSTRUCTION = """You are a Related Work & Baseline Analysis Agent. Your task is to evaluate the paper's related work coverage and baseline comparisons.
 
 You will receive:
 1. **Paper Analysis** (via state key `paper_analysis`): Contains claims, baselines, and paper content
@@ -204,6 +282,8 @@ Your responsibilities:
 
 **Input from Previous Agents**:
 Look for analysis from PaperParserAgent in the conversation history.
+If it includes a `_lexical_cache` record, call analyze_related_work_coverage with
+`precomputed` set to that record instead of sending the full paper text again.
 
 **Output Format (JSON)**:
 ```json
@@ -227,7 +307,26 @@ Look for analysis from PaperParserAgent in the conversation history.
 }
 ```
 
-Use the analyze_citations and check_baseline_coverage tools. Focus on issues that reviewers would likely catch.""",
-    tools=[analyze_citations, check_baseline_coverage, analyze_related_work_coverage],
-    output_key="related_work_analysis"
-)
+Use the analyze_citations and check_baseline_coverage tools. Focus on issues that reviewers would likely catch."""
+
+
+@functools.cache
+def get_related_work_agent():
+    """Build the RelatedWorkBaselineAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="RelatedWorkBaselineAgent",
+        model="gemini-2.0-flash",
+        description="Analyzes citations and baseline comparisons for completeness.",
+        instruction=_RELATED_WORK_INSTRUCTION,
+        tools=[analyze_citations, check_baseline_coverage, analyze_related_work_coverage],
+        output_key="related_work_analysis"
+    )
+
+
+def __getattr__(name):
+    # ``related_work_agent`` stays importable, but is only built when first accessed
+    if name == "related_work_agent":
+        return get_related_work_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
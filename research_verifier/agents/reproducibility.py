@@ -6,12 +6,84 @@ Responsibility:
 - Flag missing reproducibility information
 """
 
+import functools
+import io
 import os
+import re
+import sys
 import json
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
-from ..tools.log_analyzer import extract_reproducibility_info, extract_seeds_from_text
+from ..tools.log_analyzer import (
+    extract_all_reproducibility_info,
+    extract_seeds_from_text_iter,
+)
+from ..cache import memory_memoize
+from ..utils.helpers import map_in_threads
+from .paper_parser import read_paper_text
+
+
+# Logs are scanned for seeds in chunks of this many characters, read
+# through a large buffer so big logs take few read syscalls
+_LOG_CHUNK_CHARS = io.DEFAULT_BUFFER_SIZE * 16
+_LOG_BUFFER_BYTES = 1 << 20
+
+
+# Reproducibility checklist: (item, points, predicate). Predicates get the
+# result dict, the number of distinct seeds and the lowercased hardware refs.
+_CHECKLIST_SPEC = (
+    ("Random seed set", 20, lambda r, n_seeds, hw: n_seeds > 0),
+    ("Hardware specified", 15, lambda r, n_seeds, hw: bool(hw)),
+    ("Library imports found", 10, lambda r, n_seeds, hw: bool(r["library_versions"])),
+    ("Hyperparameters documented", 20, lambda r, n_seeds, hw: bool(r["hyperparameters"])),
+    ("Multiple seeds used", 15, lambda r, n_seeds, hw: n_seeds > 1),
+    ("GPU/Device specified", 10, lambda r, n_seeds, hw: any("cuda" in h or "gpu" in h for h in hw)),
+    ("Learning rate specified", 5, lambda r, n_seeds, hw: "learning_rate" in r["hyperparameters"]),
+    ("Batch size specified", 5, lambda r, n_seeds, hw: "batch_size" in r["hyperparameters"]),
+)
+
+
+# Reproducibility statement patterns (case-insensitive). Section patterns are
+# reported individually, so they are wrapped in a lookahead: every position is
+# tried and one pass finds each pattern even where matches overlap.
+_REPRO_PATTERNS = (
+    r'reproducib',
+    r'implementation\s+details',
+    r'experimental\s+setup',
+    r'training\s+details',
+)
+_REPRO_RE = re.compile(
+    '(?=' + '|'.join(f'(?P<p{i}>{p})' for i, p in enumerate(_REPRO_PATTERNS)) + ')',
+    re.IGNORECASE
+)
+_CODE_RE = re.compile(
+    r'code\s+(?:is\s+)?available|github\.com|open.?source|released\s+(?:the\s+)?code',
+    re.IGNORECASE
+)
+_DATA_RE = re.compile(
+    r'data\s+(?:is\s+)?available|publicly\s+available\s+dataset|dataset\s+(?:is\s+)?released',
+    re.IGNORECASE
+)
+
+# No pattern above can match in a text shorter than this ("reproducib")
+_MIN_STATEMENT_CHARS = 10
+
+# Shared marker for libraries seen only as imports. Library names are
+# interned too, since the same few names recur across scripts and papers.
+_FOUND_IN_IMPORTS = sys.intern("found in imports")
+
+
+def _scan_log_seeds(log_path: str) -> List[str]:
+    """Stream one log file through the seed scanner. Runs in a worker thread."""
+    try:
+        # 'replace' keeps a bad byte as a separator instead of splicing
+        # its neighbours together (e.g. into a bogus seed number)
+        with open(log_path, 'r', encoding='utf-8', errors='replace',
+                  buffering=_LOG_BUFFER_BYTES) as f:
+            chunks = iter(lambda: f.read(_LOG_CHUNK_CHARS), '')
+            return extract_seeds_from_text_iter(chunks)
+    except Exception:
+        return []
 
 
 def analyze_reproducibility(script_paths_csv: str = "", log_paths_csv: str = "") -> Dict:
@@ -39,65 +111,49 @@ def analyze_reproducibility(script_paths_csv: str = "", log_paths_csv: str = "")
     script_paths = [p.strip() for p in script_paths_csv.split(",") if p.strip()]
     log_paths = [p.strip() for p in log_paths_csv.split(",") if p.strip()]
     
-    score = 0
-    
-    # Analyze scripts
-    if script_paths:
-        for script_path in script_paths:
-            if os.path.exists(script_path):
-                script_analysis = extract_reproducibility_info(script_path)
-                
-                if script_analysis["status"] == "success":
-                    result["seeds_found"].extend(script_analysis.get("seeds", []))
-                    result["hardware_info"].extend(script_analysis.get("hardware_refs", []))
-                    # Handle imports - it's a list of library names, not a dict
-                    imports = script_analysis.get("imports", [])
-                    if isinstance(imports, list):
-                        for lib in imports:
-                            result["library_versions"][lib] = "found in imports"
-                    elif isinstance(imports, dict):
-                        result["library_versions"].update(imports)
-                    result["hyperparameters"].update(script_analysis.get("hyperparameters", {}))
+    seeds = set()
+    hardware = set()
+    
+    # Analyze scripts concurrently, merging in input order
+    script_paths = [p for p in script_paths if os.path.exists(p)]
+    for script_analysis in extract_all_reproducibility_info(script_paths):
+        if script_analysis["status"] == "success":
+            seeds.update(script_analysis.get("seeds", []))
+            hardware.update(script_analysis.get("hardware_refs", []))
+            # Handle imports - it's a list of library names, not a dict
+            imports = script_analysis.get("imports", [])
+            if isinstance(imports, list):
+                for lib in imports:
+                    result["library_versions"].setdefault(sys.intern(lib), _FOUND_IN_IMPORTS)
+            elif isinstance(imports, dict):
+                result["library_versions"].update(imports)
+            result["hyperparameters"].update(script_analysis.get("hyperparameters", {}))
     
     # Analyze logs for seeds
-    if log_paths:
-        for log_path in log_paths:
-            if os.path.exists(log_path):
-                try:
-                    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-                        content = f.read()
-                    seeds = extract_seeds_from_text(content)
-                    result["seeds_found"].extend(seeds)
-                except Exception:
-                    pass
-    
-    # Deduplicate
-    result["seeds_found"] = list(set(result["seeds_found"]))
-    result["hardware_info"] = list(set(result["hardware_info"]))
+    log_paths = [p for p in log_paths if os.path.exists(p)]
+    for log_seeds in map_in_threads(_scan_log_seeds, log_paths):
+        seeds.update(log_seeds)
+    
+    # Accumulated as sets, so already deduplicated
+    result["seeds_found"] = list(seeds)
+    result["hardware_info"] = list(hardware)
     
     # Calculate reproducibility score and identify missing items
-    checklist = [
-        ("Random seed set", bool(result["seeds_found"]), 20),
-        ("Hardware specified", bool(result["hardware_info"]), 15),
-        ("Library imports found", bool(result["library_versions"]), 10),
-        ("Hyperparameters documented", bool(result["hyperparameters"]), 20),
-        ("Multiple seeds used", len(result["seeds_found"]) > 1, 15),
-        ("GPU/Device specified", any("cuda" in str(h).lower() or "gpu" in str(h).lower() for h in result["hardware_info"]), 10),
-        ("Learning rate specified", "learning_rate" in result["hyperparameters"], 5),
-        ("Batch size specified", "batch_size" in result["hyperparameters"], 5),
+    n_seeds = len(result["seeds_found"])
+    hw_lower = [str(h).lower() for h in result["hardware_info"]]
+    checks = [
+        (name, points, predicate(result, n_seeds, hw_lower))
+        for name, points, predicate in _CHECKLIST_SPEC
     ]
-    
-    for item_name, is_present, points in checklist:
-        if is_present:
-            score += points
-        else:
-            result["missing_items"].append(item_name)
+    score = sum(points for _, points, ok in checks if ok)
+    result["missing_items"] = [name for name, _, ok in checks if not ok]
     
     result["reproducibility_score"] = score
     
     return result
 
 
+@memory_memoize(maxsize=4)
 def check_reproducibility_statement(paper_text: str = "") -> Dict:
     """
     Check if paper includes reproducibility statement or appendix.
@@ -108,8 +164,6 @@ def check_reproducibility_statement(paper_text: str = "") -> Dict:
     Returns:
         Dictionary with reproducibility statement analysis
     """
-    import re
-    
     result = {
         "status": "success",
         "has_reproducibility_section": False,
@@ -118,58 +172,30 @@ def check_reproducibility_statement(paper_text: str = "") -> Dict:
         "mentions_found": []
     }
     
-    if not paper_text:
+    if not paper_text or len(paper_text) < _MIN_STATEMENT_CHARS:
         return result
     
-    text_lower = paper_text.lower()
-    
-    # Check for reproducibility section
-    repro_patterns = [
-        r'reproducib',
-        r'implementation\s+details',
-        r'experimental\s+setup',
-        r'training\s+details',
-    ]
-    
-    for pattern in repro_patterns:
-        if re.search(pattern, text_lower):
-            result["has_reproducibility_section"] = True
-            result["mentions_found"].append(pattern)
-    
-    # Check for code availability
-    code_patterns = [
-        r'code\s+(?:is\s+)?available',
-        r'github\.com',
-        r'open.?source',
-        r'released\s+(?:the\s+)?code',
-    ]
-    
-    for pattern in code_patterns:
-        if re.search(pattern, text_lower):
-            result["has_code_availability"] = True
+    # Check for reproducibility section: one pass, stop once all are seen
+    seen = set()
+    for match in _REPRO_RE.finditer(paper_text):
+        seen.add(match.lastgroup)
+        if len(seen) == len(_REPRO_PATTERNS):
             break
     
-    # Check for data availability
-    data_patterns = [
-        r'data\s+(?:is\s+)?available',
-        r'publicly\s+available\s+dataset',
-        r'dataset\s+(?:is\s+)?released',
-    ]
+    if seen:
+        result["has_reproducibility_section"] = True
+        result["mentions_found"] = [
+            pattern for i, pattern in enumerate(_REPRO_PATTERNS) if f"p{i}" in seen
+        ]
     
-    for pattern in data_patterns:
-        if re.search(pattern, text_lower):
-            result["has_data_availability"] = True
-            break
+    # Check for code and data availability
+    result["has_code_availability"] = _CODE_RE.search(paper_text) is not None
+    result["has_data_availability"] = _DATA_RE.search(paper_text) is not None
     
     return result
 
 
-# Define the ReproducibilityAgent
-reproducibility_agent = Agent(
-    name="ReproducibilityAgent",
-    model="gemini-2.0-flash",
-    description="Checks for reproducibility information and flags missing details.",
-    instruction="""You are a Reproducibility Agent. Your task is to evaluate whether the research can be reproduced and identify missing reproducibility information.
+_REPRODUCIBILITY_INSTRUCTION = """You are a Reproducibility Agent. Your task is to evaluate whether the research can be reproduced and identify missing reproducibility information.
 
 You will analyze:
 1. **Experiment Scripts**: Python files for training/evaluation
@@ -231,7 +257,27 @@ Your responsibilities:
 }
 ```
 
-Use the analyze_reproducibility tool with comma-separated file paths. Score 0-100 where 100 is fully reproducible.""",
-    tools=[analyze_reproducibility, check_reproducibility_statement],
-    output_key="reproducibility_analysis"
-)
+Use the analyze_reproducibility tool with comma-separated file paths. To check the paper's own
+reproducibility statement, read it with read_paper_text and pass the text to check_reproducibility_statement. Score 0-100 where 100 is fully reproducible."""
+
+
+@functools.cache
+def get_reproducibility_agent():
+    """Build the ReproducibilityAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="ReproducibilityAgent",
+        model="gemini-2.0-flash",
+        description="Checks for reproducibility information and flags missing details.",
+        instruction=_REPRODUCIBILITY_INSTRUCTION,
+        tools=[analyze_reproducibility, check_reproducibility_statement, read_paper_text],
+        output_key="reproducibility_analysis"
+    )
+
+
+def __getattr__(name):
+    # ``reproducibility_agent`` stays importable, but is only built when first accessed
+    if name == "reproducibility_agent":
+        return get_reproducibility_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
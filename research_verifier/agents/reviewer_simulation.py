@@ -7,17 +7,12 @@ Responsibility:
 - Assess paper from reviewer perspective
 """
 
+import functools
 import json
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
 
-# Define the ReviewerSimulationAgent
-reviewer_simulation_agent = Agent(
-    name="ReviewerSimulationAgent",
-    model="gemini-2.0-flash",
-    description="Simulates critical reviewer feedback based on all analysis results.",
-    instruction="""You are a Reviewer Simulation Agent. Your task is to act as a critical but fair academic reviewer, generating the types of comments this paper would likely receive.
+_REVIEWER_SIMULATION_INSTRUCTION = """You are a Reviewer Simulation Agent. Your task is to act as a critical but fair academic reviewer, generating the types of comments this paper would likely receive.
 
 You have access to comprehensive analysis from previous agents in the conversation history. Look for outputs from:
 - PaperParserAgent: Claims, reported results, datasets, metrics, baselines
@@ -101,7 +96,26 @@ Generate comments as a real reviewer would write them:
 **Review Categories**: methodology, results, clarity, novelty, reproducibility
 **Severity Levels**: minor, moderate, major, critical
 
-Be thorough but constructive. Focus on actionable feedback the authors can address.""",
-    tools=[],  # No tools needed - uses context from previous agents
-    output_key="reviewer_simulation"
-)
+Be thorough but constructive. Focus on actionable feedback the authors can address."""
+
+
+@functools.cache
+def get_reviewer_simulation_agent():
+    """Build the ReviewerSimulationAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="ReviewerSimulationAgent",
+        model="gemini-2.0-flash",
+        description="Simulates critical reviewer feedback based on all analysis results.",
+        instruction=_REVIEWER_SIMULATION_INSTRUCTION,
+        tools=[],  # No tools needed - uses context from previous agents
+        output_key="reviewer_simulation"
+    )
+
+
+def __getattr__(name):
+    # ``reviewer_simulation_agent`` stays importable, but is only built when first accessed
+    if name == "reviewer_simulation_agent":
+        return get_reviewer_simulation_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
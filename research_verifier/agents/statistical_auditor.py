@@ -7,13 +7,64 @@ Responsibility:
 - Identify metric misuse
 """
 
+import functools
 import os
 import json
 import re
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
-from ..tools.log_analyzer import analyze_training_logs
+from ..tools.log_analyzer import analyze_all_logs
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scalar math is used instead
+    np = None
+
+
+# Filenames that look like one run of a repeated experiment
+_RUN_RE = re.compile(r'(?:run|seed|exp)[_\-]?\d+', re.IGNORECASE)
+
+# Runs needed before results are treated as statistically meaningful
+_MIN_RUNS = 3
+
+
+# Below this many metrics NumPy's array setup costs more than it saves
+_NUMPY_MIN_BATCH = 64
+
+
+def _coefficients_of_variation(variances: List[float], max_vals: List[float]) -> List[float]:
+    """Return sqrt(variance) / |max| per metric (0 where max is 0)."""
+    if np is not None and len(variances) >= _NUMPY_MIN_BATCH:
+        v = np.asarray(variances, dtype=float)
+        m = np.asarray(max_vals, dtype=float)
+        nonzero = m != 0
+        cv = np.where(nonzero, np.sqrt(v) / np.where(nonzero, np.abs(m), 1.0), 0.0)
+        return cv.tolist()
+    
+    return [(v ** 0.5) / abs(m) if m != 0 else 0 for v, m in zip(variances, max_vals)]
+
+
+def _iter_log_names(directory: str):
+    """
+    Yield the names of entries under ``directory``, recursively.
+    
+    Mirrors ``glob(directory/**/*.*, recursive=True)``: hidden entries are
+    skipped and only names containing a dot are yielded. Names come straight
+    from os.scandir, so no per-file stat is needed.
+    """
+    stack = [directory]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name.startswith('.'):
+                        continue
+                    if '.' in entry.name:
+                        yield entry.name
+                    if entry.is_dir():
+                        stack.append(entry.path)
+        except OSError:
+            continue
 
 
 def analyze_statistical_validity(log_paths_csv: str = "") -> Dict:
@@ -37,35 +88,40 @@ def analyze_statistical_validity(log_paths_csv: str = "") -> Dict:
     # Parse CSV path list
     log_paths = [p.strip() for p in log_paths_csv.split(",") if p.strip()]
     
-    if log_paths:
-        for log_path in log_paths:
-            if os.path.exists(log_path):
-                log_analysis = analyze_training_logs(log_path)
-                
-                if log_analysis["status"] == "success":
-                    metrics = log_analysis.get("metrics", {})
+    # Analyze logs concurrently, then collect high-variance metrics in input order
+    log_paths = [p for p in log_paths if os.path.exists(p)]
+    names, variances, max_vals, counts = [], [], [], []
+    for log_analysis in analyze_all_logs(log_paths):
+        if log_analysis["status"] == "success":
+            metrics = log_analysis.get("metrics", {})
+            
+            for metric_name, metric_data in metrics.items():
+                if isinstance(metric_data, dict) and "variance" in metric_data:
+                    variance = metric_data["variance"]
+                    count = metric_data.get("count", 0)
                     
-                    for metric_name, metric_data in metrics.items():
-                        if isinstance(metric_data, dict) and "variance" in metric_data:
-                            variance = metric_data["variance"]
-                            count = metric_data.get("count", 0)
-                            
-                            # Check for high variance
-                            if variance > 0.01 and count > 1:
-                                cv = (variance ** 0.5) / abs(metric_data.get("max", 1)) if metric_data.get("max", 0) != 0 else 0
-                                
-                                result["variance_analysis"].append({
-                                    "metric": metric_name,
-                                    "variance": variance,
-                                    "coefficient_of_variation": cv,
-                                    "sample_count": count,
-                                    "concern_level": "high" if cv > 0.3 else "medium" if cv > 0.1 else "low"
-                                })
-                                
-                                if cv > 0.3:
-                                    result["recommendations"].append(
-                                        f"High variance in {metric_name} (CV={cv:.2f}). Consider running multiple seeds."
-                                    )
+                    # Check for high variance
+                    if variance > 0.01 and count > 1:
+                        names.append(metric_name)
+                        variances.append(variance)
+                        max_vals.append(metric_data.get("max", 0))
+                        counts.append(count)
+    
+    # Coefficient of variation for all candidates in one batch
+    cvs = _coefficients_of_variation(variances, max_vals)
+    for metric_name, variance, count, cv in zip(names, variances, counts, cvs):
+        result["variance_analysis"].append({
+            "metric": metric_name,
+            "variance": variance,
+            "coefficient_of_variation": cv,
+            "sample_count": count,
+            "concern_level": "high" if cv > 0.3 else "medium" if cv > 0.1 else "low"
+        })
+        
+        if cv > 0.3:
+            result["recommendations"].append(
+                f"High variance in {metric_name} (CV={cv:.2f}). Consider running multiple seeds."
+            )
     
     return result
 
@@ -78,7 +134,8 @@ def check_multiple_run_evidence(log_directory: str = "") -> Dict:
         log_directory: Directory containing experiment logs
         
     Returns:
-        Dictionary with multi-run analysis
+        Dictionary with multi-run analysis. The directory walk stops once
+        enough runs are found, so runs_detected is capped at 3.
     """
     result = {
         "status": "success",
@@ -91,26 +148,15 @@ def check_multiple_run_evidence(log_directory: str = "") -> Dict:
         result["issues"].append("No log directory provided or directory not found")
         return result
     
-    # Look for multiple run files
-    import glob
-    
-    log_files = glob.glob(os.path.join(log_directory, "**/*.*"), recursive=True)
-    
-    # Simple heuristic: count files that look like run logs
-    run_patterns = [
-        r'run[_\-]?\d+',
-        r'seed[_\-]?\d+',
-        r'exp[_\-]?\d+',
-    ]
-    
-    for log_file in log_files:
-        filename = os.path.basename(log_file)
-        for pattern in run_patterns:
-            if re.search(pattern, filename, re.IGNORECASE):
-                result["runs_detected"] += 1
+    # Simple heuristic: count files that look like run logs, stopping the
+    # walk as soon as there are enough
+    for name in _iter_log_names(log_directory):
+        if _RUN_RE.search(name):
+            result["runs_detected"] += 1
+            if result["runs_detected"] >= _MIN_RUNS:
                 break
     
-    if result["runs_detected"] < 3:
+    if result["runs_detected"] < _MIN_RUNS:
         result["issues"].append(
             f"Only {result['runs_detected']} runs detected. Statistical significance typically requires 3+ runs."
         )
@@ -118,12 +164,7 @@ def check_multiple_run_evidence(log_directory: str = "") -> Dict:
     return result
 
 
-# Define the StatisticalAuditorAgent  
-statistical_auditor_agent = Agent(
-    name="StatisticalAuditorAgent",
-    model="gemini-2.0-flash",
-    description="Evaluates statistical validity of claims and identifies weak statistical practices.",
-    instruction="""You are a Statistical Auditor Agent. Your task is to evaluate the statistical validity of experimental results and identify potential issues.
+_STATISTICAL_AUDITOR_INSTRUCTION = """You are a Statistical Auditor Agent. Your task is to evaluate the statistical validity of experimental results and identify potential issues.
 
 You will receive:
 1. **Experiment Evidence** (from ExperimentEvidenceAgent via state key `experiment_evidence`): Contains mappings of results to experimental evidence
@@ -152,7 +193,9 @@ Your responsibilities:
    - **weak**: Insufficient statistical evidence
 
 **Input from Previous Agents**:
-Look for analysis from PaperParserAgent and ExperimentEvidenceAgent in the conversation history.
+Look for analysis from ExperimentEvidenceAgent in the conversation history. The PaperParserAgent analysis comes from an earlier parallel stage, so it is not in your history; it is included here from state:
+
+{paper_analysis?}
 
 **Output Format (JSON)**:
 ```json
@@ -178,7 +221,26 @@ Look for analysis from PaperParserAgent and ExperimentEvidenceAgent in the conve
 }
 ```
 
-Use the analyze_statistical_validity tool with comma-separated log paths. Be rigorous but fair.""",
-    tools=[analyze_statistical_validity, check_multiple_run_evidence],
-    output_key="statistical_audit"
-)
+Use the analyze_statistical_validity tool with comma-separated log paths. Be rigorous but fair."""
+
+
+@functools.cache
+def get_statistical_auditor_agent():
+    """Build the StatisticalAuditorAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="StatisticalAuditorAgent",
+        model="gemini-2.0-flash",
+        description="Evaluates statistical validity of claims and identifies weak statistical practices.",
+        instruction=_STATISTICAL_AUDITOR_INSTRUCTION,
+        tools=[analyze_statistical_validity, check_multiple_run_evidence],
+        output_key="statistical_audit"
+    )
+
+
+def __getattr__(name):
+    # ``statistical_auditor_agent`` stays importable, but is only built when first accessed
+    if name == "statistical_auditor_agent":
+        return get_statistical_auditor_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,17 +7,12 @@ Responsibility:
 - Generate prioritized action list
 """
 
+import functools
 import json
 from typing import Dict, List, Optional
-from google.adk.agents import Agent
 
 
-# Define the VerdictAgent
-verdict_agent = Agent(
-    name="VerdictAgent",
-    model="gemini-2.0-flash",
-    description="Aggregates all analysis and produces final verdict with prioritized action items.",
-    instruction="""You are the Verdict Agent - the final coordinator that synthesizes all analysis into an actionable report.
+_VERDICT_INSTRUCTION = """You are the Verdict Agent - the final coordinator that synthesizes all analysis into an actionable report.
 
 You have access to comprehensive analysis from previous agents in the conversation history. Look for outputs from:
 - PaperParserAgent: Claims, results, datasets, metrics
@@ -109,7 +104,26 @@ Produce a comprehensive final report that:
 - NOT READY - Major revisions needed (1-3 weeks)
 - NOT READY - Fundamental issues (requires significant rework)
 
-Be comprehensive but actionable. Every issue should have a clear path to resolution.""",
-    tools=[],  # No tools needed - synthesizes from conversation history
-    output_key="final_verdict"
-)
+Be comprehensive but actionable. Every issue should have a clear path to resolution."""
+
+
+@functools.cache
+def get_verdict_agent():
+    """Build the VerdictAgent on first use; later calls return the same instance."""
+    from google.adk.agents import Agent
+    
+    return Agent(
+        name="VerdictAgent",
+        model="gemini-2.0-flash",
+        description="Aggregates all analysis and produces final verdict with prioritized action items.",
+        instruction=_VERDICT_INSTRUCTION,
+        tools=[],  # No tools needed - synthesizes from conversation history
+        output_key="final_verdict"
+    )
+
+
+def __getattr__(name):
+    # ``verdict_agent`` stays importable, but is only built when first accessed
+    if name == "verdict_agent":
+        return get_verdict_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
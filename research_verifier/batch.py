@@ -0,0 +1,127 @@
+"""
+Batch execution of the verification pipeline over many papers.
+
+Usage:
+    runner = BatchRunner(execution_mode="offline", max_concurrency=4)
+    futures = {pid: runner.submit(pid, prompt) for pid, prompt in prompts.items()}
+    await runner.flush()
+    reports = {pid: f.result() for pid, f in futures.items()}
+"""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+EXECUTION_MODES = ("realtime", "offline")
+
+APP_NAME = "research_verifier"
+
+
+class BatchRunner:
+    """
+    Run the verification pipeline for many papers on one shared ADK runner.
+
+    In ``realtime`` mode (the default) a submitted paper starts right away, so
+    interactive use behaves as before. In ``offline`` mode submissions are
+    buffered and ``flush()`` runs them together, at most ``max_concurrency``
+    at a time, so the per-paper LLM round-trips overlap instead of queueing.
+    """
+
+    def __init__(
+        self,
+        execution_mode: str = "realtime",
+        max_concurrency: int = 4,
+        user_id: str = "batch_user"
+    ):
+        if execution_mode not in EXECUTION_MODES:
+            raise ValueError(
+                f"execution_mode must be one of {EXECUTION_MODES}, got {execution_mode!r}"
+            )
+
+        self.execution_mode = execution_mode
+        self.max_concurrency = max(1, max_concurrency)
+        self.user_id = user_id
+
+        self._runner = None
+        self._session_service = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pending: List[Tuple[str, str, asyncio.Future]] = []
+
+    def _get_runner(self):
+        """Create the shared runner on first use."""
+        if self._runner is None:
+            from google.adk.sessions import InMemorySessionService
+            from google.adk.runners import Runner
+            from .agent import root_agent
+
+            self._session_service = InMemorySessionService()
+            self._runner = Runner(
+                agent=root_agent,
+                app_name=APP_NAME,
+                session_service=self._session_service
+            )
+        return self._runner
+
+    def submit(self, paper_id: str, prompt: str) -> asyncio.Future:
+        """
+        Queue one paper's pipeline run. Must be called from a running event loop.
+
+        Args:
+            paper_id: Identifier for the paper, stored in the session state
+            prompt: User message to start the pipeline with
+
+        Returns:
+            Future resolved with the final report text (or None if the
+            pipeline produced no text)
+        """
+        if self.execution_mode == "realtime":
+            return asyncio.ensure_future(self._run_limited(paper_id, prompt))
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((paper_id, prompt, future))
+        return future
+
+    async def flush(self) -> None:
+        """Run every buffered submission and resolve its future."""
+        pending, self._pending = self._pending, []
+
+        async def resolve(paper_id: str, prompt: str, future: asyncio.Future):
+            try:
+                future.set_result(await self._run_limited(paper_id, prompt))
+            except Exception as e:
+                future.set_exception(e)
+
+        await asyncio.gather(*(resolve(*item) for item in pending))
+
+    async def _run_limited(self, paper_id: str, prompt: str) -> Optional[str]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await self._run_one(paper_id, prompt)
+
+    async def _run_one(self, paper_id: str, prompt: str) -> Optional[str]:
+        """Run the pipeline for one paper in its own session."""
+        from google.genai import types
+
+        runner = self._get_runner()
+        session = await self._session_service.create_session(
+            app_name=APP_NAME,
+            user_id=self.user_id,
+            state={"paper_id": paper_id}
+        )
+        message = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=prompt)]
+        )
+
+        final_text = None
+        async for event in runner.run_async(
+            user_id=self.user_id,
+            session_id=session.id,
+            new_message=message
+        ):
+            if event.content and event.content.parts:
+                text = "".join(part.text or "" for part in event.content.parts)
+                if text:
+                    final_text = text
+
+        return final_text
@@ -0,0 +1,306 @@
+"""Content-hash keyed on-disk cache for expensive parsing/analysis results."""
+
+import os
+import copy
+import json
+import hashlib
+import inspect
+import logging
+import functools
+import tempfile
+import threading
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, Iterable, Optional
+
+from .utils.helpers import run_in_process
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached entry (e.g. after changing the key format)
+CACHE_VERSION = "1"
+
+_CHUNK_SIZE = 1 << 16
+
+_stats = {"hits": 0, "misses": 0}
+
+# Same fields as functools.lru_cache's cache_info()
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+def get_cache_dir() -> str:
+    """Return the cache directory (override with RESEARCH_VERIFIER_CACHE_DIR)."""
+    return os.environ.get(
+        "RESEARCH_VERIFIER_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".cache", "research_verifier")
+    )
+
+
+def cache_stats() -> Dict[str, int]:
+    """Return hit/miss counters for this process."""
+    return dict(_stats)
+
+
+def file_sha256(file_path: str) -> Optional[str]:
+    """Hash a file's bytes with sha256, reading in chunks. Returns None on error."""
+    h = hashlib.sha256()
+    try:
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                h.update(chunk)
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def text_sha256(text: str) -> str:
+    """Hash a string with sha256."""
+    return hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+def _prune_entries(directory: str, max_entries: Optional[int], max_bytes: Optional[int]) -> None:
+    """Delete the oldest (by mtime) entries in a cache directory until it is within both limits."""
+    entries = []
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((st.st_mtime_ns, st.st_size, entry.path))
+    except OSError:
+        return
+
+    count = len(entries)
+    total = sum(size for _, size, _ in entries)
+    entries.sort()
+    for _, size, path in entries:
+        if (max_entries is None or count <= max_entries) and (max_bytes is None or total <= max_bytes):
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        count -= 1
+        total -= size
+
+
+def disk_memoize(version: str = "v1", file_args: Iterable[str] = ("file_path",),
+                 max_entries: Optional[int] = None, max_bytes: Optional[int] = None) -> Callable:
+    """
+    Cache a function's JSON-serializable dict result on disk.
+
+    The key is a sha256 over the function name, ``version`` and every bound
+    argument. Arguments named in ``file_args`` are keyed on the content of the
+    file they point to, so an edited file is a miss while a renamed or
+    re-uploaded copy is a hit. Results with ``status == "error"`` are never
+    cached.
+
+    Without limits, entries are kept until the cache directory is cleared.
+    With ``max_entries`` or ``max_bytes``, the function's entries live in a
+    subdirectory of their own and form an LRU: a hit refreshes the entry's
+    mtime, and a write that takes the subdirectory over either limit deletes
+    the entries with the oldest mtimes. The wrapper's
+    ``cache_evict(*args, **kwargs)`` deletes the entry for one call.
+
+    Args:
+        version: Salt for the key; bump it when the function's output changes
+        file_args: Names of arguments that hold file paths
+        max_entries: Number of entries to keep for this function
+        max_bytes: Total size of the entries to keep for this function
+    """
+    file_args = frozenset(file_args)
+    bounded = max_entries is not None or max_bytes is not None
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+        prefix = f"{CACHE_VERSION}|{name}|{version}"
+
+        def entry_dir() -> str:
+            cache_dir = get_cache_dir()
+            return os.path.join(cache_dir, name) if bounded else cache_dir
+
+        def make_key(args, kwargs) -> Optional[str]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+
+            h = hashlib.sha256(prefix.encode())
+            for name, value in bound.arguments.items():
+                if name in file_args and value:
+                    digest = file_sha256(value)
+                    if digest is None:
+                        return None
+                    part = f"file:{digest}"
+                elif isinstance(value, str):
+                    part = f"str:{text_sha256(value)}"
+                else:
+                    part = f"repr:{value!r}"
+                h.update(f"|{name}={part}".encode())
+
+            return h.hexdigest()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = make_key(args, kwargs)
+            if key is None:
+                return func(*args, **kwargs)
+
+            cache_dir = entry_dir()
+            cache_path = os.path.join(cache_dir, f"{key}.json")
+
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if bounded:
+                    try:
+                        os.utime(cache_path)
+                    except OSError:
+                        pass
+                _stats["hits"] += 1
+                logger.debug("cache hit for %s (%s)", func.__qualname__, key[:12])
+                return cached
+            except (OSError, ValueError):
+                pass
+
+            _stats["misses"] += 1
+            logger.debug("cache miss for %s (%s)", func.__qualname__, key[:12])
+
+            result = func(*args, **kwargs)
+            if isinstance(result, dict) and result.get("status") == "error":
+                return result
+
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                        json.dump(result, f)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except (OSError, TypeError, ValueError) as e:
+                logger.debug("could not cache %s: %s", func.__qualname__, e)
+            else:
+                if bounded:
+                    _prune_entries(cache_dir, max_entries, max_bytes)
+
+            return result
+
+        def cache_evict(*args, **kwargs) -> bool:
+            key = make_key(args, kwargs)
+            if key is None:
+                return False
+            try:
+                os.remove(os.path.join(entry_dir(), f"{key}.json"))
+            except OSError:
+                return False
+            return True
+
+        wrapper.cache_evict = cache_evict
+        return wrapper
+
+    return decorator
+
+
+def memory_memoize(maxsize: int = 16) -> Callable:
+    """
+    Cache a pure function's result in process memory.
+
+    Arguments must be hashable; string arguments are keyed on their value, so
+    repeated calls with the same paper text (LLM retries, several agents
+    reading the same paper) skip the work entirely. Each call gets a deep
+    copy of the cached result, so callers may mutate it freely.
+
+    Args:
+        maxsize: Number of distinct argument sets to keep
+    """
+    def decorator(func: Callable) -> Callable:
+        cached = functools.lru_cache(maxsize=maxsize)(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return copy.deepcopy(cached(*args, **kwargs))
+
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
+
+
+def stat_memoize(maxsize: int = 256) -> Callable:
+    """
+    Cache a single-path function's result in memory, keyed on file identity.
+    
+    The key is ``(path, st_mtime_ns, st_size)``, so an edited file is a miss
+    without hashing its content. Paths that can't be stat'ed, or calls with
+    extra arguments, go straight to the function. Each call gets a deep copy
+    of the cached result.
+    
+    The wrapper's ``in_process(path)`` uses the same cache but computes a
+    miss in the shared worker process pool, so CPU-heavy parses can leave
+    the caller's interpreter without losing the cache.
+    
+    Args:
+        maxsize: Number of distinct file versions to keep
+    """
+    def decorator(func: Callable) -> Callable:
+        path_param = next(iter(inspect.signature(func).parameters))
+        entries: OrderedDict = OrderedDict()
+        lock = threading.Lock()
+        counts = {"hits": 0, "misses": 0}
+        
+        def lookup(path, compute: Callable):
+            try:
+                st = os.stat(path)
+            except (OSError, TypeError, ValueError):
+                return compute(path)
+            
+            key = (path, st.st_mtime_ns, st.st_size)
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    counts["hits"] += 1
+                    return copy.deepcopy(entries[key])
+                counts["misses"] += 1
+            
+            result = compute(path)
+            with lock:
+                entries[key] = result
+                if len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return copy.deepcopy(result)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if len(args) == 1 and not kwargs:
+                path = args[0]
+            elif not args and len(kwargs) == 1 and path_param in kwargs:
+                path = kwargs[path_param]
+            else:
+                return func(*args, **kwargs)
+            
+            return lookup(path, func)
+        
+        def in_process(path):
+            # The wrapper pickles by name; in the worker it runs func
+            return lookup(path, lambda p: run_in_process(wrapper, p))
+        
+        def cache_info() -> CacheInfo:
+            with lock:
+                return CacheInfo(counts["hits"], counts["misses"], maxsize, len(entries))
+        
+        def cache_clear() -> None:
+            with lock:
+                entries.clear()
+                counts.update(hits=0, misses=0)
+
+        wrapper.in_process = in_process
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
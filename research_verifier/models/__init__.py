@@ -1,20 +1,9 @@
 """Data models and schemas for agent communication."""
 
-from .schemas import (
-    ReportedResult,
-    PaperParserOutput,
-    ExperimentMapping,
-    ExperimentEvidenceOutput,
-    WeakClaim,
-    StatisticalAuditOutput,
-    RelatedWorkOutput,
-    ReviewerComment,
-    ReviewerSimulationOutput,
-    ReproducibilityOutput,
-    ActionItem,
-    VerdictOutput,
-)
+import importlib
 
+# Schemas are loaded from .schemas on first access (PEP 562), so importing
+# the package does not pull in pydantic until a model is actually used.
 __all__ = [
     "ReportedResult",
     "PaperParserOutput",
@@ -28,4 +17,22 @@ __all__ = [
     "ReproducibilityOutput",
     "ActionItem",
     "VerdictOutput",
+    "ReproducibilityReport",
+    "ExperimentEvidenceReport",
+    "RelatedWorkReport",
+    "ReportReviewerComment",
+    "ReviewerSimulationReport",
+    "ReportActionItem",
+    "VerdictReport",
+    "FullReport",
 ]
+
+
+def __getattr__(name):
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(".schemas", __name__), name)
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
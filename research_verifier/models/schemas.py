@@ -5,32 +5,34 @@ These models define the input/output structures for each agent,
 enabling type-safe message passing through ADK's state mechanism.
 """
 
-from typing import List, Dict, Optional, Any
-from pydantic import BaseModel, Field
-from enum import Enum
+from typing import List, Dict, Literal, Optional, Any, get_args
+from pydantic import BaseModel, ConfigDict, Field
 
 
-class Severity(str, Enum):
-    """Severity levels for issues."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+# Severity levels for issues
+Severity = Literal["low", "medium", "high", "critical"]
+SEVERITY_VALUES = get_args(Severity)
 
+# Priority levels for action items
+Priority = Literal["low", "medium", "high", "urgent"]
+PRIORITY_VALUES = get_args(Priority)
 
-class Priority(str, Enum):
-    """Priority levels for action items."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    URGENT = "urgent"
+# Severity levels for reviewer comments, as the reviewer prompt and the
+# frontends name them
+ReviewSeverity = Literal["minor", "moderate", "major"]
+REVIEW_SEVERITY_VALUES = get_args(ReviewSeverity)
+
+
+class _AgentSchema(BaseModel):
+    """Shared config: tolerate extra keys in LLM output, validate on construction only."""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
 
 
 # ========================
 # PaperParserAgent Schemas
 # ========================
 
-class ReportedResult(BaseModel):
+class ReportedResult(_AgentSchema):
     """A result reported in the paper."""
     metric_name: str = Field(description="Name of the metric (e.g., accuracy, F1)")
     value: str = Field(description="The reported value")
@@ -38,7 +40,7 @@ class ReportedResult(BaseModel):
     context: Optional[str] = Field(default=None, description="Additional context about the result")
 
 
-class PaperParserOutput(BaseModel):
+class PaperParserOutput(_AgentSchema):
     """Output from the PaperParserAgent."""
     claims: List[str] = Field(default_factory=list, description="Main claims made in the paper")
     reported_results: List[ReportedResult] = Field(default_factory=list, description="Numerical results reported")
@@ -53,16 +55,18 @@ class PaperParserOutput(BaseModel):
 # ExperimentEvidenceAgent Schemas
 # ================================
 
-class ExperimentMapping(BaseModel):
+class ExperimentMapping(_AgentSchema):
     """Mapping of a claim/result to its experimental evidence."""
     claimed_result: str = Field(description="The claimed result from the paper")
     log_file: Optional[str] = Field(default=None, description="Associated log file if found")
     script_file: Optional[str] = Field(default=None, description="Associated script if found")
-    evidence_strength: str = Field(default="none", description="none/weak/moderate/strong")
+    evidence_strength: Literal["none", "weak", "moderate", "strong"] = Field(
+        default="none", description="none/weak/moderate/strong"
+    )
     notes: Optional[str] = Field(default=None, description="Additional notes about the mapping")
 
 
-class ExperimentEvidenceOutput(BaseModel):
+class ExperimentEvidenceOutput(_AgentSchema):
     """Output from the ExperimentEvidenceAgent."""
     experiment_map: Dict[str, ExperimentMapping] = Field(
         default_factory=dict, 
@@ -82,15 +86,15 @@ class ExperimentEvidenceOutput(BaseModel):
 # StatisticalAuditorAgent Schemas
 # ===============================
 
-class WeakClaim(BaseModel):
+class WeakClaim(_AgentSchema):
     """A statistically weak claim identified in the paper."""
     claim: str = Field(description="The claim that is statistically weak")
     reason: str = Field(description="Why the claim is considered weak")
-    severity: Severity = Field(default=Severity.MEDIUM, description="Severity of the issue")
+    severity: Severity = Field(default="medium", description="Severity of the issue")
     recommendation: Optional[str] = Field(default=None, description="How to strengthen the claim")
 
 
-class StatisticalAuditOutput(BaseModel):
+class StatisticalAuditOutput(_AgentSchema):
     """Output from the StatisticalAuditorAgent."""
     weak_claims: List[WeakClaim] = Field(default_factory=list, description="Claims with statistical issues")
     variance_issues: List[str] = Field(default_factory=list, description="Issues with variance/std reporting")
@@ -102,7 +106,7 @@ class StatisticalAuditOutput(BaseModel):
 # RelatedWorkBaselineAgent Schemas
 # ================================
 
-class RelatedWorkOutput(BaseModel):
+class RelatedWorkOutput(_AgentSchema):
     """Output from the RelatedWorkBaselineAgent."""
     missing_baselines: List[str] = Field(
         default_factory=list, 
@@ -126,15 +130,15 @@ class RelatedWorkOutput(BaseModel):
 # ReviewerSimulationAgent Schemas
 # ==================================
 
-class ReviewerComment(BaseModel):
+class ReviewerComment(_AgentSchema):
     """A simulated reviewer comment."""
     comment: str = Field(description="The reviewer's comment")
     category: str = Field(description="Category: methodology/results/clarity/novelty/reproducibility")
-    severity: Severity = Field(default=Severity.MEDIUM, description="How critical this comment is")
+    severity: Severity = Field(default="medium", description="How critical this comment is")
     section: Optional[str] = Field(default=None, description="Which section this relates to")
 
 
-class ReviewerSimulationOutput(BaseModel):
+class ReviewerSimulationOutput(_AgentSchema):
     """Output from the ReviewerSimulationAgent."""
     reviewer_comments: List[ReviewerComment] = Field(
         default_factory=list, 
@@ -152,7 +156,7 @@ class ReviewerSimulationOutput(BaseModel):
 # ReproducibilityAgent Schemas
 # =============================
 
-class ReproducibilityOutput(BaseModel):
+class ReproducibilityOutput(_AgentSchema):
     """Output from the ReproducibilityAgent."""
     missing_reproducibility_items: List[str] = Field(
         default_factory=list, 
@@ -174,15 +178,15 @@ class ReproducibilityOutput(BaseModel):
 # VerdictAgent Schemas
 # =====================
 
-class ActionItem(BaseModel):
+class ActionItem(_AgentSchema):
     """An action item for the researcher."""
     action: str = Field(description="What needs to be done")
-    priority: Priority = Field(default=Priority.MEDIUM, description="Priority level")
+    priority: Priority = Field(default="medium", description="Priority level")
     category: str = Field(description="Category of the action")
     estimated_effort: Optional[str] = Field(default=None, description="Estimated effort (low/medium/high)")
 
 
-class VerdictOutput(BaseModel):
+class VerdictOutput(_AgentSchema):
     """Final output from the VerdictAgent."""
     critical_issues: List[str] = Field(
         default_factory=list, 
@@ -210,11 +214,98 @@ class VerdictOutput(BaseModel):
     )
 
 
+# ===========================
+# Single-call Report Schemas
+# ===========================
+# One structured LLM response covering every section, in the shape the web
+# frontend renders (the same keys the multi-agent path aggregates into).
+
+class ReproducibilityReport(_AgentSchema):
+    """Reproducibility section of a single-call report."""
+    missing_items: List[str] = Field(default_factory=list, description="Missing reproducibility information")
+    found_seeds: List[str] = Field(default_factory=list, description="Random seeds found")
+    found_hardware: List[str] = Field(default_factory=list, description="Hardware specifications found")
+    reproducibility_score: float = Field(default=0, description="Estimated reproducibility score 0-100")
+
+
+class ExperimentEvidenceReport(_AgentSchema):
+    """Experiment evidence section of a single-call report."""
+    issues: List[str] = Field(default_factory=list, description="Problems linking results to experiments")
+    untraceable_results: List[str] = Field(
+        default_factory=list,
+        description="Results that cannot be traced to experiments"
+    )
+    missing_experiments: List[str] = Field(
+        default_factory=list,
+        description="Expected experiments that are missing"
+    )
+
+
+class RelatedWorkReport(_AgentSchema):
+    """Related work section of a single-call report."""
+    citations_found: int = Field(default=0, description="Number of citations in the paper")
+    issues: List[str] = Field(default_factory=list, description="Related work and citation issues")
+    missing_baselines: List[str] = Field(
+        default_factory=list,
+        description="Standard baselines that should be compared against"
+    )
+
+
+class ReportReviewerComment(_AgentSchema):
+    """A simulated reviewer comment in a single-call report."""
+    comment: str = Field(description="The reviewer's comment")
+    category: str = Field(description="Category: methodology/results/clarity/novelty/reproducibility")
+    severity: ReviewSeverity = Field(default="moderate", description="How serious this comment is")
+    section: Optional[str] = Field(default=None, description="Which section this relates to")
+
+
+class ReviewerSimulationReport(_AgentSchema):
+    """Reviewer simulation section of a single-call report."""
+    comments: List[ReportReviewerComment] = Field(default_factory=list, description="Simulated reviewer comments")
+    strengths: List[str] = Field(default_factory=list, description="Identified strengths")
+    weaknesses: List[str] = Field(default_factory=list, description="Identified weaknesses")
+
+
+class ReportActionItem(_AgentSchema):
+    """An action item in a single-call report."""
+    action: str = Field(description="What needs to be done")
+    priority: Priority = Field(default="medium", description="Priority level")
+    category: str = Field(description="Category of the action")
+    effort: Optional[str] = Field(default=None, description="Estimated effort (low/medium/high)")
+
+
+class VerdictReport(_AgentSchema):
+    """Verdict section of a single-call report."""
+    critical_issues: List[str] = Field(
+        default_factory=list,
+        description="Critical issues that must be addressed"
+    )
+    action_items: List[ReportActionItem] = Field(default_factory=list, description="Prioritized list of actions")
+    submission_readiness: str = Field(
+        default="Analysis Incomplete",
+        description="READY / ALMOST READY / NOT READY - with a short reason"
+    )
+    overall_verdict: str = Field(default="", description="Overall assessment of paper readiness")
+    confidence_score: float = Field(default=0, description="Confidence in the analysis 0-100")
+    reproducibility_score: float = Field(default=0, description="Estimated reproducibility score 0-100")
+
+
+class FullReport(_AgentSchema):
+    """Every verification section, produced by one LLM call."""
+    paper_analysis: PaperParserOutput = Field(default_factory=PaperParserOutput)
+    reproducibility: ReproducibilityReport = Field(default_factory=ReproducibilityReport)
+    experiment_evidence: ExperimentEvidenceReport = Field(default_factory=ExperimentEvidenceReport)
+    statistical_audit: StatisticalAuditOutput = Field(default_factory=StatisticalAuditOutput)
+    related_work: RelatedWorkReport = Field(default_factory=RelatedWorkReport)
+    reviewer_simulation: ReviewerSimulationReport = Field(default_factory=ReviewerSimulationReport)
+    verdict: VerdictReport = Field(default_factory=VerdictReport)
+
+
 # =====================
 # Input Schemas
 # =====================
 
-class ResearchInputs(BaseModel):
+class ResearchInputs(_AgentSchema):
     """Input configuration for the research verification system."""
     paper_path: Optional[str] = Field(default=None, description="Path to paper PDF or LaTeX file")
     paper_text: Optional[str] = Field(default=None, description="Raw paper text if already extracted")
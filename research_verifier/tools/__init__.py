@@ -1,22 +1,28 @@
 """Tools for parsing and analyzing research artifacts."""
 
-from .pdf_parser import parse_pdf, extract_text_from_pdf
+from .pdf_parser import parse_pdf, parse_pdfs, extract_text_from_pdf
 from .latex_parser import parse_latex, extract_sections
-from .bib_parser import parse_bibtex, get_citation_info
+from .bib_parser import parse_bibtex, get_citation_info, BibLazyIndex
 from .log_analyzer import (
     analyze_training_logs,
     extract_metrics_from_log,
     extract_reproducibility_info,
+    analyze_all_logs,
+    extract_all_reproducibility_info,
 )
 
 __all__ = [
     "parse_pdf",
+    "parse_pdfs",
     "extract_text_from_pdf",
     "parse_latex",
     "extract_sections",
     "parse_bibtex",
     "get_citation_info",
+    "BibLazyIndex",
     "analyze_training_logs",
     "extract_metrics_from_log",
     "extract_reproducibility_info",
+    "analyze_all_logs",
+    "extract_all_reproducibility_info",
 ]
@@ -2,13 +2,208 @@
 
 import os
 import re
-from typing import Dict, List, Optional
+import sys
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from ..cache import disk_memoize, stat_memoize
 
+# Bump when parsing/analysis output changes to invalidate cached results
+BIB_PARSER_VERSION = "v2"
+
+# Set to use bibtexparser (if installed) instead of the built-in parser.
+# Read once at import: the two parsers' results differ, so the choice is
+# part of the cache version and one parser's results are never served
+# for the other.
+_USE_BIBTEXPARSER_ENV = "VERITAS_USE_BIBTEXPARSER"
+_USE_BIBTEXPARSER = bool(os.environ.get(_USE_BIBTEXPARSER_ENV))
+_BIB_CACHE_VERSION = BIB_PARSER_VERSION + ("+bibtexparser" if _USE_BIBTEXPARSER else "")
+
+# Entry head: "@type{" or "@type(". The body runs to the matching close.
+_ENTRY_HEAD_RE = re.compile(r'@\s*(\w+)\s*([{(])')
+# One field: "name = value". The value is braced (one nested level),
+# quoted or bare; group "deep" matches empty before a value nested deeper,
+# which is then read with the brace scanner.
+_FIELD_RE = re.compile(
+    r'([A-Za-z][\w\-:.]*)\s*=\s*'
+    r'(?:\{(?P<braced>[^{}]*(?:\{[^{}]*\}[^{}]*)*)\}'
+    r'|"(?P<quoted>[^"{}]*)"'
+    r'|(?P<bare>[^,\s{}()"]+)'
+    r'|(?P<deep>)(?=[{"]))'
+)
+_DELIMITER_RES = {
+    '}': re.compile(r'[{}]'),
+    ')': re.compile(r'[{})]'),
+    '"': re.compile(r'[{}"]'),
+}
+
+# Entry types that carry no citation
+_NON_ENTRY_TYPES = frozenset({"comment", "string", "preamble"})
+
+# Fields kept from each entry; every other field is skipped unparsed
+_WANTED_FIELDS = frozenset({"title", "author", "year", "journal", "booktitle", "doi", "url"})
+
+
+def _find_close(text: str, pos: int, close: str) -> int:
+    """
+    Return the index of ``close`` at brace depth 0 from ``pos``, or len(text).
+    """
+    depth = 0
+    for m in _DELIMITER_RES[close].finditer(text, pos):
+        c = m.group()
+        if c == '{':
+            depth += 1
+        elif depth and c == '}':
+            depth -= 1
+        elif not depth:
+            if c == close:
+                return m.start()
+            if c == '}':
+                # Stray closing brace ends a "(" entry or quoted value early
+                return m.start()
+    return len(text)
+
+
+def _clean_value(value: str) -> str:
+    """Drop grouping braces and collapse whitespace (including newlines)."""
+    if '{' in value or '}' in value:
+        value = value.replace('{', '').replace('}', '')
+    return " ".join(value.split())
+
+
+def _parse_fields(text: str, start: int, end: int) -> Dict[str, str]:
+    """Read the wanted ``name = value`` pairs of one entry body."""
+    fields = {}
+    pos = start
+    while True:
+        m = _FIELD_RE.search(text, pos, end)
+        if not m:
+            return fields
+
+        name = m.group(1).lower()
+        pos = m.end()
+        if m.group("deep") is not None:
+            opener = text[pos]
+            value_end = min(_find_close(text, pos + 1, '}' if opener == '{' else '"'), end)
+            value = text[pos + 1:value_end]
+            pos = value_end + 1
+        else:
+            value = m.group("braced") or m.group("quoted") or m.group("bare") or ""
+
+        if name in _WANTED_FIELDS and name not in fields:
+            fields[name] = _clean_value(value)
+
+
+def _iter_entry_spans(text: str) -> Iterator[Tuple[str, str, int, int]]:
+    """
+    Yield ``(type, key, fields_start, body_end)`` for each citation entry.
+
+    Entry bodies are brace-matched but their fields are not read.
+    """
+    pos = 0
+    while True:
+        m = _ENTRY_HEAD_RE.search(text, pos)
+        if not m:
+            return
+
+        body_start = m.end()
+        body_end = _find_close(text, body_start, '}' if m.group(2) == '{' else ')')
+        pos = body_end + 1
+
+        entry_type = m.group(1).lower()
+        if entry_type in _NON_ENTRY_TYPES:
+            continue
+
+        comma = text.find(',', body_start, body_end)
+        if comma == -1:
+            yield entry_type, text[body_start:body_end].strip(), body_end, body_end
+        else:
+            yield entry_type, text[body_start:comma].strip(), comma + 1, body_end
+
+
+def _build_entry(text: str, entry_type: str, key: str, fields_start: int, body_end: int) -> Dict:
+    """
+    Read one entry's fields into the normalized entry dict.
+
+    Type, year and venue repeat across most of a bibliography, so they are
+    interned to share one string per distinct value.
+    """
+    fields = _parse_fields(text, fields_start, body_end)
+    return {
+        "key": key,
+        "type": sys.intern(entry_type),
+        "title": fields.get("title", ""),
+        "author": fields.get("author", ""),
+        "year": sys.intern(fields.get("year", "")),
+        "venue": sys.intern(fields.get("journal", fields.get("booktitle", ""))),
+        "doi": fields.get("doi", ""),
+        "url": fields.get("url", ""),
+    }
+
+
+def _fast_parse_bib(text: str) -> List[Dict]:
+    """
+    Parse BibTeX entries in one forward pass.
+
+    Only the fields listed in _WANTED_FIELDS are read; author names and LaTeX
+    markup are left as written (apart from grouping braces).
+    """
+    return [_build_entry(text, *span) for span in _iter_entry_spans(text)]
+
+
+class BibLazyIndex:
+    """
+    Key index over a .bib file whose entries are parsed on first access.
+
+    Opening the index only brace-matches entry boundaries; fields are read
+    when an entry is looked up, so single-key lookups in a large library skip
+    parsing the rest. Entries have the same shape as ``parse_bibtex`` ones.
+    When a key is defined twice, the first definition wins.
+
+    Usage:
+        index = BibLazyIndex("references.bib")
+        entry = index.get("vaswani2017attention")
+    """
+
+    def __init__(self, file_path: str):
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            self._text = f.read()
+
+        self._spans: Dict[str, Tuple[str, int, int]] = {}
+        for entry_type, key, fields_start, body_end in _iter_entry_spans(self._text):
+            self._spans.setdefault(key, (entry_type, fields_start, body_end))
+        self._entries: Dict[str, Dict] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._spans
+
+    def keys(self) -> List[str]:
+        """Return entry keys in file order."""
+        return list(self._spans)
+
+    def get(self, key: str, default: Optional[Dict] = None) -> Optional[Dict]:
+        """Return a copy of the entry for ``key``, parsing it if needed."""
+        entry = self._entries.get(key)
+        if entry is None:
+            span = self._spans.get(key)
+            if span is None:
+                return default
+            entry = self._entries[key] = _build_entry(self._text, span[0], key, span[1], span[2])
+        return dict(entry)
+
+
+@stat_memoize()
+@disk_memoize(version=_BIB_CACHE_VERSION)
 def parse_bibtex(file_path: str) -> Dict:
     """
     Parse a BibTeX file and extract citation information.
     
+    Uses the built-in single-pass parser. Set VERITAS_USE_BIBTEXPARSER=1
+    before the module is imported to use bibtexparser instead.
+    
     Args:
         file_path: Path to the .bib file
         
@@ -21,6 +216,9 @@ def parse_bibtex(file_path: str) -> Dict:
             "error_message": f"File not found: {file_path}"
         }
     
+    if not _USE_BIBTEXPARSER:
+        return parse_bibtex_manual(file_path)
+    
     try:
         import bibtexparser
         
@@ -58,46 +256,16 @@ def parse_bibtex(file_path: str) -> Dict:
 
 def parse_bibtex_manual(file_path: str) -> Dict:
     """
-    Manual BibTeX parsing fallback.
+    Parse a BibTeX file with the built-in parser.
     
-    Handles basic BibTeX structure without external dependencies.
+    Handles standard BibTeX structure (braced, quoted and bare values,
+    nested braces) without external dependencies.
     """
     try:
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
-        entries = []
-        
-        # Match BibTeX entries
-        entry_pattern = r'@(\w+)\{([^,]+),([^@]*)\}'
-        
-        for match in re.finditer(entry_pattern, content, re.DOTALL):
-            entry_type = match.group(1)
-            entry_key = match.group(2).strip()
-            entry_content = match.group(3)
-            
-            # Extract fields from entry content
-            entry = {
-                "key": entry_key,
-                "type": entry_type,
-            }
-            
-            # Common fields to extract
-            fields = ['title', 'author', 'year', 'journal', 'booktitle', 'doi', 'url']
-            
-            for field in fields:
-                pattern = rf'{field}\s*=\s*[\{{"](.*?)[\}}"]\s*[,\}}]'
-                field_match = re.search(pattern, entry_content, re.IGNORECASE | re.DOTALL)
-                if field_match:
-                    value = field_match.group(1).strip()
-                    # Clean up LaTeX-style braces
-                    value = re.sub(r'[\{\}]', '', value)
-                    entry[field] = value
-            
-            # Set venue from journal or booktitle
-            entry["venue"] = entry.get("journal", entry.get("booktitle", ""))
-            
-            entries.append(entry)
+        entries = _fast_parse_bib(content)
         
         return {
             "status": "success",
@@ -112,11 +280,48 @@ def parse_bibtex_manual(file_path: str) -> Dict:
         }
 
 
+# Common baseline papers/methods in ML/DL, in report order
+_COMMON_BASELINES = {
+    "ML": (
+        "ResNet", "VGG", "BERT", "GPT", "Transformer",
+        "LSTM", "GRU", "XGBoost", "Random Forest",
+        "Adam", "SGD", "Dropout", "BatchNorm"
+    ),
+    "NLP": (
+        "BERT", "GPT", "T5", "RoBERTa", "XLNet",
+        "Word2Vec", "GloVe", "ELMo", "Transformer"
+    ),
+    "CV": (
+        "ResNet", "VGG", "InceptionNet", "EfficientNet",
+        "YOLO", "Faster R-CNN", "U-Net", "ViT"
+    )
+}
+
+# (name, lowercased name) per domain, matched as substrings of cited text
+_BASELINE_NEEDLES = {
+    domain: tuple((name, name.lower()) for name in names)
+    for domain, names in _COMMON_BASELINES.items()
+}
+
+
+def _nth_counted(sorted_values: List[int], counts: Dict[int, int], n: int) -> int:
+    """Return the n-th (0-based) value of the multiset given as value counts."""
+    seen = 0
+    for value in sorted_values:
+        seen += counts[value]
+        if seen > n:
+            return value
+    return sorted_values[-1]
+
+
+@stat_memoize()
+@disk_memoize(version=_BIB_CACHE_VERSION)
 def get_citation_info(file_path: str) -> Dict:
     """
     Get comprehensive citation information from a BibTeX file.
     
-    Includes analysis of citation patterns and potential issues.
+    Includes analysis of citation patterns and potential issues. Results are
+    cached on disk by file content, so an unchanged .bib is analyzed once.
     """
     result = parse_bibtex(file_path)
     
@@ -125,57 +330,59 @@ def get_citation_info(file_path: str) -> Dict:
     
     entries = result["entries"]
     
-    # Analyze citations
-    years = []
-    venues = {}
-    authors = {}
+    # Analyze citations. Years are counted per distinct value, so the
+    # statistics below only walk the few distinct years, not every entry.
+    year_counts = Counter()
+    venues = Counter()
+    authors = Counter()
     
     for entry in entries:
         # Track years
         year = entry.get("year", "")
         if year and year.isdigit():
-            years.append(int(year))
+            year_counts[int(year)] += 1
         
         # Track venues
         venue = entry.get("venue", "Unknown")
         if venue:
-            venues[venue] = venues.get(venue, 0) + 1
+            venues[venue] += 1
         
         # Track authors
         author_str = entry.get("author", "")
         if author_str:
             # Simple author extraction (split by 'and')
-            for author in author_str.split(" and "):
-                author = author.strip()
-                if author:
-                    authors[author] = authors.get(author, 0) + 1
+            authors.update(
+                author for author in map(str.strip, author_str.split(" and ")) if author
+            )
     
     # Calculate statistics
     stats = {}
-    if years:
-        stats["year_range"] = f"{min(years)}-{max(years)}"
-        stats["median_year"] = sorted(years)[len(years) // 2]
-        stats["recent_citations"] = sum(1 for y in years if y >= 2020)
+    num_years = sum(year_counts.values())
+    if year_counts:
+        distinct_years = sorted(year_counts)
+        stats["year_range"] = f"{distinct_years[0]}-{distinct_years[-1]}"
+        stats["median_year"] = _nth_counted(distinct_years, year_counts, num_years // 2)
+        stats["recent_citations"] = sum(c for y, c in year_counts.items() if y >= 2020)
     
     # Identify potential issues
     issues = []
     
-    if years:
+    if year_counts:
         current_year = 2026  # Based on system time
-        old_citations = sum(1 for y in years if y < current_year - 10)
-        if old_citations > len(years) * 0.5:
-            issues.append(f"Over 50% of citations are more than 10 years old ({old_citations}/{len(years)})")
+        old_citations = sum(c for y, c in year_counts.items() if y < current_year - 10)
+        if old_citations > num_years * 0.5:
+            issues.append(f"Over 50% of citations are more than 10 years old ({old_citations}/{num_years})")
     
     if len(entries) < 10:
         issues.append(f"Low citation count ({len(entries)}). Consider adding more references.")
     
     # Check for self-citation patterns (if same author appears frequently)
-    max_author_count = max(authors.values()) if authors else 0
+    max_author_count = max(authors.values(), default=0)
     if max_author_count > len(entries) * 0.3:
         issues.append("Potential self-citation bias detected. Verify diverse set of references.")
     
     result["statistics"] = stats
-    result["top_venues"] = dict(sorted(venues.items(), key=lambda x: x[1], reverse=True)[:5])
+    result["top_venues"] = dict(venues.most_common(5))
     result["issues"] = issues
     
     return result
@@ -187,34 +394,12 @@ def find_standard_baselines(entries: List[Dict], domain: str = "ML") -> List[str
     
     This is a heuristic-based approach that looks for common baseline papers.
     """
-    # Common baseline papers/methods in ML/DL
-    common_baselines = {
-        "ML": [
-            "ResNet", "VGG", "BERT", "GPT", "Transformer",
-            "LSTM", "GRU", "XGBoost", "Random Forest",
-            "Adam", "SGD", "Dropout", "BatchNorm"
-        ],
-        "NLP": [
-            "BERT", "GPT", "T5", "RoBERTa", "XLNet",
-            "Word2Vec", "GloVe", "ELMo", "Transformer"
-        ],
-        "CV": [
-            "ResNet", "VGG", "InceptionNet", "EfficientNet",
-            "YOLO", "Faster R-CNN", "U-Net", "ViT"
-        ]
-    }
-    
-    baselines_to_check = common_baselines.get(domain, common_baselines["ML"])
+    baselines_to_check = _BASELINE_NEEDLES.get(domain, _BASELINE_NEEDLES["ML"])
     
     # Get all cited content
-    cited_text = " ".join([
+    cited_text = " ".join(
         str(e.get("title", "")) + " " + str(e.get("author", ""))
         for e in entries
-    ]).lower()
-    
-    missing = []
-    for baseline in baselines_to_check:
-        if baseline.lower() not in cited_text:
-            missing.append(baseline)
+    ).lower()
     
-    return missing
+    return [baseline for baseline, needle in baselines_to_check if needle not in cited_text]
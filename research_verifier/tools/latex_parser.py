@@ -4,6 +4,49 @@ import os
 import re
 from typing import Dict, List, Optional
 
+# Sectioning commands; the title sits in group 2
+_SECTION_RE = re.compile(r'\\(section|subsection|subsubsection)\*?\{([^}]*)\}')
+
+# Sections longer than this are truncated in the parse result
+_MAX_SECTION_CHARS = 2000
+
+# Control characters that mark headings in a single whole-document
+# conversion: "\x1e<n>\x1f<title>\x1f" stands for the n-th heading seen, so
+# the plain text can be cut into sections without converting each one
+# again. The numbering keeps titles aligned when a later pass removes a
+# heading (e.g. one inside a figure environment).
+_SECTION_START = '\x1e'
+_SECTION_END = '\x1f'
+_SECTION_MARK_RE = re.compile(r'\x1e\d+\x1f')
+
+# latex_to_text passes, applied in order. The comment pattern starts with
+# the literal "%" (checking for "\%" after it) so the scan can skip ahead.
+_LATEX_COMMENT_RE = re.compile(r'%(?<!\\%).*$', re.MULTILINE)
+_LATEX_FORMAT_RE = re.compile(r'\\(?:textbf|textit|emph|underline)\{([^}]*)\}')
+_LATEX_CITE_RE = re.compile(r'\\cite\{([^}]*)\}')
+_LATEX_REF_RE = re.compile(r'\\ref\{([^}]*)\}')
+_LATEX_FIGURE_ENV_RE = re.compile(r'\\begin\{figure\}.*?\\end\{figure\}', re.DOTALL)
+_LATEX_TABLE_ENV_RE = re.compile(r'\\begin\{table\}.*?\\end\{table\}', re.DOTALL)
+_LATEX_MATH_RES = tuple(re.compile(p, re.DOTALL) for p in (
+    r'\$\$.*?\$\$',
+    r'\\begin\{equation\}.*?\\end\{equation\}',
+    r'\\begin\{align\*?\}.*?\\end\{align\*?\}',
+))
+_LATEX_COMMAND_ARG_RE = re.compile(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{[^}]*\}')
+_LATEX_COMMAND_RE = re.compile(r'\\[a-zA-Z]+\*?')
+
+# Whitespace cleanup patterns start with a literal run, which the regex
+# engine can search for directly instead of trying every newline or space
+_BLANK_LINES_RE = re.compile(r'\n\n\n+')
+_SPACE_RUN_RE = re.compile(r'  +')
+
+_BRACE_RE = re.compile(r'[{}]')
+
+# Caption and label inside one figure/table environment, searched
+# separately so their order does not matter
+_CAPTION_RE = re.compile(r'\\caption\{([^}]*)\}')
+_LABEL_RE = re.compile(r'\\label\{([^}]*)\}')
+
 
 def parse_latex(file_path: str) -> Dict:
     """
@@ -34,16 +77,17 @@ def parse_latex(file_path: str) -> Dict:
         
         document_content = doc_match.group(1) if doc_match else content
         
-        # Clean LaTeX and convert to plain text
-        plain_text = latex_to_text(document_content)
+        # Convert to plain text once, with heading markers, and cut the
+        # sections out of that instead of converting each one again
+        titles = []
+        marked_text = _convert_latex(document_content, titles)
+        plain_text = _clean_whitespace(_strip_section_marks(marked_text)).strip()
+        sections = _split_sections(marked_text, titles)
         
         # Extract metadata
         title = extract_latex_command(content, 'title')
         abstract = extract_latex_environment(content, 'abstract')
         
-        # Extract sections
-        sections = extract_sections(content)
-        
         return {
             "status": "success",
             "title": title,
@@ -67,49 +111,129 @@ def latex_to_text(latex_content: str) -> str:
     This is a simplified conversion that handles common cases.
     For full conversion, consider using pylatexenc.
     """
+    return _clean_whitespace(_convert_latex(latex_content)).strip()
+
+
+def _convert_latex(latex_content: str, titles: Optional[List[str]] = None) -> str:
+    """
+    Run the latex_to_text passes up to, not including, whitespace cleanup.
+    
+    When ``titles`` is given, each heading's title is appended to it and the
+    heading is wrapped in section marks (see _split_sections). Callers drop
+    the marks, or cut at them, before whitespace cleanup, so a mark never
+    splits a run of blank lines or spaces.
+    """
     text = latex_content
     
     # Remove comments
-    text = re.sub(r'(?<!\\)%.*$', '', text, flags=re.MULTILINE)
+    text = _LATEX_COMMENT_RE.sub('', text)
     
     # Remove common LaTeX commands but keep their content
-    text = re.sub(r'\\(?:textbf|textit|emph|underline)\{([^}]*)\}', r'\1', text)
-    text = re.sub(r'\\(?:section|subsection|subsubsection)\*?\{([^}]*)\}', r'\n\n\1\n', text)
+    text = _LATEX_FORMAT_RE.sub(r'\1', text)
+    if titles is None:
+        text = _SECTION_RE.sub(r'\n\n\2\n', text)
+    else:
+        if _SECTION_START in text or _SECTION_END in text:
+            text = text.replace(_SECTION_START, '').replace(_SECTION_END, '')
+        
+        def mark_heading(match: re.Match) -> str:
+            titles.append(match.group(2))
+            return f'\n\n{_SECTION_START}{len(titles) - 1}{_SECTION_END}{match.group(2)}{_SECTION_END}\n'
+        
+        text = _SECTION_RE.sub(mark_heading, text)
     
     # Remove citations (keep the marker)
-    text = re.sub(r'\\cite\{([^}]*)\}', r'[CITE: \1]', text)
+    text = _LATEX_CITE_RE.sub(r'[CITE: \1]', text)
     
     # Remove references
-    text = re.sub(r'\\ref\{([^}]*)\}', r'[REF: \1]', text)
+    text = _LATEX_REF_RE.sub(r'[REF: \1]', text)
     
     # Remove figure/table environments but note them
-    text = re.sub(r'\\begin\{figure\}.*?\\end\{figure\}', '[FIGURE]', text, flags=re.DOTALL)
-    text = re.sub(r'\\begin\{table\}.*?\\end\{table\}', '[TABLE]', text, flags=re.DOTALL)
+    text = _LATEX_FIGURE_ENV_RE.sub('[FIGURE]', text)
+    text = _LATEX_TABLE_ENV_RE.sub('[TABLE]', text)
     
     # Remove math environments but keep inline math
-    text = re.sub(r'\$\$.*?\$\$', '[EQUATION]', text, flags=re.DOTALL)
-    text = re.sub(r'\\begin\{equation\}.*?\\end\{equation\}', '[EQUATION]', text, flags=re.DOTALL)
-    text = re.sub(r'\\begin\{align\*?\}.*?\\end\{align\*?\}', '[EQUATION]', text, flags=re.DOTALL)
+    for pattern in _LATEX_MATH_RES:
+        text = pattern.sub('[EQUATION]', text)
     
     # Remove remaining LaTeX commands
-    text = re.sub(r'\\[a-zA-Z]+\*?(?:\[[^\]]*\])?\{[^}]*\}', '', text)
-    text = re.sub(r'\\[a-zA-Z]+\*?', '', text)
+    text = _LATEX_COMMAND_ARG_RE.sub('', text)
+    text = _LATEX_COMMAND_RE.sub('', text)
     
     # Clean up braces
-    text = re.sub(r'[{}]', '', text)
+    return text.replace('{', '').replace('}', '')
+
+
+def _clean_whitespace(text: str) -> str:
+    """Collapse blank-line and space runs left by the conversion passes."""
+    text = _BLANK_LINES_RE.sub('\n\n', text)
+    if '\t' in text:
+        text = text.replace('\t', ' ')
+    return _SPACE_RUN_RE.sub(' ', text)
+
+
+def _strip_section_marks(marked_text: str) -> str:
+    """Drop the section marks, giving the same text as an unmarked conversion."""
+    return _SECTION_MARK_RE.sub('', marked_text).replace(_SECTION_END, '')
+
+
+def _split_sections(marked_text: str, titles: List[str]) -> Dict[str, str]:
+    """
+    Cut a marked conversion into sections keyed by heading title.
+    
+    Each section's text runs from its heading to the next heading (of any
+    level). A title that appears more than once keeps its first non-empty
+    body.
+    """
+    sections = {}
     
-    # Clean up whitespace
-    text = re.sub(r'\n{3,}', '\n\n', text)
-    text = re.sub(r'[ \t]+', ' ', text)
+    for part in marked_text.split(_SECTION_START)[1:]:
+        index, sep, rest = part.partition(_SECTION_END)
+        if not sep or not index.isdigit():
+            continue
+        
+        title = titles[int(index)].strip()
+        if not title or title in sections:
+            continue
+        
+        # Skip the converted title; a pass that consumed the closing mark
+        # leaves nothing reliable to cut, so the section is dropped
+        _, sep, body = rest.partition(_SECTION_END)
+        body = _clean_whitespace(body).strip()
+        if sep and body:
+            sections[title] = body[:_MAX_SECTION_CHARS]
     
-    return text.strip()
+    return sections
+
+
+def _find_matching_brace(text: str, open_idx: int) -> int:
+    """Return the index of the brace closing the one at ``open_idx``, or -1."""
+    depth = 0
+    for match in _BRACE_RE.finditer(text, open_idx):
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
 
 
 def extract_latex_command(content: str, command: str) -> Optional[str]:
-    """Extract content of a LaTeX command like \\title{...}."""
-    pattern = rf'\\{command}\{{([^}}]*)\}}'
-    match = re.search(pattern, content)
-    return match.group(1).strip() if match else None
+    """Extract content of a LaTeX command like \\title{...}, keeping nested braces."""
+    start = content.find(f'\\{command}{{')
+    if start == -1:
+        return None
+    
+    open_idx = start + len(command) + 1
+    close_idx = _find_matching_brace(content, open_idx)
+    if close_idx == -1:
+        # Unbalanced: fall back to the text up to the first closing brace
+        close_idx = content.find('}', open_idx)
+        if close_idx == -1:
+            return None
+    
+    return content[open_idx + 1:close_idx].strip()
 
 
 def extract_latex_environment(content: str, environment: str) -> Optional[str]:
@@ -122,27 +246,16 @@ def extract_latex_environment(content: str, environment: str) -> Optional[str]:
 
 
 def extract_sections(content: str) -> Dict[str, str]:
-    """Extract all sections from a LaTeX document."""
-    sections = {}
-    
-    # Find all section commands
-    section_pattern = r'\\(section|subsection|subsubsection)\*?\{([^}]*)\}'
-    
-    # Split content by sections
-    parts = re.split(section_pattern, content)
-    
-    current_section = None
-    for i, part in enumerate(parts):
-        if part in ['section', 'subsection', 'subsubsection']:
-            # Next part is the section title
-            if i + 1 < len(parts):
-                current_section = parts[i + 1].strip()
-        elif current_section and part.strip():
-            # This is section content
-            if current_section not in sections:
-                sections[current_section] = latex_to_text(part)[:2000]
+    """
+    Extract all sections from a LaTeX document.
     
-    return sections
+    Each section's text runs from its heading to the next sectioning command
+    (of any level). A title that appears more than once keeps its first
+    non-empty body. The document is converted to plain text once and then
+    cut at the headings.
+    """
+    titles = []
+    return _split_sections(_convert_latex(content, titles), titles)
 
 
 def extract_citations(content: str) -> List[str]:
@@ -162,23 +275,25 @@ def extract_citations(content: str) -> List[str]:
 
 
 def extract_figures_and_tables(content: str) -> Dict[str, List[Dict]]:
-    """Extract figure and table information from LaTeX."""
+    """
+    Extract figure and table information from LaTeX.
+    
+    Environments without a caption are skipped; a missing label is "".
+    """
     result = {"figures": [], "tables": []}
     
-    # Extract figures
-    figure_pattern = r'\\begin\{figure\}.*?\\caption\{([^}]*)\}.*?\\label\{([^}]*)\}.*?\\end\{figure\}'
-    for match in re.finditer(figure_pattern, content, re.DOTALL):
-        result["figures"].append({
-            "caption": match.group(1).strip(),
-            "label": match.group(2).strip()
-        })
-    
-    # Extract tables
-    table_pattern = r'\\begin\{table\}.*?\\caption\{([^}]*)\}.*?\\label\{([^}]*)\}.*?\\end\{table\}'
-    for match in re.finditer(table_pattern, content, re.DOTALL):
-        result["tables"].append({
-            "caption": match.group(1).strip(),
-            "label": match.group(2).strip()
-        })
+    # Each environment is matched once; caption and label are then looked up
+    # inside it, so a figure without a label can't pair with a later one's
+    for kind, env_re in (("figures", _LATEX_FIGURE_ENV_RE), ("tables", _LATEX_TABLE_ENV_RE)):
+        for match in env_re.finditer(content):
+            body = match.group()
+            caption = _CAPTION_RE.search(body)
+            if not caption:
+                continue
+            label = _LABEL_RE.search(body)
+            result[kind].append({
+                "caption": caption.group(1).strip(),
+                "label": label.group(1).strip() if label else ""
+            })
     
     return result
@@ -3,10 +3,103 @@
 import os
 import re
 import csv
-from typing import Dict, List, Optional, Any
+import json
+import mmap
+import contextlib
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from pathlib import Path
 
+from ..cache import stat_memoize
+from ..utils.helpers import map_in_processes, map_in_threads
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; scalar math is used instead
+    np = None
+
+# orjson is an optional speedup. It rejects NaN/Infinity literals, which
+# json accepts, so those inputs are retried with json. Integers beyond 64
+# bits come back as floats rather than ints, which only matters for
+# counters far larger than any training log holds.
+try:
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+# Seed statements. The specific forms (np.random.seed(42),
+# torch.manual_seed(42), tf.random.set_seed(42), SEED = 42) all contain
+# "seed" followed by separators and the value, so this one pattern finds
+# every seed they would.
+_SEED_RE = re.compile(r'(?i)(?:random\.)?seed\s*[:=(\s]+(\d+)')
+
+# Hardware references in scripts, as three alternatives inside a lookahead
+# so a device word inside torch.device("cuda") is still found on its own.
+# The leading class lists every possible first letter, so most positions
+# fail on one check.
+_HARDWARE_RE = re.compile(
+    r'(?=[acdgntv])'
+    r'(?=(?P<hw_word>cuda|gpu|cpu|tpu|device)'
+    r'|(?P<hw_device>torch\.device\(["\'](?P<hw_device_name>[^"\']+)["\']\))'
+    r'|(?P<hw_model>nvidia|geforce|tesla|v100|a100))',
+    re.IGNORECASE
+)
+
+# Common hyperparameter assignments, one named group per key (in report
+# order). No two alternatives can start at the same position, so the first
+# match per group is the same one a separate search would find.
+_HYPERPARAM_RE = re.compile(
+    r'(?=[bdehln])'
+    r'(?=(?:learning.?rate|lr)\s*=\s*(?P<learning_rate>[0-9\.e\-]+)'
+    r'|(?:batch.?size)\s*=\s*(?P<batch_size>\d+)'
+    r'|(?:epochs?|num.?epochs?)\s*=\s*(?P<epochs>\d+)'
+    r'|(?:hidden.?size|hidden.?dim)\s*=\s*(?P<hidden_size>\d+)'
+    r'|(?:dropout)\s*=\s*(?P<dropout>[0-9\.]+))',
+    re.IGNORECASE
+)
+_HYPERPARAM_KEYS = ("learning_rate", "batch_size", "epochs", "hidden_size", "dropout")
+
+_IMPORT_RE = re.compile(r'^(?:from|import)\s+([a-zA-Z0-9_]+)', re.MULTILINE)
+
+# Labelled values in plain-text training logs. "split" is only recorded
+# as a prefix for the metrics in _SPLIT_METRICS. The leading lookahead
+# lists every possible first letter, so most positions fail on one check.
+_TEXT_METRIC_RE = re.compile(
+    r'(?=[aeflprstv])'
+    r'(?:(?P<split>train|val|test|eval)[_\s]*)?'
+    r'(?P<metric>loss|accuracy|acc|f1|precision|recall|auc|epoch|step|lr|learning.?rate)'
+    r'[:\s=]+(?P<value>[0-9]+\.?[0-9]*)',
+    re.IGNORECASE
+)
+_SPLIT_METRICS = frozenset({"loss", "accuracy", "acc", "f1"})
+
+# Text logs are scanned as memory-mapped bytes, so these are bytes twins
+# of the str patterns (all their literals are ASCII). Their "." and
+# case-insensitive matching only agree with the str patterns on ASCII
+# input, and their \s also misses the ASCII separators \x1c-\x1f, which
+# str \s matches; logs with any of those bytes are decoded and scanned
+# as str.
+_TEXT_METRIC_BYTES_RE = re.compile(
+    _TEXT_METRIC_RE.pattern.encode(), _TEXT_METRIC_RE.flags & ~re.UNICODE
+)
+_SEED_BYTES_RE = re.compile(_SEED_RE.pattern.encode())
+_STR_SCAN_BYTES_RE = re.compile(rb'[\x1c-\x1f\x80-\xff]')
+
+# Below this many values the NumPy call overhead outweighs the vectorized
+# variance (measured crossover is around 100)
+_NUMPY_MIN_VALUES = 128
+
+# Batches whose files add up to at least this many bytes are analyzed in
+# the shared worker pool (regex work holds the GIL); smaller ones use
+# threads, where shipping paths and results between processes (and, on
+# first use, starting the workers) would cost more than it saves
+_PROCESS_MIN_BYTES = 8 << 20
+
+# Streaming seed scans carry this many trailing chars into the next chunk,
+# so a seed statement split across a chunk boundary is still seen whole
+_SEED_OVERLAP = 256
+
+
+@stat_memoize()
 def analyze_training_logs(file_path: str) -> Dict:
     """
     Analyze training logs to extract metrics and identify issues.
@@ -33,36 +126,69 @@ def analyze_training_logs(file_path: str) -> Dict:
         return analyze_text_log(file_path)
 
 
+def _csv_metrics_stream(file_path: str) -> Tuple[int, List[str], Dict[str, Dict]]:
+    """Per-column stats for a CSV log, reading rows one at a time."""
+    with open(file_path, 'r', encoding='utf-8', errors='ignore', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0, [], {}
+        
+        # Same column resolution as csv.DictReader: a repeated name keeps
+        # its first position but reads the last column with that name
+        index = {name: i for i, name in enumerate(header)}
+        columns = {name: [] for name in index}
+        num_rows = 0
+        first_row_len = None
+        
+        for row in reader:
+            if not row:
+                continue
+            num_rows += 1
+            if first_row_len is None:
+                first_row_len = len(row)
+            width = len(row)
+            for name, i in index.items():
+                if i < width:
+                    try:
+                        columns[name].append(float(row[i]))
+                    except ValueError:
+                        continue
+    
+    if not num_rows:
+        return 0, [], {}
+    
+    column_names = list(index)
+    if first_row_len > len(header):
+        # csv.DictReader files surplus fields under the key None
+        column_names.append(None)
+    
+    # Plain passes over each column's list (NumPy for long variances, see
+    # calculate_variance). They take about a tenth of the time; the rest is
+    # csv and float() per cell, so a compiled per-column kernel would not
+    # repay the array conversion and an extra dependency.
+    metrics = {}
+    for key, values in columns.items():
+        if values:
+            metrics[key] = {
+                "min": min(values),
+                "max": max(values),
+                "final": values[-1],
+                "count": len(values),
+                "variance": calculate_variance(values) if len(values) > 1 else 0
+            }
+    
+    return num_rows, column_names, metrics
+
+
 def analyze_csv_log(file_path: str) -> Dict:
     """Analyze a CSV log file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        num_rows, column_names, metrics = _csv_metrics_stream(file_path)
         
-        if not rows:
+        if not num_rows:
             return {"status": "success", "metrics": {}, "issues": ["Empty log file"]}
         
-        # Extract numeric columns as metrics
-        metrics = {}
-        for key in rows[0].keys():
-            values = []
-            for row in rows:
-                try:
-                    val = float(row.get(key, ''))
-                    values.append(val)
-                except (ValueError, TypeError):
-                    continue
-            
-            if values:
-                metrics[key] = {
-                    "min": min(values),
-                    "max": max(values),
-                    "final": values[-1],
-                    "count": len(values),
-                    "variance": calculate_variance(values) if len(values) > 1 else 0
-                }
-        
         # Check for issues
         issues = []
         
@@ -82,8 +208,8 @@ def analyze_csv_log(file_path: str) -> Dict:
         return {
             "status": "success",
             "metrics": metrics,
-            "num_rows": len(rows),
-            "columns": list(rows[0].keys()),
+            "num_rows": num_rows,
+            "columns": column_names,
             "issues": issues
         }
         
@@ -94,17 +220,26 @@ def analyze_csv_log(file_path: str) -> Dict:
         }
 
 
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, falling back to json."""
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(text)
+        except ValueError:
+            pass
+    return json.loads(text)
+
+
 def analyze_json_log(file_path: str) -> Dict:
     """Analyze a JSON log file."""
     try:
-        import json
-        
         with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
             content = f.read()
         
-        # Try to parse as JSON lines or single JSON
+        # Try to parse as JSON lines or single JSON. For JSON lines the
+        # whole-document attempt stops at the end of the first record.
         try:
-            data = json.loads(content)
+            data = _json_loads(content)
             if isinstance(data, list):
                 rows = data
             else:
@@ -113,8 +248,10 @@ def analyze_json_log(file_path: str) -> Dict:
             # Try JSON lines format
             rows = []
             for line in content.strip().split('\n'):
+                if not line.strip():
+                    continue
                 try:
-                    rows.append(json.loads(line))
+                    rows.append(_json_loads(line))
                 except json.JSONDecodeError:
                     continue
         
@@ -154,40 +291,67 @@ def analyze_json_log(file_path: str) -> Dict:
         }
 
 
+@contextlib.contextmanager
+def _map_file(file_path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Map a file read-only, so regexes scan it without reading it into memory."""
+    with open(file_path, 'rb') as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            yield b''
+            return
+        with mapped:
+            yield mapped
+
+
+def _as_str(text: Union[str, bytes]) -> str:
+    """Decode a regex group from the bytes scan; str groups pass through."""
+    return text.decode('utf-8', errors='ignore') if isinstance(text, bytes) else text
+
+
 def analyze_text_log(file_path: str) -> Dict:
     """Analyze a plain text log file."""
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
-        
-        # Extract numeric values with labels
+        # Extract numeric values with labels. One scan covers both the bare
+        # "loss: 0.5" form and the split-prefixed "val_loss: 0.5" form; a
+        # prefixed match is recorded under both keys. Only the matched
+        # labels are decoded; values are parsed straight from bytes.
         metrics = {}
-        
-        # Common patterns in training logs
-        patterns = [
-            r'(?i)(loss|accuracy|acc|f1|precision|recall|auc|epoch|step|lr|learning.?rate)[:\s=]+([0-9]+\.?[0-9]*)',
-            r'(?i)(train|val|test|eval)[_\s]*(loss|accuracy|acc|f1)[:\s=]+([0-9]+\.?[0-9]*)',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, content):
-                groups = match.groups()
-                if len(groups) == 2:
-                    key, value = groups
-                elif len(groups) == 3:
-                    key = f"{groups[0]}_{groups[1]}"
-                    value = groups[2]
-                else:
-                    continue
-                
-                key = key.lower().strip()
+        split_metrics = {}
+        # (split, metric) bytes -> (metric key, split key or None); labels
+        # repeat on every line, so each distinct one is decoded once
+        label_keys = {}
+        
+        with _map_file(file_path) as content:
+            metric_re, seed_re = _TEXT_METRIC_BYTES_RE, _SEED_BYTES_RE
+            if _STR_SCAN_BYTES_RE.search(content):
+                # Unicode whitespace (e.g. tqdm's NBSP), the \x1c-\x1f
+                # separators and case folding need the str patterns
+                content = content[:].decode('utf-8', errors='ignore')
+                metric_re, seed_re = _TEXT_METRIC_RE, _SEED_RE
+            
+            for split, metric, value in metric_re.findall(content):
                 try:
                     val = float(value)
-                    if key not in metrics:
-                        metrics[key] = []
-                    metrics[key].append(val)
                 except ValueError:
                     continue
+                
+                keys = label_keys.get((split, metric))
+                if keys is None:
+                    name = _as_str(metric).lower()
+                    split_key = None
+                    if split and name in _SPLIT_METRICS:
+                        split_key = f"{_as_str(split)}_{name}".lower().strip()
+                    keys = label_keys[(split, metric)] = (name.strip(), split_key)
+                
+                metrics.setdefault(keys[0], []).append(val)
+                if keys[1] is not None:
+                    split_metrics.setdefault(keys[1], []).append(val)
+            
+            # Extract any seed information
+            seed_info = list({_as_str(seed) for seed in seed_re.findall(content)})
+        
+        metrics.update(split_metrics)
         
         # Summarize metrics
         metric_summary = {}
@@ -200,9 +364,6 @@ def analyze_text_log(file_path: str) -> Dict:
                     "count": len(values)
                 }
         
-        # Extract any seed information
-        seed_info = extract_seeds_from_text(content)
-        
         return {
             "status": "success",
             "metrics": metric_summary,
@@ -217,6 +378,40 @@ def analyze_text_log(file_path: str) -> Dict:
         }
 
 
+def _map_paths(func, paths: List[str]) -> List[Dict]:
+    """Apply a single-path analyzer to ``paths`` in input order, in parallel."""
+    total_bytes = 0
+    for path in paths:
+        try:
+            total_bytes += os.stat(path).st_size
+        except OSError:
+            continue
+    
+    if len(paths) > 1 and total_bytes >= _PROCESS_MIN_BYTES:
+        return map_in_processes(func, paths)
+    return map_in_threads(func, paths)
+
+
+def analyze_all_logs(file_paths: List[str]) -> List[Dict]:
+    """
+    Run ``analyze_training_logs`` over several files.
+    
+    Large batches are spread across CPU cores. Returns one result per path,
+    in input order.
+    """
+    return _map_paths(analyze_training_logs, file_paths)
+
+
+def extract_all_reproducibility_info(script_paths: List[str]) -> List[Dict]:
+    """
+    Run ``extract_reproducibility_info`` over several scripts.
+    
+    Large batches are spread across CPU cores. Returns one result per path,
+    in input order.
+    """
+    return _map_paths(extract_reproducibility_info, script_paths)
+
+
 def extract_metrics_from_log(file_path: str) -> Dict[str, Any]:
     """
     Extract key metrics from a log file for comparison with paper claims.
@@ -238,6 +433,7 @@ def extract_metrics_from_log(file_path: str) -> Dict[str, Any]:
     }
 
 
+@stat_memoize()
 def extract_reproducibility_info(script_path: str) -> Dict:
     """
     Extract reproducibility information from a Python script.
@@ -271,38 +467,34 @@ def extract_reproducibility_info(script_path: str) -> Dict:
         result["seeds"] = extract_seeds_from_text(content)
         
         # Extract imports
-        import_pattern = r'^(?:from|import)\s+([a-zA-Z0-9_]+)'
-        result["imports"] = list(set(re.findall(import_pattern, content, re.MULTILINE)))
-        
-        # Look for hardware specifications
-        hardware_patterns = [
-            r'(?i)(cuda|gpu|cpu|tpu|device)',
-            r'(?i)torch\.device\(["\']([^"\']+)["\']\)',
-            r'(?i)nvidia|geforce|tesla|v100|a100'
-        ]
-        
-        for pattern in hardware_patterns:
-            matches = re.findall(pattern, content)
-            result["hardware_refs"].extend(matches)
-        
-        result["hardware_refs"] = list(set(result["hardware_refs"]))
-        
-        # Extract common hyperparameters
-        hyperparam_patterns = [
-            (r'(?i)(learning.?rate|lr)\s*=\s*([0-9\.e\-]+)', 'learning_rate'),
-            (r'(?i)(batch.?size)\s*=\s*(\d+)', 'batch_size'),
-            (r'(?i)(epochs?|num.?epochs?)\s*=\s*(\d+)', 'epochs'),
-            (r'(?i)(hidden.?size|hidden.?dim)\s*=\s*(\d+)', 'hidden_size'),
-            (r'(?i)(dropout)\s*=\s*([0-9\.]+)', 'dropout'),
-        ]
-        
-        for pattern, key in hyperparam_patterns:
-            match = re.search(pattern, content)
-            if match:
+        result["imports"] = list(set(_IMPORT_RE.findall(content)))
+        
+        # Look for hardware specifications. Each alternative keeps the
+        # non-overlapping matches it would get from its own scan.
+        hardware_refs = set()
+        group_ends = dict.fromkeys(("hw_word", "hw_device", "hw_model"), 0)
+        for match in _HARDWARE_RE.finditer(content):
+            group = match.lastgroup
+            if match.start() < group_ends[group]:
+                continue
+            group_ends[group] = match.end(group)
+            hardware_refs.add(match.group("hw_device_name" if group == "hw_device" else group))
+        
+        result["hardware_refs"] = list(hardware_refs)
+        
+        # Extract common hyperparameters (first assignment of each)
+        found = {}
+        for match in _HYPERPARAM_RE.finditer(content):
+            found.setdefault(match.lastgroup, match.group(match.lastgroup))
+            if len(found) == len(_HYPERPARAM_KEYS):
+                break
+        
+        for key in _HYPERPARAM_KEYS:
+            if key in found:
                 try:
-                    result["hyperparameters"][key] = float(match.group(2))
+                    result["hyperparameters"][key] = float(found[key])
                 except ValueError:
-                    result["hyperparameters"][key] = match.group(2)
+                    result["hyperparameters"][key] = found[key]
         
         # Identify missing reproducibility items
         if not result["seeds"]:
@@ -328,21 +520,39 @@ def extract_reproducibility_info(script_path: str) -> Dict:
 
 def extract_seeds_from_text(content: str) -> List[str]:
     """Extract random seed information from text content."""
-    seeds = []
+    return list(set(_SEED_RE.findall(content)))
+
+
+def extract_seeds_from_text_iter(chunks: Iterable[str]) -> List[str]:
+    """
+    Extract random seed information from text arriving in chunks.
+    
+    Memory use is bounded by the chunk size rather than the total length.
+    Each chunk is scanned together with the tail of the previous one; only
+    matches starting before that tail are taken, and the tail is rescanned
+    with the next chunk, so a seed cut off at a boundary is never recorded
+    half-read.
+    
+    Args:
+        chunks: Iterable of consecutive text pieces (e.g. file reads)
+        
+    Returns:
+        List of unique seed values
+    """
+    seeds = set()
+    tail = ""
     
-    seed_patterns = [
-        r'(?i)(?:random\.)?seed\s*[:=(\s]+(\d+)',
-        r'(?i)np\.random\.seed\s*\((\d+)\)',
-        r'(?i)torch\.manual_seed\s*\((\d+)\)',
-        r'(?i)tf\.random\.set_seed\s*\((\d+)\)',
-        r'(?i)SEED\s*=\s*(\d+)',
-    ]
+    for chunk in chunks:
+        buffer = tail + chunk
+        cut = max(len(buffer) - _SEED_OVERLAP, 0)
+        for match in _SEED_RE.finditer(buffer):
+            if match.start() < cut:
+                seeds.add(match.group(1))
+        tail = buffer[cut:]
     
-    for pattern in seed_patterns:
-        matches = re.findall(pattern, content)
-        seeds.extend(matches)
+    seeds.update(_SEED_RE.findall(tail))
     
-    return list(set(seeds))
+    return list(seeds)
 
 
 def calculate_variance(values: List[float]) -> float:
@@ -350,6 +560,9 @@ def calculate_variance(values: List[float]) -> float:
     if len(values) < 2:
         return 0.0
     
+    if np is not None and len(values) >= _NUMPY_MIN_VALUES:
+        return float(np.var(np.asarray(values, dtype=np.float64), ddof=1))
+    
     mean = sum(values) / len(values)
     variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
     return variance
@@ -375,23 +588,27 @@ def check_result_consistency(
     matched = []
     unverified = []
     
+    # Lowercase every log key once instead of once per reported metric
+    log_index = [(log_key.lower(), log_key, log_val) for log_key, log_val in log_results.items()]
+    
     for metric, reported_value in reported_results.items():
-        # Try to find matching metric in logs (case-insensitive)
+        # Try to find matching metric in logs (case-insensitive); the first
+        # log key that contains, or is contained in, the metric name wins
+        metric_lower = metric.lower()
         log_value = None
         matched_key = None
         
-        for log_key, log_val in log_results.items():
-            if metric.lower() in log_key.lower() or log_key.lower() in metric.lower():
+        for log_lower, log_key, log_val in log_index:
+            if metric_lower in log_lower or log_lower in metric_lower:
                 log_value = log_val
                 matched_key = log_key
                 break
         
         if log_value is not None:
             # Check consistency
+            diff_ratio = abs(reported_value - log_value)
             if reported_value != 0:
-                diff_ratio = abs(reported_value - log_value) / abs(reported_value)
-            else:
-                diff_ratio = abs(reported_value - log_value)
+                diff_ratio /= abs(reported_value)
             
             if diff_ratio > tolerance:
                 inconsistencies.append({
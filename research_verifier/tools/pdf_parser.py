@@ -1,9 +1,160 @@
 """PDF parsing utilities for research papers."""
 
 import os
-from typing import Dict, List, Optional
+import mmap
+from typing import Dict, List, Optional, Tuple
 import re
 
+from ..cache import stat_memoize
+from ..utils.helpers import map_in_processes
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # pypdfium2 is optional; PyPDF2 is used instead
+    pdfium = None
+
+# PyPDF2 copies a file opened by path into memory; files at least this
+# large are handed to it as a read-only memory map instead
+_MMAP_MIN_BYTES = 32 << 20
+
+# Section headings: a line starting with an optional top-level number
+# ("3", "3.") and a known heading word; numbered subsections ("4.3
+# Results") stay inside their section. Each named group is the section it
+# opens; "other" headings only end the section before them. Apart from the
+# abstract, which often runs into its first sentence, the word must end
+# the line or be followed by ":", "." or a dash, so a body line such as
+# "Results in Table 2 show ..." is not taken for a heading.
+_SECTION_HEAD_RE = re.compile(
+    r'^[ \t]*(?:\d+\.?[ \t]*)?'
+    r'(?:(?P<abstract>abstract)\b[ \t]*[:.\u2013\u2014-]?'
+    r'|(?:(?P<introduction>introduction)'
+    r'|(?P<related_work>related[ \t]*works?)'
+    r'|(?P<methodology>methods?|methodology|approach)'
+    r'|(?P<experiments>(?:experiment|evaluation|result)s?)'
+    r'|(?P<conclusion>(?:conclusion|summary)s?)'
+    r'|(?P<other>background|discussion|analysis|keywords|references?'
+    r'|acknowledge?ments?|appendix|appendices))'
+    r'\b[ \t]*(?:[:.\u2013\u2014-]|$))',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Sections longer than this are truncated in the parse result
+_MAX_SECTION_CHARS = 2000
+
+# Abstracts longer than this are truncated
+_MAX_ABSTRACT_CHARS = 1500
+
+# Lines that start like a section heading rather than a title
+_TITLE_SKIP_RE = re.compile(r'^(?:abstract|introduction|\d+\.)', re.IGNORECASE)
+
+# Title candidates are taken from this many lines after leading whitespace
+_TITLE_SEARCH_LINES = 10
+_LEADING_SPACE_RE = re.compile(r'\s*')
+
+# The abstract runs from the first "abstract" heading word to the first
+# end marker after it. As a single lazy DOTALL pattern, a paper without any
+# end marker re-scanned the rest of the text from every later "abstract";
+# split in two, each part is one forward search.
+_ABSTRACT_RE = re.compile(
+    r'(?i)\babstract\b[:\s]*\n?(.*?)(?=\n\s*(?:\d*\.?\s*introduction|keywords|1\s|\n\n))',
+    re.DOTALL
+)
+_ABSTRACT_START_RE = re.compile(r'\babstract\b[:\s]*', re.IGNORECASE)
+_ABSTRACT_END_RE = re.compile(r'\n\s*(?:\d*\.?\s*introduction|keywords|1\s|\n\n)', re.IGNORECASE)
+
+_TABLE_RE = re.compile(r'(?i)table\s+(\d+)[:\.]?\s*([^\n]+)?')
+
+
+def _page_texts_pdfium(file_path: str) -> Tuple[List[str], int, List[int]]:
+    """Per-page text, page count and scanned page numbers via PDFium."""
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        page_texts = []
+        scanned = []
+        for index in range(len(pdf)):
+            page = pdf[index]
+            try:
+                textpage = page.get_textpage()
+                try:
+                    # A page with no text objects but an image is a scan;
+                    # its text range would be empty anyway
+                    if textpage.count_chars() == 0:
+                        if _has_image_pdfium(page):
+                            scanned.append(index + 1)
+                        page_texts.append("")
+                    else:
+                        # PDFium ends lines with "\r\n"; the heading and
+                        # abstract patterns expect "\n" as PyPDF2 gives it
+                        text = textpage.get_text_range()
+                        page_texts.append(text.replace("\r\n", "\n").replace("\r", "\n"))
+                finally:
+                    textpage.close()
+            finally:
+                page.close()
+        return page_texts, len(pdf), scanned
+    finally:
+        pdf.close()
+
+
+def _has_image_pdfium(page) -> bool:
+    """Whether a PDFium page holds at least one top-level image object."""
+    for _ in page.get_objects(filter=(pdfium.raw.FPDF_PAGEOBJ_IMAGE,), max_depth=1):
+        return True
+    return False
+
+
+def _is_scanned_pypdf2(page) -> bool:
+    """
+    Whether a PyPDF2 page looks like a scanned image.
+    
+    The page must draw an image XObject and its content stream must have no
+    text object (``BT``). Only the page's own resources are inspected, so a
+    page that inherits them is treated as born-digital and extracted as usual.
+    """
+    try:
+        resources = page.get("/Resources")
+        if resources is None:
+            return False
+        xobjects = resources.get_object().get("/XObject")
+        if xobjects is None:
+            return False
+        if not any(
+            xobject.get_object().get("/Subtype") == "/Image"
+            for xobject in xobjects.get_object().values()
+        ):
+            return False
+        contents = page.get_contents()
+        return contents is None or b"BT" not in contents.get_data()
+    except Exception:
+        return False
+
+
+def _read_pages_pypdf2(reader) -> Tuple[List[str], int, List[int]]:
+    page_texts = []
+    scanned = []
+    for index, page in enumerate(reader.pages):
+        # Skip text extraction for scans; it would only walk the image
+        # operators and return nothing
+        if _is_scanned_pypdf2(page):
+            scanned.append(index + 1)
+            page_texts.append("")
+        else:
+            page_texts.append(page.extract_text())
+    return page_texts, len(reader.pages), scanned
+
+
+def _page_texts_pypdf2(file_path: str) -> Tuple[List[str], int, List[int]]:
+    """Per-page text, page count and scanned page numbers via PyPDF2."""
+    from PyPDF2 import PdfReader
+    
+    if os.path.getsize(file_path) < _MMAP_MIN_BYTES:
+        return _read_pages_pypdf2(PdfReader(file_path))
+    
+    # The reader reads from the map lazily, so it must stay open until
+    # every page has been extracted
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return _read_pages_pypdf2(PdfReader(mm))
+
 
 def extract_text_from_pdf(file_path: str) -> Dict:
     """
@@ -22,22 +173,32 @@ def extract_text_from_pdf(file_path: str) -> Dict:
         }
     
     try:
-        from PyPDF2 import PdfReader
+        if pdfium is not None:
+            page_texts, num_pages, scanned_pages = _page_texts_pdfium(file_path)
+        else:
+            page_texts, num_pages, scanned_pages = _page_texts_pypdf2(file_path)
         
-        reader = PdfReader(file_path)
+        # Headers and page texts go into one flat list joined once, so the
+        # page text is copied only by the final join. Scans get a placeholder
+        # so downstream agents know the page was not simply empty
+        scanned_set = set(scanned_pages)
         text_content = []
         
-        for page_num, page in enumerate(reader.pages):
-            page_text = page.extract_text()
+        for page_num, page_text in enumerate(page_texts, 1):
+            if page_num in scanned_set:
+                page_text = f"[SCANNED PAGE {page_num}]"
             if page_text:
-                text_content.append(f"--- Page {page_num + 1} ---\n{page_text}")
+                separator = "\n\n" if text_content else ""
+                text_content.append(f"{separator}--- Page {page_num} ---\n")
+                text_content.append(page_text)
         
-        full_text = "\n\n".join(text_content)
+        full_text = "".join(text_content)
         
         return {
             "status": "success",
             "text": full_text,
-            "num_pages": len(reader.pages)
+            "num_pages": num_pages,
+            "scanned_pages": scanned_pages
         }
         
     except Exception as e:
@@ -47,10 +208,14 @@ def extract_text_from_pdf(file_path: str) -> Dict:
         }
 
 
+@stat_memoize(maxsize=64)
 def parse_pdf(file_path: str) -> Dict:
     """
     Parse a PDF research paper and extract structured information.
     
+    Results are cached in memory per file version (path, mtime, size), so
+    pipeline stages and retries reading the same PDF parse it once.
+    
     Args:
         file_path: Path to the PDF file
         
@@ -79,43 +244,58 @@ def parse_pdf(file_path: str) -> Dict:
         "abstract": abstract,
         "sections": sections,
         "full_text": text,
-        "num_pages": result.get("num_pages", 0)
+        "num_pages": result.get("num_pages", 0),
+        "scanned_pages": result.get("scanned_pages", [])
     }
 
 
+def parse_pdfs(file_paths: List[str], max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Run ``parse_pdf`` over several files in worker processes.
+    
+    Returns one result per path, in input order.
+    """
+    return map_in_processes(parse_pdf, file_paths, max_workers)
+
+
 def extract_sections_from_text(text: str) -> Dict[str, str]:
-    """Extract common paper sections from text."""
+    """
+    Extract common paper sections from text.
+    
+    Headings are found in one pass; each section runs from its heading to the
+    next one. A section that appears more than once keeps its first
+    non-empty body.
+    """
     sections = {}
     
-    # Common section patterns
-    section_patterns = [
-        (r'(?i)\b(abstract)\b[:\s]*\n?(.*?)(?=\n\s*\d*\.?\s*(?:introduction|keywords|1\s)|\Z)', 'abstract'),
-        (r'(?i)\b(\d*\.?\s*introduction)\b[:\s]*\n?(.*?)(?=\n\s*\d*\.?\s*(?:related|background|method|2\s)|\Z)', 'introduction'),
-        (r'(?i)\b(\d*\.?\s*related\s*work)\b[:\s]*\n?(.*?)(?=\n\s*\d*\.?\s*(?:method|approach|model|3\s)|\Z)', 'related_work'),
-        (r'(?i)\b(\d*\.?\s*(?:method|methodology|approach))\b[:\s]*\n?(.*?)(?=\n\s*\d*\.?\s*(?:experiment|result|evaluation|4\s)|\Z)', 'methodology'),
-        (r'(?i)\b(\d*\.?\s*(?:experiment|evaluation|result)s?)\b[:\s]*\n?(.*?)(?=\n\s*\d*\.?\s*(?:discussion|conclusion|analysis|5\s|6\s)|\Z)', 'experiments'),
-        (r'(?i)\b(\d*\.?\s*(?:conclusion|summary)s?)\b[:\s]*\n?(.*?)(?=\n\s*(?:reference|acknowledgment|appendix)|\Z)', 'conclusion'),
-    ]
-    
-    for pattern, section_name in section_patterns:
-        match = re.search(pattern, text, re.DOTALL)
-        if match:
-            content = match.group(2) if len(match.groups()) > 1 else match.group(1)
-            sections[section_name] = content.strip()[:2000]  # Limit content length
+    matches = list(_SECTION_HEAD_RE.finditer(text))
+    for i, match in enumerate(matches):
+        section_name = match.lastgroup
+        if section_name == "other" or section_name in sections:
+            continue
+        
+        body_end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        body = text[match.end():body_end].strip()
+        if body:
+            sections[section_name] = body[:_MAX_SECTION_CHARS]
     
     return sections
 
 
 def extract_title(text: str) -> Optional[str]:
     """Try to extract paper title from text."""
-    lines = text.strip().split('\n')
-    
-    for line in lines[:10]:  # Check first 10 lines
-        line = line.strip()
+    # Walk the first lines in place instead of splitting the whole paper
+    start = _LEADING_SPACE_RE.match(text).end()
+    for _ in range(_TITLE_SEARCH_LINES):
+        end = text.find('\n', start)
+        line = text[start:end if end != -1 else len(text)].strip()
         # Title is usually a longer line without common section markers
         if len(line) > 20 and len(line) < 200:
-            if not re.match(r'^(?:abstract|introduction|\d+\.)', line, re.IGNORECASE):
+            if not _TITLE_SKIP_RE.match(line):
                 return line
+        if end == -1:
+            break
+        start = end + 1
     
     return None
 
@@ -123,19 +303,25 @@ def extract_title(text: str) -> Optional[str]:
 def extract_abstract(text: str) -> Optional[str]:
     """Extract abstract from paper text."""
     # Try to find abstract section
-    abstract_match = re.search(
-        r'(?i)\babstract\b[:\s]*\n?(.*?)(?=\n\s*(?:\d*\.?\s*introduction|keywords|1\s|\n\n))',
-        text,
-        re.DOTALL
-    )
-    
-    if abstract_match:
-        abstract = abstract_match.group(1).strip()
-        # Clean up and limit length
-        abstract = ' '.join(abstract.split())
-        return abstract[:1500] if len(abstract) > 1500 else abstract
+    start = _ABSTRACT_START_RE.search(text)
+    if not start:
+        return None
     
-    return None
+    end = _ABSTRACT_END_RE.search(text, start.end())
+    if end:
+        abstract = text[start.end():end.start()]
+    else:
+        # The only end marker, if any, overlaps the whitespace after the
+        # heading word. The full pattern settles that case at this one
+        # position; no later "abstract" can have an end marker after it.
+        abstract_match = _ABSTRACT_RE.match(text, start.start())
+        if not abstract_match:
+            return None
+        abstract = abstract_match.group(1)
+    
+    # Clean up and limit length
+    abstract = ' '.join(abstract.split())
+    return abstract[:_MAX_ABSTRACT_CHARS]
 
 
 def extract_tables_from_text(text: str) -> List[Dict]:
@@ -145,26 +331,13 @@ def extract_tables_from_text(text: str) -> List[Dict]:
     Note: Full table extraction from PDFs is complex and may require
     specialized libraries like tabula-py or camelot.
     """
-    tables = []
-    
-    # Find table references
-    table_pattern = r'(?i)table\s+(\d+)[:\.]?\s*([^\n]+)?'
-    matches = re.findall(table_pattern, text)
-    
-    for match in matches:
-        table_num, caption = match
-        tables.append({
-            "table_number": table_num,
-            "caption": caption.strip() if caption else None
-        })
-    
-    # Deduplicate
-    seen = set()
-    unique_tables = []
-    for table in tables:
-        key = table["table_number"]
-        if key not in seen:
-            seen.add(key)
-            unique_tables.append(table)
-    
-    return unique_tables
+    # Find table references, keeping the first caption seen for each number
+    tables = {}
+    for table_num, caption in _TABLE_RE.findall(text):
+        if table_num not in tables:
+            tables[table_num] = {
+                "table_number": table_num,
+                "caption": caption.strip() if caption else None
+            }
+    
+    return list(tables.values())
@@ -4,12 +4,22 @@ from .helpers import (
     load_env,
     read_file_safe,
     get_file_paths,
+    iter_file_paths,
     format_json_output,
+    map_in_threads,
+    map_in_processes,
+    run_in_process,
+    shutdown_process_pool,
 )
 
 __all__ = [
     "load_env",
     "read_file_safe",
     "get_file_paths",
+    "iter_file_paths",
     "format_json_output",
+    "map_in_threads",
+    "map_in_processes",
+    "run_in_process",
+    "shutdown_process_pool",
 ]
@@ -1,11 +1,50 @@
 """Helper utilities for the research verifier system."""
 
 import os
+import re
 import json
-from typing import Dict, List, Optional, Any
+import math
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterator, List, Optional, Any
 from pathlib import Path
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; json is used instead
+    orjson = None
+
+# orjson options matching json.dumps(indent=2, default=str): non-str keys
+# are stringified, dates and dataclasses go through default=str like
+# json does, and NumPy scalars/arrays become numbers
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+) if orjson is not None else 0
+
+# Integers, decimals and exponent forms, optionally negative
+_NUMBER_RE = re.compile(r'-?\d+\.?\d*(?:[eE][+-]?\d+)?')
+
+# Short metric names and the names they normalize to
+_METRIC_ALIASES = {
+    'acc': 'accuracy',
+    'prec': 'precision',
+    'rec': 'recall',
+    'lr': 'learning rate',
+}
+
+# Read size after the first, stat-sized read (only reached for files that
+# grew or report no size, like /proc entries)
+_READ_CHUNK = 1 << 16
+
+# Long-lived worker pool (see get_process_pool); created on first use
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
 
 def load_env(env_path: Optional[str] = None) -> None:
     """Load environment variables from .env file."""
@@ -20,15 +59,167 @@ def load_env(env_path: Optional[str] = None) -> None:
                 break
 
 
+def map_in_threads(func: Callable, items: List, max_workers: int = 8) -> List:
+    """
+    Apply ``func`` to every item on a thread pool, returning results in input order.
+    
+    Meant for per-file work that is mostly I/O. Regex matching holds the GIL,
+    so large CPU-bound batches are better served by ``map_in_processes``.
+    """
+    if not items:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Return the worker process pool shared by the whole process, creating it on first use.
+    
+    Workers come from a forkserver (spawn where that is unavailable) rather
+    than a fork of the caller, which may be a multithreaded server.
+    Submitted functions must be importable module-level functions.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, mp_context=context)
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool, so the next call creates a fresh one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shut the shared pool down, if it was started; it is recreated on next use."""
+    global _process_pool
+    with _process_pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def run_in_process(func: Callable, *args) -> Any:
+    """
+    Call ``func(*args)`` in the shared process pool and wait for the result.
+    
+    If a crashed worker broke the pool, this call runs inline and the next
+    one starts a fresh pool.
+    """
+    pool = get_process_pool()
+    try:
+        return pool.submit(func, *args).result()
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        return func(*args)
+
+
+def map_in_processes(func: Callable, items: List, max_workers: Optional[int] = None) -> List:
+    """
+    Apply ``func`` to every item in worker processes, returning results in input order.
+    
+    ``func`` must be a module-level function and items and results must be
+    picklable. Work goes to the shared pool (see ``get_process_pool``), so
+    workers are started once per process rather than per call; at most
+    ``max_workers`` items are in flight at a time. Runs inline when there
+    is a single item or a single CPU, or if a crashed worker broke the pool.
+    """
+    workers = min(len(items), max_workers or os.cpu_count() or 1)
+    if workers < 2:
+        return [func(item) for item in items]
+    
+    # The pool is CPU-sized; only an explicit max_workers needs windowing
+    step = workers if max_workers else len(items)
+    pool = get_process_pool()
+    try:
+        results = []
+        for start in range(0, len(items), step):
+            results.extend(pool.map(func, items[start:start + step]))
+        return results
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        return [func(item) for item in items]
+
+
 def read_file_safe(file_path: str, encoding: str = 'utf-8') -> Optional[str]:
-    """Safely read a file, returning None on error."""
+    """
+    Safely read a file, returning None on error.
+    
+    The bytes are read straight from the descriptor and decoded in one call,
+    skipping the text-mode I/O layers; newlines are translated the same way
+    text mode does.
+    """
     try:
-        with open(file_path, 'r', encoding=encoding, errors='ignore') as f:
-            return f.read()
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunks = []
+            # One byte past st_size, so a file that grew is still read whole
+            size = os.fstat(fd).st_size + 1
+            while True:
+                chunk = os.read(fd, size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size = _READ_CHUNK
+        finally:
+            os.close(fd)
+        
+        text = b''.join(chunks).decode(encoding, errors='ignore')
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
     except Exception:
         return None
 
 
+def iter_file_paths(directory: str, extensions: List[str]) -> Iterator[str]:
+    """
+    Yield file paths in a directory matching given extensions, as they are found.
+    
+    Unlike get_file_paths, nothing is collected up front, so memory stays
+    bounded on large corpora and callers can start on the first match. Paths
+    come in walk order rather than grouped by extension.
+    
+    Args:
+        directory: Directory to search
+        extensions: List of file extensions (with dot, e.g., ['.py', '.txt'])
+        
+    Yields:
+        Absolute file paths
+    """
+    if not os.path.isdir(directory):
+        return
+    
+    extensions = tuple(extensions)
+    
+    # Each directory's files come before its subdirectories (the order rglob
+    # uses). Symlinked directories are not descended into.
+    stack = [str(Path(directory).absolute())]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.name.endswith(extensions) and not entry.is_dir():
+                yield entry.path
+        stack.extend(reversed(subdirs))
+
+
 def get_file_paths(directory: str, extensions: List[str]) -> List[str]:
     """
     Get all file paths in a directory matching given extensions.
@@ -40,18 +231,47 @@ def get_file_paths(directory: str, extensions: List[str]) -> List[str]:
     Returns:
         List of absolute file paths
     """
-    if not os.path.isdir(directory):
-        return []
+    extensions = tuple(extensions)
+    matches = [[] for _ in extensions]
     
-    files = []
-    for ext in extensions:
-        files.extend(Path(directory).rglob(f'*{ext}'))
+    for path in iter_file_paths(directory, extensions):
+        name = os.path.basename(path)
+        for i, ext in enumerate(extensions):
+            if name.endswith(ext):
+                matches[i].append(path)
     
-    return [str(f.absolute()) for f in files]
+    # Grouped by extension, in the order the extensions were given
+    return [path for group in matches for path in group]
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Whether data holds a NaN or infinite float anywhere in its dicts, lists and tuples."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
 
 
 def format_json_output(data: Any, indent: int = 2) -> str:
-    """Format data as pretty JSON string."""
+    """
+    Format data as pretty JSON string.
+    
+    Uses orjson for the default two-space indent when it is installed; its
+    output keeps non-ASCII characters as UTF-8 instead of escaping them, and
+    writes float exponents without "+" or leading zeros ("1e20", not
+    "1e+20"), which parse to the same values. Other indents, data orjson
+    rejects (e.g. integers beyond 64 bits), and data with NaN or infinite
+    floats (orjson would write null, e.g. for a diverged loss) go through
+    json.
+    """
+    if orjson is not None and indent == 2 and not _has_non_finite(data):
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
     return json.dumps(data, indent=indent, default=str)
 
 
@@ -62,32 +282,26 @@ def truncate_text(text: str, max_length: int = 1000, suffix: str = "...") -> str
     return text[:max_length - len(suffix)] + suffix
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_metric_name(name: str) -> str:
-    """Normalize a metric name for comparison."""
+    """Normalize a metric name for comparison (cached; the same few names recur)."""
     # Remove common prefixes/suffixes and normalize
     name = name.lower().strip()
     name = name.replace('_', ' ').replace('-', ' ')
     
-    # Common aliases
-    aliases = {
-        'acc': 'accuracy',
-        'prec': 'precision',
-        'rec': 'recall',
-        'lr': 'learning rate',
-    }
-    
-    for short, full in aliases.items():
-        if name == short:
-            return full
-    
-    return name
+    return _METRIC_ALIASES.get(name, name)
 
 
 def extract_numbers_from_text(text: str) -> List[float]:
     """Extract all numbers from a text string."""
-    import re
-    pattern = r'-?\d+\.?\d*(?:[eE][+-]?\d+)?'
-    matches = re.findall(pattern, text)
+    matches = _NUMBER_RE.findall(text)
+    
+    # Every match is a valid float literal, so convert in one C-level map;
+    # the per-item loop only runs if that ever stops being true
+    try:
+        return list(map(float, matches))
+    except ValueError:
+        pass
     
     numbers = []
     for match in matches:
@@ -107,18 +321,19 @@ def create_summary_table(data: Dict[str, Any], headers: List[str] = None) -> str
     if headers is None:
         headers = ["Key", "Value"]
     
-    rows = []
-    max_key_len = max(len(str(k)) for k in data.keys())
-    max_val_len = max(len(str(v)[:50]) for v in data.values())
+    # Stringify each key and value once; widths and rows reuse the results
+    items = [(str(k), str(v)[:50]) for k, v in data.items()]
+    max_key_len = max(len(k) for k, _ in items)
+    max_val_len = max(len(v) for _, v in items)
     
     # Header
-    rows.append(f"{headers[0]:<{max_key_len}} | {headers[1]}")
-    rows.append("-" * (max_key_len + max_val_len + 3))
+    rows = [
+        f"{headers[0]:<{max_key_len}} | {headers[1]}",
+        "-" * (max_key_len + max_val_len + 3),
+    ]
     
     # Data rows
-    for key, value in data.items():
-        val_str = str(value)[:50]
-        rows.append(f"{str(key):<{max_key_len}} | {val_str}")
+    rows.extend(f"{key:<{max_key_len}} | {val_str}" for key, val_str in items)
     
     return "\n".join(rows)
 
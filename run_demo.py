@@ -14,7 +14,7 @@ Example:
 
 import os
 import sys
-import json
+import random
 import asyncio
 import argparse
 from pathlib import Path
@@ -72,6 +72,28 @@ def get_default_paths():
     }
 
 
+def build_user_message(paper_path: str, log_paths: list, script_paths: list, bib_path: str) -> str:
+    """Build the pipeline's opening user message for one paper."""
+    return f"""Please analyze this research paper and provide a comprehensive verification report.
+
+**Paper Path**: {paper_path}
+**Experiment Logs**: {', '.join(log_paths) if log_paths else 'None provided'}
+**Experiment Scripts**: {', '.join(script_paths) if script_paths else 'None provided'}
+**BibTeX File**: {bib_path if bib_path else 'None provided'}
+
+Please run the full verification pipeline:
+1. Parse the paper and extract claims, results, datasets, and metrics
+2. Check reproducibility information in the scripts and logs
+3. Map reported results to experimental evidence
+4. Audit the statistical validity of claims
+5. Analyze citations and baseline comparisons
+6. Simulate likely reviewer comments
+7. Produce a final verdict with prioritized action items
+
+Provide detailed, actionable feedback that would help improve the paper before submission.
+"""
+
+
 async def run_agent_pipeline(paper_path: str, log_paths: list, script_paths: list, bib_path: str):
     """
     Run the full agent pipeline.
@@ -102,24 +124,7 @@ async def run_agent_pipeline(paper_path: str, log_paths: list, script_paths: lis
     )
     
     # Prepare the user message with all file paths
-    user_message_text = f"""Please analyze this research paper and provide a comprehensive verification report.
-
-**Paper Path**: {paper_path}
-**Experiment Logs**: {', '.join(log_paths) if log_paths else 'None provided'}
-**Experiment Scripts**: {', '.join(script_paths) if script_paths else 'None provided'}
-**BibTeX File**: {bib_path if bib_path else 'None provided'}
-
-Please run the full verification pipeline:
-1. Parse the paper and extract claims, results, datasets, and metrics
-2. Check reproducibility information in the scripts and logs
-3. Map reported results to experimental evidence
-4. Audit the statistical validity of claims
-5. Analyze citations and baseline comparisons
-6. Simulate likely reviewer comments
-7. Produce a final verdict with prioritized action items
-
-Provide detailed, actionable feedback that would help improve the paper before submission.
-"""
+    user_message_text = build_user_message(paper_path, log_paths, script_paths, bib_path)
     
     # Create proper Content object for ADK
     user_message = types.Content(
@@ -170,10 +175,12 @@ Provide detailed, actionable feedback that would help improve the paper before s
             if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str or "quota" in error_str.lower():
                 retry_count += 1
                 if retry_count < max_retries:
-                    wait_time = 20 * retry_count  # Exponential backoff: 20s, 40s, 60s
-                    print(f"\n⚠️  Rate limit hit. Waiting {wait_time} seconds before retry {retry_count}/{max_retries}...")
-                    import time
-                    time.sleep(wait_time)
+                    # Backoff of 20s, 40s, ... plus up to 25% jitter, so
+                    # concurrent runs don't all retry at the same moment.
+                    # asyncio.sleep keeps the event loop free meanwhile.
+                    wait_time = 20 * retry_count * (1 + random.random() * 0.25)
+                    print(f"\n⚠️  Rate limit hit. Waiting {wait_time:.0f} seconds before retry {retry_count}/{max_retries}...")
+                    await asyncio.sleep(wait_time)
                 else:
                     print("\n❌ Rate limit exceeded after all retries.")
                     print("   Options:")
@@ -205,6 +212,45 @@ Provide detailed, actionable feedback that would help improve the paper before s
     return final_response
 
 
+async def run_batch_pipeline(paper_paths: list, log_paths: list, script_paths: list, bib_path: str,
+                             execution_mode: str = "offline"):
+    """
+    Run the full agent pipeline over several papers with a BatchRunner.
+    
+    In offline mode the papers' pipelines run concurrently on one shared
+    runner instead of one after another.
+    """
+    from research_verifier.batch import BatchRunner
+    
+    print(f"\n🚀 Starting batch verification of {len(paper_paths)} papers ({execution_mode} mode)...\n")
+    
+    batch_runner = BatchRunner(execution_mode=execution_mode)
+    futures = {
+        paper_path: batch_runner.submit(
+            paper_path,
+            build_user_message(paper_path, log_paths, script_paths, bib_path)
+        )
+        for paper_path in paper_paths
+    }
+    await batch_runner.flush()
+    
+    reports = {}
+    for paper_path, future in futures.items():
+        try:
+            reports[paper_path] = await future
+        except Exception as e:
+            print(f"\n❌ {paper_path}: {e}")
+            reports[paper_path] = None
+            continue
+        
+        print("\n" + "=" * 70)
+        print(f"📋 VERIFICATION REPORT: {paper_path}")
+        print("=" * 70)
+        print(reports[paper_path] or "(no report produced)")
+    
+    return reports
+
+
 def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bib_path: str):
     """
     Run a standalone demo without full ADK runner.
@@ -218,12 +264,23 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
     from research_verifier.tools.latex_parser import parse_latex
     from research_verifier.tools.log_analyzer import analyze_training_logs, extract_reproducibility_info
     from research_verifier.tools.bib_parser import get_citation_info
+    from research_verifier.utils.helpers import format_json_output, read_file_safe
     
     results = {}
     
+    # Stat every input once up front; the steps below branch on this
+    # instead of re-checking each path
+    stats = {}
+    for path in filter(None, [paper_path, *(log_paths or []), *(script_paths or []), bib_path]):
+        if path not in stats:
+            try:
+                stats[path] = os.stat(path)
+            except (OSError, ValueError):
+                continue
+    
     # 1. Parse paper
     print("📄 Step 1: Parsing paper...")
-    if paper_path and os.path.exists(paper_path):
+    if paper_path in stats:
         ext = os.path.splitext(paper_path)[1].lower()
         if ext == '.pdf':
             paper_result = parse_pdf(paper_path)
@@ -231,9 +288,11 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
             paper_result = parse_latex(paper_path)
         else:
             # Plain text
-            with open(paper_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            paper_result = {"status": "success", "full_text": content}
+            content = read_file_safe(paper_path)
+            if content is None:
+                paper_result = {"status": "error", "error_message": f"Could not read {paper_path}"}
+            else:
+                paper_result = {"status": "success", "full_text": content}
         
         results["paper"] = paper_result
         if paper_result.get("status") == "success":
@@ -248,7 +307,7 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
     print("\n📊 Step 2: Analyzing experiment logs...")
     if log_paths:
         for log_path in log_paths:
-            if os.path.exists(log_path):
+            if log_path in stats:
                 log_result = analyze_training_logs(log_path)
                 results[f"log_{os.path.basename(log_path)}"] = log_result
                 
@@ -267,7 +326,7 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
     print("\n📝 Step 3: Checking reproducibility info...")
     if script_paths:
         for script_path in script_paths:
-            if os.path.exists(script_path):
+            if script_path in stats:
                 repro_result = extract_reproducibility_info(script_path)
                 results[f"repro_{os.path.basename(script_path)}"] = repro_result
                 
@@ -285,7 +344,7 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
     
     # 4. Analyze citations
     print("\n📚 Step 4: Analyzing citations...")
-    if bib_path and os.path.exists(bib_path):
+    if bib_path in stats:
         bib_result = get_citation_info(bib_path)
         results["citations"] = bib_result
         
@@ -363,7 +422,7 @@ def run_standalone_demo(paper_path: str, log_paths: list, script_paths: list, bi
         "estimated_time_to_fix": "2-3 weeks"
     }
     
-    print(json.dumps(sample_report, indent=2))
+    print(format_json_output(sample_report))
     
     print("\n" + "=" * 70)
     print("✅ Demo completed!")
@@ -387,6 +446,7 @@ Examples:
   python run_demo.py                    # Run with sample data
   python run_demo.py --paper my_paper.pdf
   python run_demo.py --full             # Run full ADK pipeline (requires API key)
+  python run_demo.py --batch a.pdf b.pdf  # Verify several papers concurrently
         """
     )
     
@@ -395,6 +455,10 @@ Examples:
     parser.add_argument("--scripts", type=str, nargs="+", help="Paths to experiment scripts")
     parser.add_argument("--bib", type=str, help="Path to BibTeX file")
     parser.add_argument("--full", action="store_true", help="Run full ADK pipeline")
+    parser.add_argument("--batch", type=str, nargs="+", metavar="PAPER",
+                        help="Run full ADK pipeline over several papers")
+    parser.add_argument("--mode", choices=["realtime", "offline"], default="offline",
+                        help="Execution mode for --batch (default: offline)")
     
     args = parser.parse_args()
     
@@ -408,7 +472,13 @@ Examples:
     script_paths = args.scripts or defaults["scripts"]
     bib_path = args.bib or str(defaults["bib"])
     
-    if args.full:
+    if args.batch:
+        # Run full ADK pipeline over many papers
+        if not setup_environment():
+            print("Cannot run batch pipeline without API key.")
+            return
+        asyncio.run(run_batch_pipeline(args.batch, log_paths, script_paths, bib_path, args.mode))
+    elif args.full:
         # Run full ADK pipeline
         has_key = setup_environment()
         if not has_key:
@@ -6,6 +6,7 @@
 // State management
 let currentSessionId = null;
 let statusPollingInterval = null;
+let statusEventSource = null;
 
 // DOM Elements
 const uploadSection = document.getElementById('upload-section');
@@ -115,8 +116,8 @@ async function startAnalysis() {
         // Switch to progress view
         showProgressView();
 
-        // Start polling for status
-        startStatusPolling();
+        // Follow analysis status
+        startStatusUpdates();
 
     } catch (error) {
         console.error('Upload error:', error);
@@ -141,58 +142,52 @@ function showProgressView() {
 }
 
 /**
- * Start polling for analysis status
+ * Follow analysis status over Server-Sent Events, polling if unavailable
  */
-function startStatusPolling() {
-    let completedAgents = new Set();
+function startStatusUpdates() {
+    const completedAgents = new Set();
+
+    if (!window.EventSource) {
+        startStatusPolling(completedAgents);
+        return;
+    }
 
+    statusEventSource = new EventSource(`/api/events/${currentSessionId}`);
+    statusEventSource.onmessage = (event) => {
+        handleStatus(JSON.parse(event.data), completedAgents);
+    };
+    // Sent when the session was deleted or expired on the server
+    statusEventSource.addEventListener('expired', handleExpiredSession);
+    statusEventSource.onerror = () => {
+        // Stream dropped before the analysis finished: fall back to polling
+        stopStatusUpdates();
+        startStatusPolling(completedAgents);
+    };
+}
+
+/**
+ * Start polling for analysis status
+ */
+function startStatusPolling(completedAgents) {
     statusPollingInterval = setInterval(async () => {
         try {
             const response = await fetch(`/api/status/${currentSessionId}`);
 
-            if (!response.ok) {
-                throw new Error('Status check failed');
+            // Updates were stopped while this request was in flight
+            if (!statusPollingInterval) {
+                return;
             }
 
-            const status = await response.json();
-
-            // Update progress bar
-            const progressBar = document.getElementById('progress-bar');
-            const progressPercentage = document.getElementById('progress-percentage');
-            progressBar.style.width = `${status.progress}%`;
-            progressPercentage.textContent = `${status.progress}%`;
-
-            // Update current agent
-            const currentAgentEl = document.getElementById('current-agent');
-            if (status.current_agent) {
-                currentAgentEl.textContent = formatAgentName(status.current_agent);
-
-                // Update agent list
-                updateAgentList(status.current_agent, completedAgents);
+            if (response.status === 404) {
+                handleExpiredSession();
+                return;
             }
 
-            // Check if completed
-            if (status.status === 'completed') {
-                clearInterval(statusPollingInterval);
-                // Mark all agents as completed
-                document.querySelectorAll('.agent-item').forEach(item => {
-                    item.classList.remove('active');
-                    item.classList.add('completed');
-                    item.querySelector('.agent-status').textContent = '✅';
-                });
-
-                // Wait a moment then show results
-                setTimeout(() => {
-                    showResults(status.results);
-                }, 1000);
+            if (!response.ok) {
+                throw new Error('Status check failed');
             }
 
-            // Check for error
-            if (status.status === 'error') {
-                clearInterval(statusPollingInterval);
-                alert(`Analysis failed: ${status.error}`);
-                resetAnalysis();
-            }
+            handleStatus(await response.json(), completedAgents);
 
         } catch (error) {
             console.error('Status polling error:', error);
@@ -200,6 +195,72 @@ function startStatusPolling() {
     }, 1000);
 }
 
+/**
+ * Stop following a session the server no longer has
+ */
+function handleExpiredSession() {
+    stopStatusUpdates();
+    alert('This analysis session has expired or was deleted. Please upload the files again.');
+    resetAnalysis();
+}
+
+/**
+ * Stop status polling and close the event stream
+ */
+function stopStatusUpdates() {
+    if (statusPollingInterval) {
+        clearInterval(statusPollingInterval);
+        statusPollingInterval = null;
+    }
+    if (statusEventSource) {
+        statusEventSource.close();
+        statusEventSource = null;
+    }
+}
+
+/**
+ * Update the progress view from a session status record
+ */
+function handleStatus(status, completedAgents) {
+    // Update progress bar
+    const progressBar = document.getElementById('progress-bar');
+    const progressPercentage = document.getElementById('progress-percentage');
+    progressBar.style.width = `${status.progress}%`;
+    progressPercentage.textContent = `${status.progress}%`;
+
+    // Update current agent
+    const currentAgentEl = document.getElementById('current-agent');
+    if (status.current_agent) {
+        currentAgentEl.textContent = formatAgentName(status.current_agent);
+
+        // Update agent list
+        updateAgentList(status.current_agent, completedAgents);
+    }
+
+    // Check if completed
+    if (status.status === 'completed') {
+        stopStatusUpdates();
+        // Mark all agents as completed
+        document.querySelectorAll('.agent-item').forEach(item => {
+            item.classList.remove('active');
+            item.classList.add('completed');
+            item.querySelector('.agent-status').textContent = '✅';
+        });
+
+        // Wait a moment then show results
+        setTimeout(() => {
+            showResults(status.results);
+        }, 1000);
+    }
+
+    // Check for error
+    if (status.status === 'error') {
+        stopStatusUpdates();
+        alert(`Analysis failed: ${status.error}`);
+        resetAnalysis();
+    }
+}
+
 /**
  * Format agent name for display
  */
@@ -438,11 +499,8 @@ function updateRelatedWork(related) {
  * Reset analysis and show upload view
  */
 function resetAnalysis() {
-    // Clear interval if running
-    if (statusPollingInterval) {
-        clearInterval(statusPollingInterval);
-        statusPollingInterval = null;
-    }
+    // Stop following status if running
+    stopStatusUpdates();
 
     // Reset session
     currentSessionId = null;
@@ -6,11 +6,16 @@ FastAPI backend that runs the actual multi-agent pipeline with LLM.
 
 import os
 import sys
+import copy
 import json
+import functools
 import uuid
+import shutil
+import hashlib
 import asyncio
+import contextlib
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 from datetime import datetime
 import re
 
@@ -25,9 +30,9 @@ if not os.getenv("GOOGLE_API_KEY"):
 else:
     print("✅ GOOGLE_API_KEY loaded successfully")
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
+from fastapi import FastAPI, File, Form, UploadFile, HTTPException, BackgroundTasks
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import aiofiles
@@ -41,11 +46,49 @@ from research_verifier.tools.pdf_parser import parse_pdf
 from research_verifier.tools.latex_parser import parse_latex
 from research_verifier.tools.log_analyzer import analyze_training_logs, extract_reproducibility_info
 from research_verifier.tools.bib_parser import get_citation_info
+from research_verifier.agents.paper_parser import ANALYZER_VERSION
+from research_verifier.cache import disk_memoize, file_sha256
+from research_verifier.utils import run_in_process, shutdown_process_pool
+
+# orjson is an optional speedup for parsing LLM output and rendering
+# responses. As a parser it rejects NaN/Infinity literals, which json
+# accepts, so those inputs are retried with json. Integers beyond 64
+# bits come back as floats, which no agent output relies on.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (NaN/Infinity become null)."""
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+# Responses use orjson when it is installed, Starlette's json otherwise
+APIResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+def dump_json(content: Any) -> bytes:
+    """Serialize content the way APIResponse renders it."""
+    return APIResponse(content).body
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Stop the paper-parsing worker processes when the server shuts down."""
+    yield
+    shutdown_process_pool()
+
 
 app = FastAPI(
     title="Research Verification System",
     description="Multi-Agent Research Paper Analysis with ADK",
-    version="2.0.0"
+    version="2.0.0",
+    default_response_class=APIResponse,
+    lifespan=lifespan
 )
 
 # Enable CORS
@@ -65,10 +108,304 @@ app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
 # Store analysis results in memory
 analysis_store: Dict[str, Dict] = {}
 
+# Finished sessions are dropped (with their uploads) once older than this,
+# or oldest first once the store holds more than _MAX_SESSIONS
+_SESSION_TTL_SECONDS = 3600
+_MAX_SESSIONS = 1024
+_FINISHED_STATUSES = frozenset({"completed", "error"})
+
+# Session id -> queues of the /api/events streams following it
+_session_listeners: Dict[str, List[asyncio.Queue]] = {}
+
+# An idle event stream sends a comment this often so proxies keep it open
+_SSE_KEEPALIVE_SECONDS = 15
+
+# Upload fingerprint -> session that analyzed exactly those files
+_session_by_fingerprint: Dict[str, str] = {}
+
+# Batch id -> batch record (its session ids, in upload order)
+batch_store: Dict[str, Dict] = {}
+
+# Papers of one batch analyzed at the same time
+_BATCH_CONCURRENCY = 4
+
+# Deep-mode runner and session service, shared across runs (see get_pipeline_runner)
+_pipeline_runner = None
+_pipeline_session_service = None
+
+# Fast-mode Gemini client, shared across reports (see get_report_client)
+_report_client = None
+
+# Analyses calling Gemini at the same time, across every session; the rest
+# wait with status "queued"
+_PIPELINE_CONCURRENCY = 4
+
+# Sustained analysis starts per minute, after an initial burst of
+# _PIPELINE_CONCURRENCY; keeps bursts of uploads under the API quota
+_PIPELINE_STARTS_PER_MINUTE = 10
+
+# Shared by every analysis (see pipeline_slot)
+_pipeline_semaphore: Optional[asyncio.Semaphore] = None
+_pipeline_rate_limiter = None
+
+# Sessions waiting for a pipeline slot, in arrival order
+_pipeline_queue: List[str] = []
+
 # Upload directory
 upload_dir = project_root / "uploads"
 upload_dir.mkdir(exist_ok=True)
 
+# Logs and scripts each add at most this many characters to the prompt
+_MAX_ATTACHMENT_CHARS = 20000
+
+# Uploads are copied to disk in chunks of this many bytes
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Paper text sent to the LLM is capped at this many characters
+_MAX_PAPER_CHARS = 15000
+
+# Extracted paper texts kept on disk; the least recently used go first
+_PAPER_TEXT_CACHE_ENTRIES = 256
+_PAPER_TEXT_CACHE_BYTES = 128 << 20
+
+# Fenced ```json block in LLM output
+_JSON_FENCE_RE = re.compile(r'```json\s*([\s\S]*?)\s*```')
+
+# JSON strings (so braces inside them are skipped) and braces
+_JSON_TOKEN_RE = re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.DOTALL)
+
+# "fast" produces the whole report in one structured LLM call; "deep" runs
+# the seven-agent ADK pipeline
+ANALYSIS_MODES = ("fast", "deep")
+
+# Model used for the single-call report (same as the pipeline's agents)
+_REPORT_MODEL = "gemini-2.0-flash"
+
+_FULL_REPORT_INSTRUCTION = """You are a research verification system. Acting in turn as paper parser, reproducibility checker, experiment evidence mapper, statistical auditor, related work analyst, peer reviewer and final judge, fill in every section of the report.
+
+Base every finding on the provided paper, logs, scripts and references. Use empty lists where a section has nothing to report, and give scores from 0 to 100."""
+
+# Progress (percent) reported when each deep-mode agent first emits an event
+_AGENT_PROGRESS = {
+    "PaperParserAgent": 20,
+    "ReproducibilityAgent": 35,
+    "ExperimentEvidenceAgent": 50,
+    "StatisticalAuditorAgent": 65,
+    "RelatedWorkBaselineAgent": 75,
+    "ReviewerSimulationAgent": 85,
+    "VerdictAgent": 95
+}
+
+# Deep-mode results before any agent has reported; deep-copied per run
+_EMPTY_RESULTS = {
+    "paper_analysis": {"status": "pending", "claims": [], "datasets": [], "metrics": []},
+    "reproducibility": {"status": "pending", "missing_items": [], "reproducibility_score": 0},
+    "experiment_evidence": {"status": "pending", "issues": [], "experiment_map": {}},
+    "statistical_audit": {"status": "pending", "weak_claims": [], "variance_issues": []},
+    "related_work": {"status": "pending", "citations_found": 0, "issues": [], "missing_baselines": []},
+    "reviewer_simulation": {"status": "pending", "comments": [], "strengths": [], "weaknesses": []},
+    "verdict": {
+        "status": "pending", 
+        "critical_issues": [], 
+        "submission_readiness": "Analysis Incomplete", 
+        "overall_verdict": "Processing..."
+    }
+}
+
+# Provider-side context cache lifetime for a pipeline run's shared prefix
+_CONTEXT_CACHE_TTL_SECONDS = 1800
+
+# Fixed instructions, sent ahead of the per-paper content so every request
+# in a run (and across runs) shares the same cacheable prefix
+_PIPELINE_INSTRUCTIONS = """Please analyze this research paper and provide a comprehensive verification report.
+
+Please run the full verification pipeline and provide your analysis in JSON format with these sections:
+1. Paper Analysis: claims, results, datasets, metrics extracted
+2. Reproducibility Analysis: seeds, hardware, missing items, score
+3. Experiment Evidence: log analysis, metric mappings
+4. Statistical Audit: weak claims, variance issues
+5. Related Work: citation coverage, missing baselines
+6. Reviewer Simulation: likely comments and concerns
+7. Final Verdict: critical issues, action items, submission readiness
+
+Be specific and reference actual content from the paper in your analysis."""
+
+
+def prune_sessions(incoming: int = 1) -> List[str]:
+    """
+    Drop expired and excess finished sessions from the analysis store.
+    
+    Sessions still uploading or running are never dropped, since the
+    pipeline writes into them. Expiry counts from a session's last use,
+    and the store keeps sessions in order of use (see claim_fingerprint),
+    so the least recently used come first.
+    
+    Args:
+        incoming: Sessions about to be added; room is made for them
+    
+    Returns:
+        IDs of the dropped sessions
+    """
+    now = datetime.now()
+    finished = [
+        sid for sid, session in analysis_store.items()
+        if session.get("status") in _FINISHED_STATUSES
+    ]
+    expired = [
+        sid for sid in finished
+        if (now - datetime.fromisoformat(analysis_store[sid]["last_access"])).total_seconds()
+        > _SESSION_TTL_SECONDS
+    ]
+    
+    excess = len(analysis_store) - len(expired) - (_MAX_SESSIONS - incoming)
+    if excess > 0:
+        expired_set = set(expired)
+        expired += [sid for sid in finished if sid not in expired_set][:excess]
+    
+    for sid in expired:
+        forget_session(sid)
+    return expired
+
+
+def update_session(session_id: str, **fields) -> None:
+    """
+    Update a session's record and push the new state to its event streams.
+    
+    Sessions deleted meanwhile are ignored.
+    """
+    session = analysis_store.get(session_id)
+    if session is None:
+        return
+    session.update(fields)
+    
+    snapshot = dict(session)
+    for queue in _session_listeners.get(session_id, ()):
+        queue.put_nowait(snapshot)
+
+
+async def make_room_for_sessions(incoming: int) -> None:
+    """
+    Prune the store (and the dropped sessions' uploads) before adding sessions.
+    
+    Raises:
+        HTTPException: 503 if the sessions that can't be dropped leave no
+            room for ``incoming`` more
+    """
+    for expired_id in prune_sessions(incoming):
+        await asyncio.to_thread(remove_session_files, expired_id)
+    
+    if len(analysis_store) + incoming > _MAX_SESSIONS:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many analyses in progress. Please try again later."
+        )
+
+
+def forget_session(session_id: str) -> None:
+    """Remove a session from the store along with its fingerprint entry."""
+    session = analysis_store.pop(session_id, None)
+    if session is None:
+        return
+    # None ends the session's event streams
+    for queue in _session_listeners.get(session_id, ()):
+        queue.put_nowait(None)
+    fingerprint = session.get("fingerprint")
+    if fingerprint and _session_by_fingerprint.get(fingerprint) == session_id:
+        del _session_by_fingerprint[fingerprint]
+
+
+def remove_session_files(session_id: str) -> None:
+    """Delete a session's upload directory, if any."""
+    shutil.rmtree(upload_dir / session_id, ignore_errors=True)
+
+
+def forget_session_files(session_id: str) -> None:
+    """
+    Delete a session's uploads along with the paper text cached from them.
+    
+    Expired and pruned sessions only lose their upload directory, so their
+    cached text stays available to re-uploads until the LRU evicts it.
+    """
+    session_dir = upload_dir / session_id
+    if session_dir.is_dir():
+        for path in session_dir.iterdir():
+            if path.is_file():
+                extract_paper_text.cache_evict(str(path), path.suffix.lower())
+    remove_session_files(session_id)
+
+
+def upload_fingerprint(mode: str, files: List[tuple]) -> Optional[str]:
+    """
+    Fingerprint an upload by analysis mode and each file's role, name and content.
+    
+    Names are included because they reach the prompt (and the paper's
+    extension picks its parser); order is kept since it sets the prompt order.
+    
+    Args:
+        mode: Analysis mode
+        files: (role, path) pairs in upload order
+        
+    Returns:
+        Hex sha256 fingerprint, or None if a file can't be read
+    """
+    h = hashlib.sha256(mode.encode())
+    for role, path in files:
+        digest = file_sha256(path)
+        if digest is None:
+            return None
+        h.update(f"|{role}:{os.path.basename(path)}:{digest}".encode())
+    return h.hexdigest()
+
+
+def new_session(mode: str) -> str:
+    """Add an "uploading" session to the store and return its ID."""
+    session_id = str(uuid.uuid4())
+    now = datetime.now().isoformat()
+    analysis_store[session_id] = {
+        "status": "uploading",
+        "progress": 0,
+        "current_agent": None,
+        "results": None,
+        "error": None,
+        "mode": mode,
+        "created_at": now,
+        "last_access": now
+    }
+    return session_id
+
+
+async def claim_fingerprint(session_id: str, mode: str, files: List[tuple]) -> Optional[str]:
+    """
+    Register a session's upload fingerprint, unless another session has it.
+    
+    A session with the same fingerprint that completed or is still in
+    flight is reused instead; its expiry restarts and it moves to the back
+    of the pruning order, so it isn't dropped right after being handed out.
+    Failed sessions are not reused.
+    
+    Args:
+        session_id: The new session
+        mode: Analysis mode
+        files: (role, path) pairs in upload order
+        
+    Returns:
+        ID of a completed or in-flight session with identical files, or None
+    """
+    fingerprint = await asyncio.to_thread(upload_fingerprint, mode, files)
+    if fingerprint is None:
+        return None
+    
+    existing_id = _session_by_fingerprint.get(fingerprint)
+    existing = analysis_store.get(existing_id) if existing_id else None
+    if existing is not None and existing.get("status") != "error":
+        existing["last_access"] = datetime.now().isoformat()
+        analysis_store[existing_id] = analysis_store.pop(existing_id)
+        return existing_id
+    
+    _session_by_fingerprint[fingerprint] = session_id
+    analysis_store[session_id]["fingerprint"] = fingerprint
+    return None
+
 
 async def save_upload_file(upload_file: UploadFile, session_id: str) -> str:
     """Save uploaded file to disk."""
@@ -77,23 +414,26 @@ async def save_upload_file(upload_file: UploadFile, session_id: str) -> str:
     
     file_path = session_dir / upload_file.filename
     
+    # Copy in chunks so a large upload is never held in memory whole
     async with aiofiles.open(file_path, 'wb') as f:
-        content = await upload_file.read()
-        await f.write(content)
+        while chunk := await upload_file.read(_UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
     
     return str(file_path)
 
 
-def read_paper_content(file_path: str) -> str:
-    """Read paper file and extract text content."""
+def _extract_paper_text(file_path: str) -> str:
+    """Parse a paper file and return its text, or "" on failure."""
     ext = Path(file_path).suffix.lower()
     
+    # PDF/LaTeX parsing is CPU-bound Python that holds the GIL, so it runs
+    # in the shared worker process pool instead of this thread
     if ext == '.pdf':
-        result = parse_pdf(file_path)
+        result = parse_pdf.in_process(file_path)
         if result.get("status") == "success":
             return result.get("full_text", "")
     elif ext in ['.tex', '.latex']:
-        result = parse_latex(file_path)
+        result = run_in_process(parse_latex, file_path)
         if result.get("status") == "success":
             return result.get("full_text", "")
     else:
@@ -107,165 +447,356 @@ def read_paper_content(file_path: str) -> str:
     return ""
 
 
+@disk_memoize(
+    version=ANALYZER_VERSION,
+    max_entries=_PAPER_TEXT_CACHE_ENTRIES,
+    max_bytes=_PAPER_TEXT_CACHE_BYTES
+)
+def extract_paper_text(file_path: str, ext: str) -> Dict:
+    """
+    Extract a paper's full text and its prompt-sized prefix.
+    
+    Cached on the file's content hash (plus ``ext``, which picks the parser),
+    so a re-uploaded paper skips PDF/LaTeX parsing entirely. The cache is
+    an LRU bounded by _PAPER_TEXT_CACHE_ENTRIES and _PAPER_TEXT_CACHE_BYTES;
+    deleting a session also drops its papers' entries (see
+    forget_session_files).
+    
+    Args:
+        file_path: Path to the paper file
+        ext: Lowercased file extension of the paper
+        
+    Returns:
+        Dictionary with status, full text and truncated prompt text
+    """
+    text = _extract_paper_text(file_path)
+    if not text:
+        return {
+            "status": "error",
+            "error_message": f"Could not extract text from {file_path}"
+        }
+    
+    prompt_text = text
+    if len(text) > _MAX_PAPER_CHARS:
+        prompt_text = text[:_MAX_PAPER_CHARS] + "\n\n[... content truncated for analysis ...]"
+    
+    return {
+        "status": "success",
+        "text": text,
+        "prompt_text": prompt_text
+    }
+
+
+def read_paper_content(file_path: str) -> str:
+    """Read paper file and extract text content."""
+    result = extract_paper_text(file_path, Path(file_path).suffix.lower())
+    return result.get("text", "")
+
+
+def read_prompt_file(file_path: Optional[str], with_header: bool = True) -> str:
+    """
+    Read an attached file's text for the prompt, limited to 5000 characters.
+    
+    Args:
+        file_path: Path to the file (None or a missing file gives "")
+        with_header: Prefix the text with a "--- name ---" separator line
+        
+    Returns:
+        The (headed) file text, or "" if it can't be read
+    """
+    if not file_path or not os.path.exists(file_path):
+        return ""
+    try:
+        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
+            # read(n) stops after n characters, so a huge log is not read whole
+            content = f.read(5000)  # Limit each file
+    except:
+        return ""
+    
+    if with_header:
+        return f"\n\n--- {os.path.basename(file_path)} ---\n{content}"
+    return content
+
+
+def join_prompt_files(contents: List[str], limit: int = _MAX_ATTACHMENT_CHARS) -> str:
+    """Join headed file texts in order, cut off once ``limit`` characters are reached."""
+    parts = []
+    total = 0
+    for content in contents:
+        room = limit - total
+        if len(content) > room:
+            parts.append(content[:room])
+            parts.append("\n\n[... attachments truncated for analysis ...]")
+            break
+        parts.append(content)
+        total += len(content)
+    return "".join(parts)
+
+
+def _json_loads(text: str) -> Any:
+    """Parse JSON with orjson when available, falling back to json."""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except ValueError:
+            pass
+    return json.loads(text)
+
+
+def _find_balanced_json(text: str) -> Optional[str]:
+    """Return the first brace-balanced {...} span, ignoring braces inside strings."""
+    start = text.find('{')
+    if start == -1:
+        return None
+    
+    depth = 0
+    for token in _JSON_TOKEN_RE.finditer(text, start):
+        brace = token.group()
+        if brace == '{':
+            depth += 1
+        elif brace == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:token.end()]
+    
+    return None
+
+
 def extract_json_from_text(text: str) -> Optional[Dict]:
     """Extract JSON object from text (handling markdown code blocks)."""
     if not text:
         return None
     try:
         # Try finding JSON block
-        json_match = re.search(r'```json\s*([\s\S]*?)\s*```', text)
+        json_match = _JSON_FENCE_RE.search(text)
         if json_match:
-            return json.loads(json_match.group(1))
+            return _json_loads(json_match.group(1))
         # Try finding first { and last }
         if '{' in text and '}' in text:
             start = text.find('{')
             end = text.rfind('}') + 1
-            return json.loads(text[start:end])
+            try:
+                return _json_loads(text[start:end])
+            except ValueError:
+                pass
+        # Fall back to the first balanced object, so prose with braces
+        # after the JSON does not break parsing
+        candidate = _find_balanced_json(text)
+        if candidate is not None:
+            return _json_loads(candidate)
     except:
         pass
     return None
 
 
-async def run_adk_pipeline(session_id: str, paper_path: str, 
-                           log_paths: List[str] = None,
-                           script_paths: List[str] = None,
-                           bib_path: str = None):
-    """
-    Run the REAL ADK agent pipeline with LLM.
-    This calls the actual multi-agent system.
-    """
-    try:
+def get_pipeline_runner():
+    """Return the runner and session service shared by every deep run, creating them on first use."""
+    global _pipeline_runner, _pipeline_session_service
+    if _pipeline_runner is None:
         from google.adk.sessions import InMemorySessionService
-        from google.adk.runners import Runner
-        from google.genai import types
-        from research_verifier.agent import root_agent
-        
-        analysis_store[session_id]["status"] = "running"
-        analysis_store[session_id]["progress"] = 5
-        analysis_store[session_id]["current_agent"] = "Initializing ADK..."
         
-        # Create session service
-        session_service = InMemorySessionService()
+        _pipeline_session_service = InMemorySessionService()
+        _pipeline_runner = create_pipeline_runner(_pipeline_session_service)
+    return _pipeline_runner, _pipeline_session_service
+
+
+def get_report_client():
+    """Return the Gemini client shared by every fast-mode report, creating it on first use."""
+    global _report_client
+    if _report_client is None:
+        from google import genai
         
-        # Create runner with the root agent
-        runner = Runner(
+        _report_client = genai.Client()
+    return _report_client
+
+
+def create_pipeline_runner(session_service):
+    """
+    Create a runner for the verification pipeline.
+    
+    With a google-adk that supports it, the runner is built from an App with
+    context caching, so the agents reuse the provider-side cache of the
+    shared instructions and paper content instead of re-sending them.
+    """
+    from google.adk.runners import Runner
+    from research_verifier.agent import root_agent
+    
+    try:
+        from google.adk.apps import App
+        from google.adk.agents.context_cache_config import ContextCacheConfig
+    except ImportError:
+        # Older google-adk has no context caching; run uncached
+        return Runner(
             agent=root_agent,
             app_name="research_verifier",
             session_service=session_service
         )
-        
-        # Read paper content
-        paper_content = read_paper_content(paper_path)
-        if not paper_content:
-            paper_content = f"[Could not extract text from {paper_path}]"
-        
-        # Limit paper content to avoid token limits
-        if len(paper_content) > 15000:
-            paper_content = paper_content[:15000] + "\n\n[... content truncated for analysis ...]"
-        
-        # Read additional files
-        log_content = ""
-        if log_paths:
-            for lp in log_paths:
-                if os.path.exists(lp):
-                    try:
-                        with open(lp, 'r', encoding='utf-8', errors='ignore') as f:
-                            log_content += f"\n\n--- {os.path.basename(lp)} ---\n"
-                            log_content += f.read()[:5000]  # Limit each log
-                    except:
-                        pass
-        
-        script_content = ""
-        if script_paths:
-            for sp in script_paths:
-                if os.path.exists(sp):
-                    try:
-                        with open(sp, 'r', encoding='utf-8', errors='ignore') as f:
-                            script_content += f"\n\n--- {os.path.basename(sp)} ---\n"
-                            script_content += f.read()[:5000]
-                    except:
-                        pass
-        
-        bib_content = ""
-        if bib_path and os.path.exists(bib_path):
-            try:
-                with open(bib_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    bib_content = f.read()[:5000]
-            except:
-                pass
-        
-        # Prepare comprehensive user message
-        user_message_text = f"""Please analyze this research paper and provide a comprehensive verification report.
+    
+    app = App(
+        name="research_verifier",
+        root_agent=root_agent,
+        context_cache_config=ContextCacheConfig(ttl_seconds=_CONTEXT_CACHE_TTL_SECONDS)
+    )
+    return Runner(app=app, session_service=session_service)
 
-## PAPER CONTENT:
-{paper_content}
 
-## EXPERIMENT LOGS:
-{log_content if log_content else 'No experiment logs provided.'}
+class TokenBucket:
+    """
+    Async token-bucket rate limiter.
+    
+    Holds up to ``capacity`` tokens, refilled at ``rate_per_minute``; each
+    ``acquire()`` takes one, sleeping until one is available.
+    """
+    
+    def __init__(self, rate_per_minute: float, capacity: int):
+        self.rate = rate_per_minute / 60
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = None
+    
+    def _refill(self) -> None:
+        now = asyncio.get_running_loop().time()
+        if self._updated is not None:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def wait_time(self) -> float:
+        """Seconds until a token is available (0 if one is now)."""
+        self._refill()
+        return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+    
+    async def acquire(self) -> None:
+        while True:
+            delay = self.wait_time()
+            if not delay:
+                self._tokens -= 1
+                return
+            await asyncio.sleep(delay)
 
-## EXPERIMENT SCRIPTS:
-{script_content if script_content else 'No experiment scripts provided.'}
 
-## BIBTEX REFERENCES:
-{bib_content if bib_content else 'No BibTeX file provided.'}
+@contextlib.asynccontextmanager
+async def pipeline_slot(session_id: str):
+    """
+    Hold one of the app-wide pipeline slots for the duration of the block.
+    
+    While every slot is taken the session shows status "queued" with its
+    ``queue_position`` (1 = next). Slots are also handed out no faster than
+    _PIPELINE_STARTS_PER_MINUTE; a session held back by that also shows
+    "queued", waiting for the rate limit. So concurrent uploads queue
+    instead of failing on the API's rate limit.
+    """
+    global _pipeline_semaphore, _pipeline_rate_limiter
+    if _pipeline_semaphore is None:
+        _pipeline_semaphore = asyncio.Semaphore(_PIPELINE_CONCURRENCY)
+        _pipeline_rate_limiter = TokenBucket(_PIPELINE_STARTS_PER_MINUTE, _PIPELINE_CONCURRENCY)
+    
+    if _pipeline_semaphore.locked():
+        _pipeline_queue.append(session_id)
+        position = len(_pipeline_queue)
+        update_session(
+            session_id,
+            status="queued",
+            queue_position=position,
+            current_agent=f"Queued (position {position})"
+        )
+    try:
+        await _pipeline_semaphore.acquire()
+    finally:
+        if session_id in _pipeline_queue:
+            _pipeline_queue.remove(session_id)
+            for position, queued_id in enumerate(_pipeline_queue, 1):
+                update_session(
+                    queued_id,
+                    queue_position=position,
+                    current_agent=f"Queued (position {position})"
+                )
+    
+    try:
+        if _pipeline_rate_limiter.wait_time():
+            update_session(
+                session_id,
+                status="queued",
+                queue_position=None,
+                current_agent="Waiting for rate limit..."
+            )
+        await _pipeline_rate_limiter.acquire()
+        update_session(session_id, status="running", queue_position=None)
+        yield
+    finally:
+        _pipeline_semaphore.release()
 
----
 
-Please run the full verification pipeline and provide your analysis in JSON format with these sections:
-1. Paper Analysis: claims, results, datasets, metrics extracted
-2. Reproducibility Analysis: seeds, hardware, missing items, score
-3. Experiment Evidence: log analysis, metric mappings
-4. Statistical Audit: weak claims, variance issues
-5. Related Work: citation coverage, missing baselines
-6. Reviewer Simulation: likely comments and concerns
-7. Final Verdict: critical issues, action items, submission readiness
+def _replace_section(results: Dict, data: Dict, section: str) -> None:
+    """Use an agent's output as its whole report section."""
+    results[section] = data
+    data["status"] = "success"
 
-Be specific and reference actual content from the paper in your analysis."""
 
-        # Create ADK Content object
-        user_message = types.Content(
-            role="user",
-            parts=[types.Part.from_text(text=user_message_text)]
-        )
-        
-        # Create session
-        session = await session_service.create_session(
-            app_name="research_verifier",
-            user_id=session_id
-        )
-        
-        analysis_store[session_id]["progress"] = 10
-        
-        # Track agent progress
-        completed_agents = []
-        agent_progress_map = {
-            "PaperParserAgent": 20,
-            "ReproducibilityAgent": 35,
-            "ExperimentEvidenceAgent": 50,
-            "StatisticalAuditorAgent": 65,
-            "RelatedWorkBaselineAgent": 75,
-            "ReviewerSimulationAgent": 85,
-            "VerdictAgent": 95
-        }
-        
-        final_response_text = ""
-        
-        # Run the agent pipeline
-        aggregated_results = {
-            "paper_analysis": {"status": "pending", "claims": [], "datasets": [], "metrics": []},
-            "reproducibility": {"status": "pending", "missing_items": [], "reproducibility_score": 0},
-            "experiment_evidence": {"status": "pending", "issues": [], "experiment_map": {}},
-            "statistical_audit": {"status": "pending", "weak_claims": [], "variance_issues": []},
-            "related_work": {"status": "pending", "citations_found": 0, "issues": [], "missing_baselines": []},
-            "reviewer_simulation": {"status": "pending", "comments": [], "strengths": [], "weaknesses": []},
-            "verdict": {
-                "status": "pending", 
-                "critical_issues": [], 
-                "submission_readiness": "Analysis Incomplete", 
-                "overall_verdict": "Processing..."
-            }
-        }
+def _update_section(results: Dict, data: Dict, section: str) -> None:
+    """Merge an agent's output into its report section's defaults."""
+    results[section].update(data)
+    results[section]["status"] = "success"
 
+
+def _set_reviewer_simulation(results: Dict, data: Dict) -> None:
+    """Store the reviewer output, accepting the prompt's ``reviewer_comments`` key."""
+    if "reviewer_comments" in data:
+        data["comments"] = data.pop("reviewer_comments")
+    _replace_section(results, data, "reviewer_simulation")
+
+
+def _set_verdict(results: Dict, data: Dict) -> None:
+    """Store the verdict, copying its reproducibility score when it has one."""
+    _replace_section(results, data, "verdict")
+    if "reproducibility_score" in data:
+        results["reproducibility"]["reproducibility_score"] = data["reproducibility_score"]
+
+
+# Deep-mode agent -> function folding its JSON output into the results
+_AGENT_HANDLERS: Dict[str, Callable[[Dict, Dict], None]] = {
+    "PaperParserAgent": functools.partial(_replace_section, section="paper_analysis"),
+    "ReproducibilityAgent": functools.partial(_update_section, section="reproducibility"),
+    "ExperimentEvidenceAgent": functools.partial(_replace_section, section="experiment_evidence"),
+    "StatisticalAuditorAgent": functools.partial(_replace_section, section="statistical_audit"),
+    "RelatedWorkBaselineAgent": functools.partial(_replace_section, section="related_work"),
+    "ReviewerSimulationAgent": _set_reviewer_simulation,
+    "VerdictAgent": _set_verdict
+}
+
+
+async def run_agent_pipeline(session_id: str, user_message_text: str) -> Dict:
+    """
+    Run the REAL ADK agent pipeline with LLM.
+    This calls the actual multi-agent system.
+    """
+    from google.genai import types
+    
+    # Shared runner; each run gets its own ADK session
+    runner, session_service = get_pipeline_runner()
+    
+    # Create ADK Content object
+    user_message = types.Content(
+        role="user",
+        parts=[types.Part.from_text(text=user_message_text)]
+    )
+    
+    # Create session
+    session = await session_service.create_session(
+        app_name="research_verifier",
+        user_id=session_id
+    )
+    
+    update_session(session_id, progress=10)
+    
+    # Track agent progress
+    completed_agents = set()
+    # Last text parsed per agent; a repeat would only reapply the same result
+    last_text_by_agent: Dict[str, str] = {}
+    
+    # Run the agent pipeline
+    aggregated_results = copy.deepcopy(_EMPTY_RESULTS)
+
+    try:
         async for event in runner.run_async(
             user_id=session_id,
             session_id=session.id,
@@ -277,10 +808,16 @@ Be specific and reference actual content from the paper in your analysis."""
                 
                 # Update progress
                 if agent_name not in completed_agents:
-                    completed_agents.append(agent_name)
-                    analysis_store[session_id]["current_agent"] = agent_name
-                    if agent_name in agent_progress_map:
-                        analysis_store[session_id]["progress"] = agent_progress_map[agent_name]
+                    completed_agents.add(agent_name)
+                    # Parallel stages start agents out of order; never move backwards
+                    update_session(
+                        session_id,
+                        current_agent=agent_name,
+                        progress=max(
+                            analysis_store.get(session_id, {}).get("progress", 0),
+                            _AGENT_PROGRESS.get(agent_name, 0)
+                        )
+                    )
 
                 # Capture Content
                 content_text = ""
@@ -292,52 +829,133 @@ Be specific and reference actual content from the paper in your analysis."""
                     else:
                         content_text = str(event.content)
 
-                if content_text:
+                if content_text and last_text_by_agent.get(agent_name) != content_text:
+                    last_text_by_agent[agent_name] = content_text
+                    
                     # Update aggregated results based on agent
                     json_data = extract_json_from_text(content_text)
                     if json_data:
                         print(f"Captured output from {agent_name}")
                         
-                        if agent_name == "PaperParserAgent":
-                            aggregated_results["paper_analysis"] = json_data
-                            aggregated_results["paper_analysis"]["status"] = "success"
-                        
-                        elif agent_name == "ReproducibilityAgent":
-                            aggregated_results["reproducibility"].update(json_data)
-                            aggregated_results["reproducibility"]["status"] = "success"
-                            
-                        elif agent_name == "ExperimentEvidenceAgent":
-                            aggregated_results["experiment_evidence"] = json_data
-                            aggregated_results["experiment_evidence"]["status"] = "success"
-                            
-                        elif agent_name == "StatisticalAuditorAgent":
-                            aggregated_results["statistical_audit"] = json_data
-                            aggregated_results["statistical_audit"]["status"] = "success"
-                            
-                        elif agent_name == "RelatedWorkBaselineAgent":
-                            aggregated_results["related_work"] = json_data
-                            aggregated_results["related_work"]["status"] = "success"
-                            
-                        elif agent_name == "ReviewerSimulationAgent":
-                            # Handle different key names from prompt
-                            if "reviewer_comments" in json_data:
-                                json_data["comments"] = json_data.pop("reviewer_comments")
-                            aggregated_results["reviewer_simulation"] = json_data
-                            aggregated_results["reviewer_simulation"]["status"] = "success"
-                            
-                        elif agent_name == "VerdictAgent":
-                            aggregated_results["verdict"] = json_data
-                            aggregated_results["verdict"]["status"] = "success"
-                            # Also duplicate some scores if missing
-                            if "reproducibility_score" in json_data:
-                                aggregated_results["reproducibility"]["reproducibility_score"] = json_data["reproducibility_score"]
+                        handler = _AGENT_HANDLERS.get(agent_name)
+                        if handler:
+                            handler(aggregated_results, json_data)
+    finally:
+        # The session service is shared, so drop this run's session
+        await session_service.delete_session(
+            app_name="research_verifier",
+            user_id=session_id,
+            session_id=session.id
+        )
+    
+    return aggregated_results
+
+
+async def run_full_report(session_id: str, user_message_text: str) -> Dict:
+    """
+    Produce every report section with one structured LLM call.
+    
+    The model fills the FullReport schema directly, so the paper is
+    prefilled once instead of once per agent and no JSON has to be
+    scraped out of free text.
+    """
+    from google.genai import types
+    from research_verifier.models import FullReport
+    
+    update_session(session_id, current_agent="FullReport", progress=10)
+    
+    response = await get_report_client().aio.models.generate_content(
+        model=_REPORT_MODEL,
+        contents=user_message_text,
+        config=types.GenerateContentConfig(
+            system_instruction=_FULL_REPORT_INSTRUCTION,
+            response_mime_type="application/json",
+            response_schema=FullReport
+        )
+    )
+    
+    report = response.parsed
+    if not isinstance(report, FullReport):
+        report = FullReport.model_validate_json(response.text or "{}")
+    
+    aggregated_results = report.model_dump()
+    for section in aggregated_results.values():
+        section["status"] = "success"
+    
+    return aggregated_results
+
+
+async def run_adk_pipeline(session_id: str, paper_path: str, 
+                           log_paths: List[str] = None,
+                           script_paths: List[str] = None,
+                           bib_path: str = None,
+                           mode: str = "fast"):
+    """
+    Run the verification for one uploaded paper and store the results.
+    
+    ``fast`` mode asks for the whole report in one structured LLM call;
+    ``deep`` mode runs the seven-agent ADK pipeline.
+    """
+    try:
+        update_session(
+            session_id,
+            status="running",
+            progress=5,
+            current_agent="Initializing ADK..."
+        )
+        
+        # Parse the paper and read the attachments in worker threads, so
+        # they overlap and status polls are served meanwhile; uncached
+        # PDF/LaTeX parsing itself runs in the shared worker process pool
+        log_paths = log_paths or []
+        script_paths = script_paths or []
+        paper, bib_content, *file_contents = await asyncio.gather(
+            asyncio.to_thread(extract_paper_text, paper_path, Path(paper_path).suffix.lower()),
+            asyncio.to_thread(read_prompt_file, bib_path, False),
+            *(asyncio.to_thread(read_prompt_file, p) for p in log_paths + script_paths)
+        )
+        
+        # Paper content is limited to avoid token limits
+        if paper["status"] == "success":
+            paper_content = paper["prompt_text"]
+        else:
+            paper_content = f"[Could not extract text from {paper_path}]"
+        
+        log_content = join_prompt_files(file_contents[:len(log_paths)])
+        script_content = join_prompt_files(file_contents[len(log_paths):])
+        
+        # Prepare comprehensive user message
+        user_message_text = f"""{_PIPELINE_INSTRUCTIONS}
+
+---
+
+## PAPER CONTENT:
+{paper_content}
+
+## EXPERIMENT LOGS:
+{log_content if log_content else 'No experiment logs provided.'}
+
+## EXPERIMENT SCRIPTS:
+{script_content if script_content else 'No experiment scripts provided.'}
+
+## BIBTEX REFERENCES:
+{bib_content if bib_content else 'No BibTeX file provided.'}"""
 
+        async with pipeline_slot(session_id):
+            if mode == "deep":
+                aggregated_results = await run_agent_pipeline(session_id, user_message_text)
+            else:
+                aggregated_results = await run_full_report(session_id, user_message_text)
+        
         # Store results
-        analysis_store[session_id]["progress"] = 100
-        analysis_store[session_id]["status"] = "completed"
-        analysis_store[session_id]["current_agent"] = None
-        analysis_store[session_id]["results"] = aggregated_results
-        analysis_store[session_id]["completed_at"] = datetime.now().isoformat()
+        update_session(
+            session_id,
+            progress=100,
+            status="completed",
+            current_agent=None,
+            results=aggregated_results,
+            completed_at=datetime.now().isoformat()
+        )
         
     except Exception as e:
         error_msg = str(e)
@@ -345,11 +963,13 @@ Be specific and reference actual content from the paper in your analysis."""
         
         # Check if it's a rate limit error
         if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-            analysis_store[session_id]["status"] = "error"
-            analysis_store[session_id]["error"] = "API rate limit exceeded. Please wait a few minutes and try again."
+            update_session(
+                session_id,
+                status="error",
+                error="API rate limit exceeded. Please wait a few minutes and try again."
+            )
         else:
-            analysis_store[session_id]["status"] = "error"
-            analysis_store[session_id]["error"] = error_msg
+            update_session(session_id, status="error", error=error_msg)
 
 
 def parse_agent_response(response_text: str, paper_path: str) -> Dict:
@@ -374,20 +994,21 @@ async def upload_files(
     paper: UploadFile = File(...),
     logs: List[UploadFile] = File(default=None),
     scripts: List[UploadFile] = File(default=None),
-    bibtex: UploadFile = File(default=None)
+    bibtex: UploadFile = File(default=None),
+    mode: str = Form(default="fast")
 ):
     """Upload files and start analysis with REAL ADK agents."""
-    session_id = str(uuid.uuid4())
+    if mode not in ANALYSIS_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"mode must be one of {ANALYSIS_MODES}, got {mode!r}"
+        )
+    
+    # Bound memory on long-running servers before adding a session
+    await make_room_for_sessions(1)
     
     # Initialize session
-    analysis_store[session_id] = {
-        "status": "uploading",
-        "progress": 0,
-        "current_agent": None,
-        "results": None,
-        "error": None,
-        "created_at": datetime.now().isoformat()
-    }
+    session_id = new_session(mode)
     
     try:
         # Save paper file
@@ -414,14 +1035,32 @@ async def upload_files(
         if bibtex and bibtex.filename:
             bib_path = await save_upload_file(bibtex, session_id)
         
+        # Identical files already analyzed in the same mode: reuse that session
+        existing_id = await claim_fingerprint(
+            session_id,
+            mode,
+            [("paper", paper_path)]
+            + [("log", p) for p in log_paths]
+            + [("script", p) for p in script_paths]
+            + ([("bibtex", bib_path)] if bib_path else [])
+        )
+        if existing_id:
+            forget_session(session_id)
+            await asyncio.to_thread(remove_session_files, session_id)
+            cached = analysis_store[existing_id]["status"] == "completed"
+            return {"session_id": existing_id, "status": "cached" if cached else "processing"}
+        
         # Update status
-        analysis_store[session_id]["status"] = "processing"
-        analysis_store[session_id]["files"] = {
-            "paper": paper.filename,
-            "logs": [l.filename for l in logs] if logs else [],
-            "scripts": [s.filename for s in scripts] if scripts else [],
-            "bibtex": bibtex.filename if bibtex else None
-        }
+        update_session(
+            session_id,
+            status="processing",
+            files={
+                "paper": paper.filename,
+                "logs": [l.filename for l in logs] if logs else [],
+                "scripts": [s.filename for s in scripts] if scripts else [],
+                "bibtex": bibtex.filename if bibtex else None
+            }
+        )
         
         # Start REAL ADK pipeline in background
         background_tasks.add_task(
@@ -430,24 +1069,182 @@ async def upload_files(
             paper_path,
             log_paths,
             script_paths,
-            bib_path
+            bib_path,
+            mode
         )
         
         return {"session_id": session_id, "status": "processing"}
         
     except Exception as e:
-        analysis_store[session_id]["status"] = "error"
-        analysis_store[session_id]["error"] = str(e)
+        update_session(session_id, status="error", error=str(e))
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def run_batch(sessions: List[tuple], mode: str) -> None:
+    """Run a batch's pending papers, at most _BATCH_CONCURRENCY at a time."""
+    semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+    
+    async def run_one(session_id: str, paper_path: str):
+        async with semaphore:
+            await run_adk_pipeline(session_id, paper_path, mode=mode)
+    
+    await asyncio.gather(*(run_one(*item) for item in sessions))
+
+
+@app.post("/api/upload_batch")
+async def upload_batch(
+    background_tasks: BackgroundTasks,
+    papers: List[UploadFile] = File(...),
+    mode: str = Form(default="fast")
+):
+    """
+    Upload several papers and analyze them concurrently, one session each.
+    
+    Papers already analyzed, or being analyzed, in the same mode reuse that session.
+    Poll /api/batch_status/{batch_id} or each paper's /api/status.
+    """
+    if mode not in ANALYSIS_MODES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"mode must be one of {ANALYSIS_MODES}, got {mode!r}"
+        )
+    
+    await make_room_for_sessions(sum(1 for paper in papers if paper.filename))
+    for batch_id in [b for b, batch in batch_store.items()
+                     if not any(sid in analysis_store for sid in batch["session_ids"])]:
+        del batch_store[batch_id]
+    
+    session_ids = []
+    pending = []
+    for paper in papers:
+        if not paper.filename:
+            continue
+        session_id = new_session(mode)
+        try:
+            paper_path = await save_upload_file(paper, session_id)
+            existing_id = await claim_fingerprint(session_id, mode, [("paper", paper_path)])
+        except Exception as e:
+            update_session(session_id, status="error", error=str(e))
+            session_ids.append(session_id)
+            continue
+        
+        if existing_id:
+            forget_session(session_id)
+            await asyncio.to_thread(remove_session_files, session_id)
+            session_ids.append(existing_id)
+            continue
+        
+        update_session(
+            session_id,
+            status="processing",
+            files={"paper": paper.filename, "logs": [], "scripts": [], "bibtex": None}
+        )
+        session_ids.append(session_id)
+        pending.append((session_id, paper_path))
+    
+    batch_id = str(uuid.uuid4())
+    batch_store[batch_id] = {
+        "session_ids": session_ids,
+        "mode": mode,
+        "created_at": datetime.now().isoformat()
+    }
+    
+    background_tasks.add_task(run_batch, pending, mode)
+    
+    return {"batch_id": batch_id, "session_ids": session_ids, "status": "processing"}
+
+
+@app.get("/api/batch_status/{batch_id}")
+async def get_batch_status(batch_id: str):
+    """Get the status of every session in a batch."""
+    if batch_id not in batch_store:
+        raise HTTPException(status_code=404, detail="Batch not found")
+    
+    sessions = {}
+    counts: Dict[str, int] = {}
+    for session_id in batch_store[batch_id]["session_ids"]:
+        session = analysis_store.get(session_id)
+        status = session["status"] if session else "expired"
+        sessions[session_id] = {
+            "status": status,
+            "progress": session["progress"] if session else None,
+            "paper": (session.get("files") or {}).get("paper") if session else None
+        }
+        counts[status] = counts.get(status, 0) + 1
+    
+    return APIResponse({
+        "batch_id": batch_id,
+        "status": "processing" if counts.keys() - _FINISHED_STATUSES - {"expired"} else "completed",
+        "counts": counts,
+        "sessions": sessions
+    })
+
+
 @app.get("/api/status/{session_id}")
 async def get_analysis_status(session_id: str):
     """Get the status of an analysis session."""
     if session_id not in analysis_store:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    return analysis_store[session_id]
+    # Session records hold only JSON types, so they are rendered directly
+    # instead of being walked by jsonable_encoder on every poll
+    return APIResponse(analysis_store[session_id])
+
+
+async def session_events(session_id: str):
+    """
+    Yield a session's state as SSE messages until it finishes or is deleted.
+    
+    A session deleted or pruned meanwhile ends the stream with an
+    ``expired`` event, so clients can tell that apart from a dropped
+    connection and stop instead of reconnecting.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    _session_listeners.setdefault(session_id, []).append(queue)
+    try:
+        session = analysis_store.get(session_id)
+        while session is not None:
+            yield b"data: " + dump_json(session) + b"\n\n"
+            if session.get("status") in _FINISHED_STATUSES:
+                return
+            
+            while True:
+                try:
+                    session = await asyncio.wait_for(queue.get(), _SSE_KEEPALIVE_SECONDS)
+                    break
+                except asyncio.TimeoutError:
+                    if session_id not in analysis_store:
+                        session = None
+                        break
+                    yield b": keepalive\n\n"
+        
+        yield b"event: expired\ndata: {}\n\n"
+    finally:
+        listeners = _session_listeners.get(session_id)
+        if listeners is not None:
+            listeners.remove(queue)
+            if not listeners:
+                del _session_listeners[session_id]
+
+
+@app.get("/api/events/{session_id}")
+async def stream_analysis_status(session_id: str):
+    """
+    Stream an analysis session's status as Server-Sent Events.
+    
+    Each message carries the same record as /api/status, first the current
+    one and then one per update, and the stream ends once the session is
+    completed or failed. A deleted or pruned session ends it with an
+    ``expired`` event.
+    """
+    if session_id not in analysis_store:
+        raise HTTPException(status_code=404, detail="Session not found")
+    
+    return StreamingResponse(
+        session_events(session_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.get("/api/results/{session_id}")
@@ -461,7 +1258,7 @@ async def get_analysis_results(session_id: str):
     if session["status"] != "completed":
         raise HTTPException(status_code=400, detail="Analysis not completed yet")
     
-    return session["results"]
+    return APIResponse(session["results"])
 
 
 @app.get("/api/raw/{session_id}")
@@ -476,14 +1273,10 @@ async def get_raw_response(session_id: str):
 @app.delete("/api/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete an analysis session and its files."""
-    if session_id in analysis_store:
-        del analysis_store[session_id]
+    forget_session(session_id)
     
-    # Clean up uploaded files
-    session_dir = upload_dir / session_id
-    if session_dir.exists():
-        import shutil
-        shutil.rmtree(session_dir)
+    # Clean up uploaded files and their cached text off the event loop
+    await asyncio.to_thread(forget_session_files, session_id)
     
     return {"status": "deleted"}
 
@@ -497,4 +1290,7 @@ if __name__ == "__main__":
     print("This uses the REAL ADK agents with LLM for analysis.")
     print("Make sure GOOGLE_API_KEY is set in your .env file.")
     print("=" * 60 + "\n")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # loop/http "auto" pick uvloop and httptools when they are installed
+    # (see requirements.txt). Keep a single worker: sessions and batches
+    # live in this process's memory.
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="auto", http="auto")